@@ -1,6 +1,6 @@
 import streamlit as st
 import assets.styles as styles
-from views import tab_encrypt, tab_decrypt, tab_file
+from src.steps import DEFAULT_WINDOW_ROWS
 
 # --- Konfigurasi Halaman ---
 st.set_page_config(
@@ -19,9 +19,12 @@ default_states = {
     "anim_phase": "write",
     "cipher_result": None,
     "decrypt_result": None,
+    "crack_report": None,
     "file_viz_data": None,
     "file_step_index": 0,
     "file_anim_phase": "write",
+    "file_page_meta": None,
+    "viz_window": DEFAULT_WINDOW_ROWS,
 }
 
 for key, default_val in default_states.items():
@@ -77,6 +80,14 @@ def main():
             else:
                 padding_char = ""
 
+        st.number_input(
+            "Jendela Visualisasi (baris)",
+            min_value=0,
+            step=5,
+            key="viz_window",
+            help="Jumlah baris grid yang dirender di sekitar sel aktif. 0 = tampilkan semua.",
+        )
+
         st.info(
             """
             **Our Team**
@@ -85,11 +96,18 @@ def main():
             """
         )
 
+    # View di-import saat mode dipilih, bukan saat startup
     if mode == "Enkripsi Teks":
+        from views import tab_encrypt
+
         tab_encrypt.render(key_input, padding_char, key_mode)
     elif mode == "Dekripsi Teks":
+        from views import tab_decrypt
+
         tab_decrypt.render(key_input, key_mode)
     elif mode == "Proses File":
+        from views import tab_file
+
         tab_file.render(key_input, key_mode)
 
 
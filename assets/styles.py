@@ -67,6 +67,7 @@ def get_global_css():
     }} 
     
     .empty-cell {{ background-color: {BG_LIGHT} !important; border: 1px dashed #ccc !important; color: transparent !important; }}
+    .window-cell {{ background-color: transparent !important; border: 1px dashed #bdc3c7 !important; color: #7f8c8d !important; font-style: italic; font-size: 0.9em !important; height: 30px !important; }}
     .padding-cell {{ color: #95a5a6 !important; font-style: italic; background-color: #eef2f3 !important; }}
     
     /* Animation Styles */
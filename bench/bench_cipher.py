@@ -0,0 +1,200 @@
+"""
+Benchmark engine cipher untuk matriks ukuran payload x panjang kunci x mode kunci.
+
+Mengukur throughput (MB/s) dan puncak memori (tracemalloc), lalu menulis JSON
+untuk dibandingkan antar rilis.
+
+Contoh:
+    python bench/bench_cipher.py --json hasil.json
+    python bench/bench_cipher.py --sizes 1K 1M 1G --key-lengths 2 10 1000
+    python bench/bench_cipher.py --compare baseline.json --threshold 0.2
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.cipher import ColumnarTransposition, np
+
+DEFAULT_SIZES = ["1K", "64K", "1M", "16M"]
+DEFAULT_KEY_LENGTHS = [2, 8, 64, 1000]
+DEFAULT_MODES = ["text", "numeric"]
+OPERATIONS = [
+    "encrypt_text",
+    "decrypt_text",
+    "encrypt_bytes",
+    "decrypt_bytes",
+    "get_byte_steps",
+]
+UNITS = {"K": 1024, "M": 1024**2, "G": 1024**3}
+
+
+def parse_size(value: str) -> int:
+    value = value.strip().upper()
+    if value[-1] in UNITS:
+        return int(float(value[:-1]) * UNITS[value[-1]])
+    return int(value)
+
+
+def make_key(length: int, mode: str, rng: random.Random) -> str:
+    if mode == "numeric":
+        numbers = list(range(1, length + 1))
+        rng.shuffle(numbers)
+        return " ".join(str(n) for n in numbers)
+    return "".join(rng.choice("ABCDEFGHIJKLMNOPQRSTUVWXYZ") for _ in range(length))
+
+
+def make_call(op: str, payload, key: str, mode: str):
+    """Membuat fungsi tanpa argumen untuk satu operasi."""
+    if op == "encrypt_text":
+        return lambda: ColumnarTransposition.encrypt_text(
+            payload, key, "X", mode, with_steps=False
+        )
+    if op == "decrypt_text":
+        return lambda: ColumnarTransposition.decrypt_text(
+            payload, key, mode, with_steps=False
+        )
+    if op == "encrypt_bytes":
+        return lambda: ColumnarTransposition.encrypt_bytes(payload, key, mode)
+    if op == "decrypt_bytes":
+        return lambda: ColumnarTransposition.decrypt_bytes(payload, key, mode)
+
+    def steps():
+        # Langkah bersifat lazy: ukur juga biaya menelusuri semuanya
+        viz = ColumnarTransposition.get_byte_steps(payload, key, "encrypt", mode)
+        for _ in viz["fill_steps"]:
+            pass
+        for _ in viz["read_steps"]:
+            pass
+
+    return steps
+
+
+def measure(fn, repeat: int) -> tuple[float, int]:
+    """Waktu terbaik dari ``repeat`` run dan puncak memori satu run."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak
+
+
+def run(args) -> list[dict]:
+    rng = random.Random(args.seed)
+    results = []
+    for size_label in args.sizes:
+        size = parse_size(size_label)
+        data = os.urandom(size)
+        text = data.hex()[:size].upper()
+
+        for key_length in args.key_lengths:
+            for mode in args.modes:
+                key = make_key(key_length, mode, rng)
+                for op in args.ops:
+                    if op.endswith("_text") and size > args.max_text_size:
+                        continue
+                    if op == "get_byte_steps" and size > args.max_steps_size:
+                        continue
+                    payload = text if op.endswith("_text") else data
+                    seconds, peak = measure(
+                        make_call(op, payload, key, mode), args.repeat
+                    )
+                    row = {
+                        "op": op,
+                        "size": size,
+                        "key_length": key_length,
+                        "key_mode": mode,
+                        "seconds": seconds,
+                        "mb_per_s": size / (1024 * 1024) / seconds if seconds else 0.0,
+                        "peak_bytes": peak,
+                    }
+                    results.append(row)
+                    print(
+                        f"{op:<15} {size_label:>6} k={key_length:<5} {mode:<8} "
+                        f"{row['mb_per_s']:>10.1f} MB/s  peak {peak / 1024**2:>9.2f} MB"
+                    )
+    return results
+
+
+def compare(results: list[dict], baseline_path: str, threshold: float) -> int:
+    """Melaporkan operasi yang lebih lambat dari baseline melebihi ``threshold``."""
+    with open(baseline_path) as f:
+        baseline = json.load(f)["results"]
+
+    def key_of(row):
+        return row["op"], row["size"], row["key_length"], row["key_mode"]
+
+    previous = {key_of(row): row for row in baseline}
+    regressions = 0
+    for row in results:
+        old = previous.get(key_of(row))
+        if not old or not old["mb_per_s"]:
+            continue
+        change = row["mb_per_s"] / old["mb_per_s"] - 1
+        if change < -threshold:
+            regressions += 1
+            print(f"REGRESI {key_of(row)}: {change:+.1%} throughput")
+    print(f"{regressions} regresi terhadap {baseline_path}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark engine cipher.")
+    parser.add_argument("--sizes", nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument(
+        "--key-lengths", nargs="+", type=int, default=DEFAULT_KEY_LENGTHS
+    )
+    parser.add_argument("--modes", nargs="+", default=DEFAULT_MODES)
+    parser.add_argument("--ops", nargs="+", choices=OPERATIONS, default=OPERATIONS)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--max-text-size",
+        type=parse_size,
+        default=parse_size("256M"),
+        help="Lewati operasi teks di atas ukuran ini",
+    )
+    parser.add_argument(
+        "--max-steps-size",
+        type=parse_size,
+        default=parse_size("1M"),
+        help="Lewati get_byte_steps di atas ukuran ini",
+    )
+    parser.add_argument("--json", help="Simpan hasil ke file JSON")
+    parser.add_argument("--compare", help="File JSON baseline untuk deteksi regresi")
+    parser.add_argument("--threshold", type=float, default=0.2)
+    args = parser.parse_args(argv)
+
+    results = run(args)
+    report = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "numpy": np.__version__ if np is not None else None,
+        },
+        "results": results,
+    }
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+    if args.compare:
+        return 1 if compare(results, args.compare, args.threshold) else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,58 @@
+"""
+Benchmark skala paralel transposisi satu buffer besar (kelompok kolom per thread).
+
+Contoh:
+    python bench/bench_parallel.py --size-mb 256 --max-workers 8
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.cipher import ColumnarTransposition
+
+
+def time_call(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size-mb", type=int, default=128)
+    parser.add_argument("--key", default="KRIPTOGRAFITRANSPOSISI")
+    parser.add_argument("--engine", default="auto")
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    data = os.urandom(args.size_mb * 1024 * 1024)
+    plan = ColumnarTransposition.get_plan(args.key, "text", len(data))
+    out = bytearray(plan.total_len)
+    megabytes = len(data) / (1024 * 1024)
+
+    print(f"{'workers':>8} {'encrypt MB/s':>14} {'decrypt MB/s':>14} {'speedup':>8}")
+    baseline = None
+    for workers in range(1, args.max_workers + 1):
+        enc = time_call(
+            lambda: plan.encrypt_into(data, out, args.engine, workers), args.repeat
+        )
+        dec = time_call(
+            lambda: plan.decrypt_into(data, out, args.engine, workers), args.repeat
+        )
+        baseline = baseline or enc
+        print(
+            f"{workers:>8} {megabytes / enc:>14.1f} {megabytes / dec:>14.1f} "
+            f"{baseline / enc:>7.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
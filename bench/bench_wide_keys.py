@@ -0,0 +1,108 @@
+"""
+Benchmark kunci lebar (10^3 - 10^6 kolom): kompilasi kunci, plan, dan enkripsi.
+
+Kunci diuji dalam tiga bentuk: string numerik "4 1 3 2 ...", string teks,
+dan array permutasi (numpy/bytes). Waktu dan puncak memori (tracemalloc)
+dicetak per baris.
+
+Contoh:
+    python bench/bench_wide_keys.py
+    python bench/bench_wide_keys.py --columns 1000 100000 1000000 --rows 4
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.cipher import ColumnarTransposition, np
+from src import keys
+from src.keys import compile_key, compile_permutation
+
+
+def measure(fn, setup=None):
+    """
+    (detik, puncak memori MB, hasil). Waktu diukur tanpa tracemalloc karena
+    tracemalloc memperlambat alokasi objek Python; memori diukur terpisah.
+    ``setup`` dipanggil sebelum tiap run (di luar pengukuran).
+    """
+    if setup:
+        setup()
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+    if setup:
+        setup()
+    tracemalloc.start()
+    fn()
+    peak = tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+    tracemalloc.stop()
+    return elapsed, peak, result
+
+
+def clear_array_keys():
+    with keys._ARRAY_KEYS_LOCK:
+        keys._ARRAY_KEYS.clear()
+
+
+def key_forms(num_cols: int, rng: random.Random) -> dict:
+    perm = list(range(1, num_cols + 1))
+    rng.shuffle(perm)
+    letters = "".join(rng.choice("ABCDEFGHIJKLMNOPQRSTUVWXYZ") for _ in range(num_cols))
+    forms = {
+        "numeric str": (" ".join(map(str, perm)), "numeric"),
+        "text str": (letters, "text"),
+        "bytes (text)": (os.urandom(num_cols), "text"),
+    }
+    if np is not None:
+        forms["ndarray (numeric)"] = (np.array(perm, dtype=np.uint32), "numeric")
+    return forms
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--columns", type=int, nargs="+", default=[1000, 100_000, 1_000_000]
+    )
+    parser.add_argument("--rows", type=int, default=8, help="Baris data per kolom")
+    parser.add_argument("--engine", default="auto")
+    args = parser.parse_args(argv)
+
+    rng = random.Random(0)
+    print(
+        f"{'kolom':>9} {'bentuk kunci':<18} {'compile ms':>11} {'MB':>7} "
+        f"{'plan ms':>8} {'encrypt MB/s':>13} {'MB':>7}"
+    )
+    for num_cols in args.columns:
+        data = os.urandom(num_cols * args.rows)
+        megabytes = len(data) / (1024 * 1024)
+        for label, (key, mode) in key_forms(num_cols, rng).items():
+            setup = None
+            if isinstance(key, str):
+                # Tanpa cache LRU agar yang diukur kompilasi sebenarnya
+                compile_fn = lambda: keys._compile.__wrapped__(key, mode)  # noqa: E731
+            else:
+                compile_fn = lambda: compile_permutation(key, mode)  # noqa: E731
+                # Kunci array di-cache per isi: kosongkan agar run kedua
+                # (pengukuran memori) tidak sekadar cache hit
+                setup = clear_array_keys
+            compile_s, compile_mb, _ = measure(compile_fn, setup)
+
+            compiled = compile_key(key, mode)
+            plan_s, _, plan = measure(
+                lambda: ColumnarTransposition.get_plan(compiled, mode, len(data))
+            )
+            enc_s, enc_mb, _ = measure(lambda: plan.encrypt(data, args.engine))
+            print(
+                f"{num_cols:>9} {label:<18} {compile_s * 1000:>11.1f} "
+                f"{compile_mb:>7.1f} {plan_s * 1000:>8.2f} "
+                f"{megabytes / enc_s:>13.1f} {enc_mb:>7.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Benchmark deteksi lebar kunci (``cracker.rank_widths``) pada ciphertext besar.
+
+Plaintext dibangun dari korpus bawaan, dienkripsi dengan kunci numerik acak,
+lalu dicetak waktu peringkat seluruh lebar dan posisi lebar yang benar.
+
+Contoh:
+    python bench/bench_width_detection.py
+    python bench/bench_width_detection.py --size-kb 1024 --widths 7 23 60 --max-width 100
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src import cracker
+from src.cipher import ColumnarTransposition
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size-kb", type=int, default=1024)
+    parser.add_argument("--widths", type=int, nargs="+", default=[7, 23, 60])
+    parser.add_argument(
+        "--max-width",
+        type=int,
+        default=None,
+        help="Default: DETECT_MAX_WIDTH, dinaikkan hingga lebar terbesar di --widths",
+    )
+    parser.add_argument("--language", default="id", choices=cracker.LANGUAGES)
+    args = parser.parse_args(argv)
+    if args.max_width is None:
+        # Lebar di atas max_width tidak pernah diperingkat (tampil sebagai "-")
+        args.max_width = max(cracker.DETECT_MAX_WIDTH, *args.widths)
+
+    with open(
+        os.path.join(cracker.CORPUS_DIR, f"{args.language}.txt"), encoding="utf-8"
+    ) as f:
+        corpus = " ".join(f.read().split())
+    size = args.size_kb * 1024
+    plaintext = (corpus * (size // len(corpus) + 1))[:size]
+
+    rng = random.Random(0)
+    print(f"{'lebar':>6} {'KB':>6} {'ms':>8} {'peringkat':>10}  5 teratas")
+    for num_cols in args.widths:
+        perm = list(range(1, num_cols + 1))
+        rng.shuffle(perm)
+        ciphertext = ColumnarTransposition.encrypt_text(
+            plaintext, " ".join(map(str, perm)), key_mode="numeric", with_steps=False
+        )["ciphertext"]
+
+        start = time.perf_counter()
+        ranking = cracker.rank_widths(ciphertext, max_width=args.max_width)
+        elapsed = time.perf_counter() - start
+
+        widths = [w.num_cols for w in ranking]
+        position = widths.index(num_cols) + 1 if num_cols in widths else "-"
+        print(
+            f"{num_cols:>6} {len(ciphertext) // 1024:>6} {elapsed * 1000:>8.1f} "
+            f"{position:>10}  {widths[:5]}"
+        )
+
+
+if __name__ == "__main__":
+    main()
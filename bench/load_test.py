@@ -0,0 +1,138 @@
+"""
+Load test layanan HTTP (src/server.py) di localhost.
+
+Contoh:
+    python bench/load_test.py --requests 500 --concurrency 32 --size-kb 256
+    python bench/load_test.py --url http://127.0.0.1:8080 --endpoint /encrypt/text
+
+Tanpa ``--url`` server dijalankan di proses yang sama pada port bebas.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from urllib.parse import urlsplit
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.server import CipherServer
+
+
+async def send_request(host: str, port: int, path: str, body: bytes, content_type):
+    """Satu request HTTP/1.1; mengembalikan (status, panjang body respons)."""
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        head = (
+            f"POST {path} HTTP/1.1\r\nHost: {host}\r\n"
+            f"Content-Type: {content_type}\r\nContent-Length: {len(body)}\r\n"
+            "Connection: close\r\n\r\n"
+        )
+        writer.write(head.encode("latin-1") + body)
+        await writer.drain()
+        status_line = await reader.readline()
+        status = int(status_line.split()[1])
+        response = await reader.read()
+        return status, len(response)
+    finally:
+        writer.close()
+
+
+def percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+async def run_load(args, host: str, port: int) -> dict:
+    if args.endpoint.endswith("/text"):
+        text = "KRIPTOGRAFI " * (args.size_kb * 1024 // 12)
+        body = json.dumps({"text": text, "key": args.key}).encode("utf-8")
+        path, content_type = args.endpoint, "application/json"
+    else:
+        body = os.urandom(args.size_kb * 1024)
+        path = f"{args.endpoint}?key={args.key}"
+        content_type = "application/octet-stream"
+
+    latencies, statuses = [], {}
+    queue = iter(range(args.requests))
+
+    async def client():
+        for _ in queue:
+            start = time.perf_counter()
+            try:
+                status, _ = await send_request(host, port, path, body, content_type)
+            except (ConnectionError, ValueError, IndexError):
+                status = "reset"
+            statuses[status] = statuses.get(status, 0) + 1
+            if status == 200:
+                latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(args.concurrency)))
+    elapsed = time.perf_counter() - start
+
+    ok = statuses.get(200, 0)
+    return {
+        "requests": args.requests,
+        "concurrency": args.concurrency,
+        "elapsed_s": elapsed,
+        "req_per_s": args.requests / elapsed if elapsed > 0 else 0.0,
+        "mb_per_s": ok * len(body) / (1024 * 1024) / elapsed if elapsed > 0 else 0.0,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p95_ms": percentile(latencies, 95) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+        "statuses": {str(k): v for k, v in sorted(statuses.items(), key=str)},
+    }
+
+
+async def main_async(args) -> dict:
+    if args.url:
+        url = urlsplit(args.url)
+        return await run_load(args, url.hostname, url.port or 80)
+
+    server = CipherServer("127.0.0.1", 0, args.workers, args.max_pending)
+    await server.start()
+    try:
+        return await run_load(args, "127.0.0.1", server.port)
+    finally:
+        await server.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--url", default=None, help="Server yang sudah berjalan")
+    parser.add_argument(
+        "--endpoint",
+        default="/encrypt/bytes",
+        choices=["/encrypt/bytes", "/decrypt/bytes", "/encrypt/text", "/decrypt/text"],
+    )
+    parser.add_argument("--key", default="KRIPTOGRAFI")
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--size-kb", type=int, default=64)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--max-pending", type=int, default=None)
+    parser.add_argument("--json", action="store_true", help="Cetak hasil sebagai JSON")
+    args = parser.parse_args(argv)
+
+    result = asyncio.run(main_async(args))
+    if args.json:
+        print(json.dumps(result, indent=2))
+        return
+    print(
+        f"{result['requests']} request, konkurensi {result['concurrency']} | "
+        f"{result['req_per_s']:.1f} req/s | {result['mb_per_s']:.1f} MB/s"
+    )
+    print(
+        f"latensi p50 {result['p50_ms']:.1f} ms | p95 {result['p95_ms']:.1f} ms | "
+        f"p99 {result['p99_ms']:.1f} ms"
+    )
+    print("status: " + ", ".join(f"{k}={v}" for k, v in result["statuses"].items()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""
+Cache hasil komputasi cipher, dibagikan antar rerun dan antar sesi Streamlit.
+
+Kunci cache adalah digest isi input (bukan input itu sendiri) ditambah
+kunci/mode/padding, sehingga input besar tidak ikut disimpan dua kali.
+Entri dibuang secara LRU berdasarkan total ukuran byte, bukan jumlah entri.
+"""
+
+import hashlib
+import sys
+import threading
+from collections import OrderedDict
+
+from src.cipher import ColumnarTransposition
+from src.results import ByteStepsResult, TextDecryptResult, TextEncryptResult
+
+# Batas total ukuran hasil yang disimpan
+DEFAULT_CACHE_BYTES = 256 * 1024 * 1024
+
+
+def digest(*parts) -> str:
+    """Digest BLAKE2b dari potongan bytes/str/memoryview (diberi prefix panjang)."""
+    h = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        if isinstance(part, str):
+            part = part.encode("utf-8", "surrogatepass")
+        view = memoryview(part).cast("B")
+        h.update(len(view).to_bytes(8, "little"))
+        h.update(view)
+    return h.hexdigest()
+
+
+def estimate_size(value) -> int:
+    """Perkiraan ukuran memori hasil (bytes/str/dict/objek hasil cipher)."""
+    if isinstance(value, (bytes, bytearray, str)):
+        return sys.getsizeof(value)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(estimate_size(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + 8 * len(value)
+    # Objek hasil (src.results) menghitung ukurannya sendiri lewat __sizeof__
+    return sys.getsizeof(value)
+
+
+class ResultCache:
+    """LRU thread-safe dengan batas total ukuran (byte)."""
+
+    def __init__(self, max_bytes: int = DEFAULT_CACHE_BYTES, max_entry_bytes=None):
+        self.max_bytes = max_bytes
+        # Entri yang lebih besar dari ini tidak disimpan
+        self.max_entry_bytes = max_entry_bytes or max_bytes // 4
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key) -> bool:
+        return key in self._entries
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, value, size: int = None) -> bool:
+        """Menyimpan hasil; mengembalikan False jika terlalu besar untuk cache."""
+        size = estimate_size(value) if size is None else size
+        if size > self.max_entry_bytes:
+            return False
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.nbytes -= old[1]
+            self._entries[key] = (value, size)
+            self.nbytes += size
+            while self.nbytes > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self.nbytes -= evicted
+        return True
+
+    def get_or_compute(self, key, compute, size=None):
+        """Hasil dari cache, atau ``compute()`` yang lalu disimpan."""
+        sentinel = object()
+        value = self.get(key, sentinel)
+        if value is sentinel:
+            value = compute()
+            if value is not None:
+                self.put(key, value, size(value) if size else None)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+
+
+# Cache bersama untuk seluruh sesi dalam satu proses
+RESULTS = ResultCache()
+
+
+def cached_encrypt_text(
+    plaintext: str, key: str, padding_char: str = "X", key_mode: str = "text"
+) -> TextEncryptResult:
+    cache_key = ("encrypt_text", digest(plaintext), key, padding_char, key_mode)
+    return RESULTS.get_or_compute(
+        cache_key,
+        lambda: ColumnarTransposition.encrypt_text(
+            plaintext, key, padding_char, key_mode
+        ),
+    )
+
+
+def cached_decrypt_text(
+    ciphertext: str, key: str, key_mode: str = "text"
+) -> TextDecryptResult:
+    cache_key = ("decrypt_text", digest(ciphertext), key, key_mode)
+    return RESULTS.get_or_compute(
+        cache_key,
+        lambda: ColumnarTransposition.decrypt_text(ciphertext, key, key_mode),
+    )
+
+
+def cached_byte_steps(
+    data_sample: bytes, key: str, mode: str = "encrypt", key_mode: str = "text"
+) -> ByteStepsResult:
+    cache_key = ("byte_steps", digest(data_sample), key, mode, key_mode)
+    return RESULTS.get_or_compute(
+        cache_key,
+        lambda: ColumnarTransposition.get_byte_steps(data_sample, key, mode, key_mode),
+    )
@@ -1,254 +1,1257 @@
 import math
-import re
+import mmap
+import os
+import struct
+import threading
+from array import array
+from collections import OrderedDict
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
+from src.keys import compile_key, parse_numeric_key
+from src.results import ByteStepsResult, TextDecryptResult, TextEncryptResult
 
-class ColumnarTransposition:
+# Jumlah rencana permutasi yang disimpan di cache LRU
+PLAN_CACHE_SIZE = 256
+
+# Ukuran buffer default untuk mode streaming (byte)
+DEFAULT_BUFFER_SIZE = 8 * 1024 * 1024
+
+# Batas total ukuran tabel permutasi gabungan (multi-round) yang disimpan;
+# tabel yang lebih besar dari seperempatnya tidak di-cache
+CHAIN_CACHE_BYTES = 16 * 1024 * 1024
+
+# Tabel gabungan hanya dipakai mulai MIN_FUSED_ROUNDS round dan untuk data
+# hingga FUSED_MAX_LENGTH byte. Di luar itu round berurutan (slicing per
+# kolom) lebih cepat daripada satu gather acak: pada 1 MiB gather ~4 ms,
+# sedangkan tiap round berurutan ~0,5 ms.
+MIN_FUSED_ROUNDS = 3
+FUSED_MAX_LENGTH = 64 * 1024
+
+# Ukuran blok default untuk mode blok (byte)
+DEFAULT_BLOCK_SIZE = 1024 * 1024
+
+# Trailer mode blok: ukuran blok, panjang plaintext asli, magic
+BLOCK_TRAILER = struct.Struct("<QQ4s")
+BLOCK_MAGIC = b"CTBK"
+
+# Engine transposisi byte: "python" (slicing) atau "numpy" (fancy-index)
+ENGINES = ("python", "numpy")
+
+
+@lru_cache(maxsize=None)
+def _numpy():
     """
-    Implementasi Columnar Transposition Cipher.
+    Import numpy saat pertama kali dibutuhkan (bukan saat modul di-import),
+    agar mode teks dan startup aplikasi tidak menanggung biaya import numpy.
+    Mengembalikan None jika numpy tidak terpasang.
     """
+    try:
+        import numpy
+    except ImportError:  # pragma: no cover - numpy opsional
+        return None
+    return numpy
 
-    @staticmethod
-    def _parse_numeric_key(key_str: str) -> list[int]:
+
+def __getattr__(name):
+    # ``src.cipher.np`` tetap tersedia, di-import saat pertama diakses
+    if name == "np":
+        return _numpy()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def resolve_engine(engine: str = "auto") -> str:
+    """Memetakan nama engine ("auto" memilih numpy bila terpasang)."""
+    if engine == "auto":
+        return "numpy" if _numpy() is not None else "python"
+    if engine not in ENGINES:
+        raise ValueError(f"Engine tidak dikenal: {engine!r}. Pilihan: {ENGINES}")
+    if engine == "numpy" and _numpy() is None:
+        raise ImportError("Engine 'numpy' membutuhkan paket numpy.")
+    return engine
+
+
+class ColumnSegments(Sequence):
+    """
+    Tabel segmen kolom ``(col_idx, start)``: segmen ke-k adalah kolom
+    ``order[k]`` pada ``output[k * num_rows:(k + 1) * num_rows]``. Dihitung
+    dari ``order`` saat diakses, tanpa tuple per kolom.
+    """
+
+    __slots__ = ("order", "num_rows", "first_rank")
+
+    def __init__(self, order, num_rows: int, first_rank: int = 0):
+        self.order = order
+        self.num_rows = num_rows
+        self.first_rank = first_rank
+
+    def __len__(self) -> int:
+        return len(self.order)
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            start, stop, step = idx.indices(len(self.order))
+            if step != 1:
+                return [self[i] for i in range(start, stop, step)]
+            return ColumnSegments(
+                self.order[start:stop], self.num_rows, self.first_rank + start
+            )
+        if idx < 0:
+            idx += len(self.order)
+        return self.order[idx], (self.first_rank + idx) * self.num_rows
+
+    def __iter__(self):
+        first = self.first_rank * self.num_rows
+        stop = first + len(self.order) * self.num_rows
+        return zip(self.order, range(first, stop, self.num_rows or 1))
+
+
+def _index_dtype(size: int):
+    """uint32 untuk indeks < 2^32 - 1 (4 byte per elemen), selain itu int64."""
+    np = _numpy()
+    return np.uint32 if size < 2**32 - 1 else np.int64
+
+
+class TranspositionPlan:
+    """
+    Rencana permutasi yang sudah dikompilasi dari (key, key_mode, length).
+
+    Menyimpan urutan kolom dan tabel segmen kolom: kolom ``col`` pada grid
+    sumber (``data[col::num_cols]``) menempati ``output[start:start + num_rows]``
+    pada hasil enkripsi. Tabel indeks per-byte tersedia lewat ``gather_table``.
+    """
+
+    __slots__ = (
+        "order",
+        "num_cols",
+        "num_rows",
+        "length",
+        "total_len",
+        "display_key",
+        "segments",
+    )
+
+    def __init__(self, order, num_cols: int, length: int, display_key):
+        # Kunci lebar tetap berupa array (tanpa objek Python per kolom)
+        self.order = order if isinstance(order, (tuple, array)) else tuple(order)
+        self.num_cols = num_cols
+        self.length = length
+        self.num_rows = math.ceil(length / num_cols)
+        self.total_len = self.num_rows * num_cols
+        self.display_key = (
+            display_key if isinstance(display_key, Sequence) else tuple(display_key)
+        )
+        self.segments = ColumnSegments(self.order, self.num_rows)
+
+    def source_index(self, dest_idx: int) -> int:
+        """Posisi byte sumber (grid baris-per-baris) untuk posisi output enkripsi."""
+        rank, row_idx = divmod(dest_idx, self.num_rows)
+        return row_idx * self.num_cols + self.order[rank]
+
+    def gather_table(self) -> list[int]:
         """
-        Helper untuk memparsing string kunci.
-        Mendukung format spasi "4 1 3 2" maupun format sambung "4132".
+        Tabel indeks datar: ``ciphertext[i] = padded[table[i]]``.
+        Untuk dekripsi tabel yang sama dipakai sebagai tabel scatter.
         """
-        # Cek apakah ada pemisah (spasi atau koma)
-        if re.search(r"[\s,]", key_str):
-            numbers = re.findall(r"\d+", key_str)
-        else:
-            numbers = list(re.findall(r"\d", key_str))
+        num_rows, num_cols = self.num_rows, self.num_cols
+        return [
+            row_idx * num_cols + col_idx
+            for col_idx in self.order
+            for row_idx in range(num_rows)
+        ]
+
+    def index_array(self, direction: str = "encrypt", dtype=None):
+        """
+        Tabel indeks numpy: ``output[i] = input[table[i]]``. Nilai >= ``length``
+        menandakan byte padding (nol). Dipakai untuk menggabungkan beberapa round.
+        ``dtype`` default ``_index_dtype(total_len)`` (uint32 bila cukup).
+        """
+        np = _numpy()
+        dtype = dtype or _index_dtype(self.total_len)
+        num_rows, num_cols = self.num_rows, self.num_cols
+        order = np.asarray(self.order, dtype=dtype)
+        if direction == "encrypt":
+            rows = np.arange(num_rows, dtype=dtype) * dtype(num_cols)
+            return np.add.outer(order, rows).reshape(-1)
+        rank = np.empty(num_cols, dtype=dtype)
+        rank[order] = np.arange(num_cols, dtype=dtype)
+        rows = np.arange(num_rows, dtype=dtype)
+        return np.add.outer(rows, rank * dtype(num_rows)).reshape(-1)[: self.length]
+
+    def _order_array(self):
+        # array('I') dibaca langsung lewat buffer protocol (tanpa list)
+        return _numpy().asarray(self.order, dtype=_numpy().intp)
+
+    def _check_length(self, data) -> None:
+        if len(data) != self.length:
+            raise ValueError(
+                f"Panjang data ({len(data)}) tidak sesuai plan ({self.length})."
+            )
 
-        return [int(n) for n in numbers]
+    def _padded_array(self, data):
+        np = _numpy()
+        buf = np.zeros(self.total_len, dtype=np.uint8)
+        buf[: self.length] = np.frombuffer(data, dtype=np.uint8)
+        return buf
+
+    def encrypt(self, data: bytes, engine: str = "python", workers: int = 1) -> bytes:
+        """Menerapkan plan pada buffer plaintext (padding byte nol)."""
+        self._check_length(data)
+        if workers > 1:
+            result = bytearray(self.total_len)
+            self.encrypt_into(data, result, engine, workers)
+            return bytes(result)
+        if resolve_engine(engine) == "numpy":
+            # Grid baris x kolom; kolom diambil sesuai urutan kunci sekaligus
+            grid = self._padded_array(data).reshape(self.num_rows, self.num_cols)
+            return grid.T[self._order_array()].tobytes()
+
+        padded = bytes(data) + b"\x00" * (self.total_len - self.length)
+        return b"".join([padded[col_idx :: self.num_cols] for col_idx in self.order])
+
+    def decrypt(self, data: bytes, engine: str = "python", workers: int = 1) -> bytes:
+        """Kebalikan dari ``encrypt``; panjang hasil sama dengan panjang input."""
+        self._check_length(data)
+        if workers > 1:
+            result = bytearray(self.length)
+            self.decrypt_into(data, result, engine, workers)
+            return bytes(result)
+        if resolve_engine(engine) == "numpy":
+            # Baris ke-k dari ciphertext adalah kolom order[k] pada grid
+            columns = self._padded_array(data).reshape(self.num_cols, self.num_rows)
+            grid = _numpy().empty((self.num_rows, self.num_cols), dtype=columns.dtype)
+            grid[:, self._order_array()] = columns.T
+            return grid.reshape(-1)[: self.length].tobytes()
+
+        padded = bytes(data) + b"\x00" * (self.total_len - self.length)
+        result = bytearray(self.total_len)
+        for col_idx, start in self.segments:
+            result[col_idx :: self.num_cols] = padded[start : start + self.num_rows]
+        del result[self.length :]
+        return bytes(result)
+
+    def encrypt_str(self, padded_text: str) -> str:
+        """
+        Enkripsi teks dengan slicing per kolom (``padded[col::num_cols]``).
+        Sel kosong (padding dimatikan) otomatis terlewati.
+        """
+        padded_text = padded_text[: self.total_len]
+        return "".join(
+            [padded_text[col_idx :: self.num_cols] for col_idx in self.order]
+        )
+
+    def decrypt_str(self, ciphertext: str) -> str:
+        """
+        Dekripsi teks: segmen ke-k ciphertext mengisi kolom ``order[k]``,
+        lalu grid dibaca baris-per-baris. Sel tanpa karakter dilewati.
+        """
+        if len(ciphertext) == self.total_len and ciphertext.isascii():
+            # Jalur cepat: transposisi ASCII di level bytes
+            return self.decrypt(ciphertext.encode("ascii")).decode("ascii")
+
+        cells = [""] * self.total_len
+        for col_idx, start in self.segments:
+            segment = ciphertext[start : start + self.num_rows]
+            cells[col_idx :: self.num_cols] = list(segment) + [""] * (
+                self.num_rows - len(segment)
+            )
+        return "".join(cells)
 
     @staticmethod
-    def get_key_metadata(key: str, mode: str = "text") -> dict:
+    def _buffer_views(src, dst, engine: str):
+        if resolve_engine(engine) == "numpy":
+            np = _numpy()
+            return np.frombuffer(src, dtype=np.uint8), np.frombuffer(
+                dst, dtype=np.uint8
+            )
+        return memoryview(src), memoryview(dst)
+
+    def _run_segments(self, copy_fn, src_view, dst_view, workers: int) -> None:
         """
-        Menentukan urutan kolom (order) dan jumlah kolom berdasarkan mode.
+        Menjalankan ``copy_fn`` per kelompok kolom. Setiap kelompok menulis ke
+        bagian output yang terpisah, sehingga aman dijalankan paralel di thread
+        (numpy melepas GIL saat menyalin).
+        """
+        segments = self.segments
+        if workers <= 1 or len(segments) < 2:
+            copy_fn(src_view, dst_view, segments)
+            return
+        workers = min(workers, len(segments))
+        size = math.ceil(len(segments) / workers)
+        groups = [segments[i : i + size] for i in range(0, len(segments), size)]
+        with ThreadPoolExecutor(max_workers=len(groups)) as pool:
+            for future in [
+                pool.submit(copy_fn, src_view, dst_view, group) for group in groups
+            ]:
+                future.result()
+
+    def _encrypt_segments(self, src_view, dst_view, segments) -> None:
+        num_cols, num_rows = self.num_cols, self.num_rows
+        full_rows, tail = divmod(self.length, num_cols)
+        body = full_rows * num_cols
+        for col_idx, start in segments:
+            dst_view[start : start + full_rows] = src_view[col_idx:body:num_cols]
+            if full_rows < num_rows:
+                dst_view[start + full_rows] = (
+                    src_view[body + col_idx] if col_idx < tail else 0
+                )
+
+    def _decrypt_segments(self, src_view, dst_view, segments) -> None:
+        num_cols, num_rows, length = self.num_cols, self.num_rows, self.length
+        for col_idx, start in segments:
+            # Baris yang valid di tujuan vs byte ciphertext yang tersedia
+            dst_rows = max(0, -(-(length - col_idx) // num_cols))
+            count = min(dst_rows, max(0, min(num_rows, length - start)))
+            stop = col_idx + count * num_cols
+            dst_view[col_idx:stop:num_cols] = src_view[start : start + count]
+            if count < dst_rows:
+                missing = dst_rows - count
+                zeros = bytes(missing) if isinstance(dst_view, memoryview) else 0
+                dst_view[stop : stop + missing * num_cols : num_cols] = zeros
+
+    def encrypt_into(self, src, dst, engine: str = "python", workers: int = 1) -> int:
+        """
+        Enkripsi zero-copy: membaca dari buffer ``src`` (bytes, mmap, memoryview)
+        dan menulis ke buffer writable ``dst`` sepanjang ``total_len``.
+        ``workers`` > 1 membagi kolom ke beberapa thread.
         """
-        key_map = []
+        self._check_length(src)
+        if len(dst) < self.total_len:
+            raise ValueError("Buffer tujuan lebih kecil dari total_len plan.")
+        src_view, dst_view = self._buffer_views(src, dst, engine)
+        self._run_segments(self._encrypt_segments, src_view, dst_view, workers)
+        return self.total_len
 
-        if mode == "numeric":
-            # Mode Numeric (Permutation): Key "4 1 3 2"
+    def decrypt_into(self, src, dst, engine: str = "python", workers: int = 1) -> int:
+        """Dekripsi zero-copy dari ``src`` ke ``dst`` (keduanya sepanjang ``length``)."""
+        self._check_length(src)
+        if len(dst) < self.length:
+            raise ValueError("Buffer tujuan lebih kecil dari panjang data.")
+        src_view, dst_view = self._buffer_views(src, dst, engine)
+        self._run_segments(self._decrypt_segments, src_view, dst_view, workers)
+        return self.length
 
-            numeric_keys = ColumnarTransposition._parse_numeric_key(key)
-            if not numeric_keys:
-                return {"order": [], "num_cols": 0, "clean_key_display": []}
+    def read_range(self, source, start: int, length: int, direction="encrypt") -> bytes:
+        """
+        Menghitung ``output[start:start + length]`` hasil enkripsi/dekripsi
+        langsung dari ``source`` (bytes, memoryview, mmap) lewat aritmetika
+        permutasi, tanpa membentuk seluruh output. Biaya O(num_cols + length).
+        """
+        num_rows, num_cols, data_len = self.num_rows, self.num_cols, self.length
+        out_len = self.total_len if direction == "encrypt" else data_len
+        start = max(0, start)
+        end = min(out_len, start + max(0, length))
+        if start >= end:
+            return b""
+        out = bytearray(end - start)
 
-            num_cols = len(numeric_keys)
-            expected_set = set(range(1, num_cols + 1))
-            if set(numeric_keys) != expected_set:
-                return {"order": [], "num_cols": 0, "clean_key_display": []}
+        if direction == "encrypt":
+            # Output terdiri dari segmen kolom; segmen ke-k = kolom order[k]
+            for rank in range(start // num_rows, (end - 1) // num_rows + 1):
+                col_idx = self.order[rank]
+                seg_start = rank * num_rows
+                row_start = max(start, seg_start) - seg_start
+                row_stop = min(end, seg_start + num_rows) - seg_start
+                # Baris setelah ``available`` adalah padding nol
+                available = max(0, -(-(data_len - col_idx) // num_cols))
+                row_stop = min(row_stop, available)
+                if row_stop <= row_start:
+                    continue
+                src_start = row_start * num_cols + col_idx
+                src_stop = (row_stop - 1) * num_cols + col_idx + 1
+                chunk = source[src_start:src_stop:num_cols]
+                pos = seg_start + row_start - start
+                out[pos : pos + len(chunk)] = chunk
+            return bytes(out)
 
-            order = [k - 1 for k in numeric_keys]
-            clean_key_display = [str(i) for i in range(1, num_cols + 1)]
+        # Dekripsi: tiap kolom pada rentang baris halaman dibaca sebagai satu
+        # potongan berurutan dari segmen ciphertext-nya
+        first_row, last_row = start // num_cols, (end - 1) // num_cols
+        for col_idx, seg_start in self.segments:
+            row_start = (
+                first_row if first_row * num_cols + col_idx >= start else first_row + 1
+            )
+            row_stop = last_row + 1 if last_row * num_cols + col_idx < end else last_row
+            src_start = seg_start + row_start
+            src_stop = min(seg_start + row_stop, data_len)
+            if src_stop <= src_start:
+                continue
+            chunk = source[src_start:src_stop]
+            pos = row_start * num_cols + col_idx - start
+            out[pos : pos + len(chunk) * num_cols : num_cols] = chunk
+        return bytes(out)
 
-            return {
-                "order": order,
-                "num_cols": num_cols,
-                "clean_key_display": clean_key_display,
-            }
+    def _rows_per_stripe(self, buffer_size: int) -> int:
+        return max(1, min(self.num_rows, buffer_size // self.num_cols))
 
-        else:
-            num_cols = len(key)
-            for i, char in enumerate(key):
-                key_map.append(
-                    {"orig_index": i, "sort_val": char.upper(), "display": char}
-                )
-            key_map.sort(key=lambda x: x["sort_val"])
+    def encrypt_stream(self, src, dst, buffer_size: int = DEFAULT_BUFFER_SIZE) -> int:
+        """
+        Enkripsi streaming: ``src`` dibaca berurutan per stripe baris,
+        segmen tiap kolom ditulis langsung ke posisinya di ``dst``.
+        ``dst`` harus seekable (file atau mmap). Mengembalikan jumlah byte output.
+        """
+        base = dst.tell()
+        stripe_rows = self._rows_per_stripe(buffer_size)
+        remaining = self.length
 
-            return {
-                "order": [item["orig_index"] for item in key_map],
-                "num_cols": num_cols,
-                "clean_key_display": list(key),
-            }
+        for row_start in range(0, self.num_rows, stripe_rows):
+            rows = min(stripe_rows, self.num_rows - row_start)
+            want = rows * self.num_cols
+            stripe = _read_exact(src, min(want, remaining)) if remaining > 0 else b""
+            remaining -= len(stripe)
+            if len(stripe) < want:
+                stripe += b"\x00" * (want - len(stripe))
 
-    @staticmethod
-    def encrypt_text(
-        plaintext: str, key: str, padding_char: str = "X", key_mode: str = "text"
-    ) -> dict:
-        metadata = ColumnarTransposition.get_key_metadata(key, key_mode)
-        order = metadata["order"]
-        num_cols = metadata["num_cols"]
+            for col_idx, start in self.segments:
+                dst.seek(base + start + row_start)
+                dst.write(stripe[col_idx :: self.num_cols])
+
+        dst.seek(base + self.total_len)
+        return self.total_len
+
+    def decrypt_stream(self, src, dst, buffer_size: int = DEFAULT_BUFFER_SIZE) -> int:
+        """
+        Dekripsi streaming: ``src`` harus seekable, segmen kolom dibaca per
+        stripe baris lalu plaintext ditulis berurutan ke ``dst``.
+        """
+        base = src.tell()
+        stripe_rows = self._rows_per_stripe(buffer_size)
+        written = 0
+
+        for row_start in range(0, self.num_rows, stripe_rows):
+            rows = min(stripe_rows, self.num_rows - row_start)
+            stripe = bytearray(rows * self.num_cols)
+
+            for col_idx, start in self.segments:
+                offset = start + row_start
+                if offset >= self.length:
+                    continue
+                src.seek(base + offset)
+                segment = src.read(min(rows, self.length - offset))
+                stop = col_idx + len(segment) * self.num_cols
+                stripe[col_idx : stop : self.num_cols] = segment
+
+            chunk = stripe[: self.length - written]
+            dst.write(chunk)
+            written += len(chunk)
+            if written >= self.length:
+                break
+
+        src.seek(base + self.length)
+        return written
+
+
+class FusedPermutation:
+    """
+    Gabungan beberapa round transposisi menjadi satu tabel gather, sehingga
+    N round cukup satu kali lintasan atas buffer. Tabel dibangun langsung
+    dalam uint32 (tanpa temporer int64) bila ukurannya memungkinkan.
+    """
+
+    __slots__ = ("table", "length", "output_len")
+
+    def __init__(self, rounds, direction: str = "encrypt"):
+        """``rounds``: daftar (plan, panjang_output) sesuai urutan eksekusi."""
+        np = _numpy()
+        self.length = rounds[0][0].length
+        largest = max(max(plan.total_len, output_len) for plan, output_len in rounds)
+        dtype = _index_dtype(max(largest, self.length) + 1)
+        # Indeks ``length`` menunjuk ke byte nol tambahan (padding)
+        table = np.arange(self.length, dtype=dtype)
+        for plan, output_len in rounds:
+            gather = plan.index_array(direction, dtype)[:output_len]
+            np.minimum(gather, len(table), out=gather)
+            sentinel = np.empty(len(table) + 1, dtype=dtype)
+            sentinel[:-1] = table
+            sentinel[-1] = self.length
+            table = sentinel[gather]
+
+        self.table = table
+        self.table.flags.writeable = False
+        self.output_len = len(self.table)
+
+    @property
+    def nbytes(self) -> int:
+        return self.table.nbytes
+
+    def apply(self, data) -> bytes:
+        if len(data) != self.length:
+            raise ValueError(
+                f"Panjang data ({len(data)}) tidak sesuai tabel ({self.length})."
+            )
+        np = _numpy()
+        source = np.empty(self.length + 1, dtype=np.uint8)
+        source[: self.length] = np.frombuffer(data, dtype=np.uint8)
+        source[self.length] = 0
+        return source[self.table].tobytes()
+
+
+class _ChainCache:
+    """LRU tabel gabungan yang dibatasi total byte tabel, bukan jumlah entri."""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
 
-        if num_cols == 0:
+    def get(self, key):
+        with self._lock:
+            fused = self._entries.get(key)
+            if fused is not None:
+                self._entries.move_to_end(key)
+            return fused
+
+    def put(self, key, fused) -> None:
+        # Tabel besar tidak disimpan agar cache tidak menahan gigabyte memori
+        if fused.nbytes > self.max_bytes // 4:
+            return
+        with self._lock:
+            if key in self._entries:
+                return
+            self._entries[key] = fused
+            self.nbytes += fused.nbytes
+            while self.nbytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.nbytes -= evicted.nbytes
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_CHAIN_CACHE = _ChainCache(CHAIN_CACHE_BYTES)
+
+
+def _chain_rounds(keys: tuple, mode: str, length: int, direction: str, original=None):
+    """
+    Menyusun (plan, panjang_output) per round. Untuk dekripsi dengan
+    ``original`` diketahui, panjang antar-round diturunkan dari rantai enkripsi
+    sehingga padding tiap round dibuang dengan tepat.
+    """
+    if direction == "encrypt":
+        rounds = []
+        for key in keys:
+            plan = _compile_plan(key, mode, length)
+            if plan is None:
+                return None
+            rounds.append((plan, plan.total_len))
+            length = plan.total_len
+        return rounds
+
+    if original is None:
+        lengths = [length] * (len(keys) + 1)
+    else:
+        # Panjang input tiap round enkripsi: original -> total_1 -> total_2 ...
+        forward = _chain_rounds(tuple(reversed(keys)), mode, original, "encrypt")
+        if forward is None:
             return None
+        lengths = [original] + [plan.total_len for plan, _ in forward]
+        lengths.reverse()
+        if lengths[0] != length:
+            raise ValueError("Panjang ciphertext tidak sesuai panjang asli.")
 
-        num_rows = math.ceil(len(plaintext) / num_cols)
+    rounds = []
+    for idx, key in enumerate(keys):
+        plan = _compile_plan(key, mode, lengths[idx])
+        if plan is None:
+            return None
+        rounds.append((plan, lengths[idx + 1]))
+    return rounds
+
+
+def _hashable_keys(keys, mode: str) -> tuple:
+    """Kunci array dikompilasi dulu agar bisa menjadi kunci cache."""
+    return tuple(
+        key if isinstance(key, str) else compile_key(key, mode) for key in keys
+    )
 
-        padded_text = plaintext
-        total_chars = num_rows * num_cols
-        missing = total_chars - len(plaintext)
-        if missing > 0:
-            padded_text += padding_char * missing
 
-        grid = [["" for _ in range(num_cols)] for _ in range(num_rows)]
-        fill_steps = []
+def _compile_chain(keys: tuple, mode: str, length: int, direction: str, original=None):
+    cache_key = (keys, mode, length, direction, original)
+    fused = _CHAIN_CACHE.get(cache_key)
+    if fused is not None:
+        return fused
+    rounds = _chain_rounds(keys, mode, length, direction, original)
+    if rounds is None:
+        return None
+    fused = FusedPermutation(rounds, direction)
+    _CHAIN_CACHE.put(cache_key, fused)
+    return fused
 
-        char_idx = 0
-        for r in range(num_rows):
-            for c in range(num_cols):
-                if char_idx < len(padded_text):
-                    char = padded_text[char_idx]
-                    grid[r][c] = char
-                    fill_steps.append((r, c, char))
-                    char_idx += 1
 
-        ciphertext = ""
-        read_steps = []
+def _use_fused(engine: str, num_rounds: int, length: int) -> bool:
+    return (
+        engine == "numpy"
+        and num_rounds >= MIN_FUSED_ROUNDS
+        and length <= FUSED_MAX_LENGTH
+    )
 
-        for col_idx in order:
-            for row_idx in range(num_rows):
-                char = grid[row_idx][col_idx]
-                ciphertext += char
-                read_steps.append((row_idx, col_idx, char))
 
+def _run_rounds(data, rounds, direction: str, engine: str) -> bytes:
+    """Round dijalankan berurutan lewat ``encrypt_into``/``decrypt_into``."""
+    current = memoryview(data)
+    for plan, output_len in rounds:
+        if direction == "encrypt":
+            out = bytearray(plan.total_len)
+            plan.encrypt_into(current, out, engine)
+        else:
+            out = bytearray(plan.length)
+            plan.decrypt_into(current[: plan.length], out, engine)
+        current = memoryview(out)[:output_len]
+    return bytes(current)
+
+
+def _remaining_length(stream) -> int:
+    """Sisa byte dari posisi saat ini hingga akhir stream."""
+    pos = stream.tell()
+    end = stream.seek(0, 2)
+    stream.seek(pos)
+    return end - pos
+
+
+def _read_exact(stream, size: int) -> bytes:
+    """
+    Membaca ``size`` byte dari ``stream``; ``read`` boleh mengembalikan lebih
+    sedikit (pipe, socket), jadi diulang hingga cukup atau EOF (read kosong).
+    """
+    chunk = stream.read(size)
+    if len(chunk) >= size or not chunk:
+        return chunk
+    parts = [chunk]
+    got = len(chunk)
+    while got < size:
+        chunk = stream.read(size - got)
+        if not chunk:
+            break
+        parts.append(chunk)
+        got += len(chunk)
+    return b"".join(parts)
+
+
+class _StreamSlicer:
+    """
+    Adaptor file-like seekable agar bisa diiris seperti bytes: setiap irisan
+    dibaca dengan satu seek + read, sehingga hanya byte yang diminta yang dibaca.
+    """
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.base = stream.tell()
+        self.length = _remaining_length(stream)
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __getitem__(self, item: slice) -> bytes:
+        start, stop, step = item.indices(self.length)
+        if stop <= start:
+            return b""
+        self.stream.seek(self.base + start)
+        chunk = self.stream.read(stop - start)
+        return chunk if step == 1 else chunk[::step]
+
+
+@lru_cache(maxsize=PLAN_CACHE_SIZE)
+def _compile_plan(key, mode: str, length: int):
+    compiled = compile_key(key, mode)
+    if not compiled.order:
+        return None
+    return TranspositionPlan(
+        compiled.order, compiled.num_cols, length, compiled.display_key
+    )
+
+
+class BlockLayout:
+    """
+    Tata letak mode blok: plaintext dipotong per ``block_size`` byte dan
+    setiap blok ditransposisi sendiri dengan kunci yang sama. Blok penuh di
+    ciphertext berukuran tetap (``cipher_block_size``, kelipatan jumlah
+    kolom), sehingga posisi blok ke-i dihitung langsung tanpa indeks. Hanya
+    blok terakhir yang boleh lebih pendek.
+    """
+
+    __slots__ = ("num_cols", "block_size", "length", "num_blocks", "cipher_block_size")
+
+    def __init__(self, num_cols: int, block_size: int, length: int):
+        if block_size < 1:
+            raise ValueError("Ukuran blok minimal 1 byte.")
+        self.num_cols = num_cols
+        self.block_size = block_size
+        self.length = length
+        self.num_blocks = -(-length // block_size)
+        self.cipher_block_size = -(-block_size // num_cols) * num_cols
+
+    def plain_span(self, index: int) -> tuple:
+        """(awal, akhir) blok ke-``index`` pada plaintext."""
+        start = index * self.block_size
+        return start, min(start + self.block_size, self.length)
+
+    def cipher_span(self, index: int) -> tuple:
+        """(awal, akhir) blok ke-``index`` pada ciphertext (tanpa trailer)."""
+        start = index * self.cipher_block_size
+        plain_start, plain_stop = self.plain_span(index)
+        size = -(-(plain_stop - plain_start) // self.num_cols) * self.num_cols
+        return start, start + size
+
+    @property
+    def cipher_length(self) -> int:
+        """Total ciphertext seluruh blok (tanpa trailer)."""
+        return self.cipher_span(self.num_blocks - 1)[1] if self.num_blocks else 0
+
+    def trailer(self) -> bytes:
+        return BLOCK_TRAILER.pack(self.block_size, self.length, BLOCK_MAGIC)
+
+    @classmethod
+    def from_trailer(cls, raw: bytes, num_cols: int) -> "BlockLayout":
+        if len(raw) != BLOCK_TRAILER.size:
+            raise ValueError("Ciphertext mode blok terlalu pendek.")
+        block_size, length, magic = BLOCK_TRAILER.unpack(raw)
+        if magic != BLOCK_MAGIC or block_size < 1:
+            raise ValueError("Data bukan ciphertext mode blok (trailer tidak valid).")
+        return cls(num_cols, block_size, length)
+
+
+def _read_layout(source, compiled) -> BlockLayout:
+    """Membaca trailer di akhir ``source`` (bytes/mmap/_StreamSlicer)."""
+    total = len(source)
+    layout = BlockLayout.from_trailer(
+        bytes(source[max(0, total - BLOCK_TRAILER.size) : total]), compiled.num_cols
+    )
+    if layout.cipher_length + BLOCK_TRAILER.size != total:
+        raise ValueError("Panjang ciphertext tidak sesuai trailer mode blok.")
+    return layout
+
+
+def _encrypt_block(compiled, key_mode, src, dst, engine) -> None:
+    _compile_plan(compiled, key_mode, len(src)).encrypt_into(src, dst, engine)
+
+
+def _decrypt_block(compiled, key_mode, src, dst, engine) -> None:
+    """Dekripsi satu blok ciphertext (berpadding) ke ``dst`` sepanjang plaintext."""
+    plan = _compile_plan(compiled, key_mode, len(src))
+    if len(dst) == len(src):
+        plan.decrypt_into(src, dst, engine)
+        return
+    scratch = bytearray(len(src))
+    plan.decrypt_into(src, scratch, engine)
+    dst[:] = memoryview(scratch)[: len(dst)]
+
+
+def _run_blocks(fn, jobs, workers: int) -> list:
+    """
+    Menjalankan ``fn(*job)`` per blok; blok menulis ke bagian output terpisah.
+    Mengembalikan hasil ``fn`` sesuai urutan ``jobs``.
+    """
+    if workers <= 1 or len(jobs) < 2:
+        return [fn(*job) for job in jobs]
+    with ThreadPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+        return [future.result() for future in [pool.submit(fn, *job) for job in jobs]]
+
+
+class ColumnarTransposition:
+    """
+    Implementasi Columnar Transposition Cipher.
+    """
+
+    @staticmethod
+    def _parse_numeric_key(key_str: str) -> list[int]:
+        """
+        Helper untuk memparsing string kunci.
+        Mendukung format spasi "4 1 3 2" maupun format sambung "4132".
+        """
+        return parse_numeric_key(key_str)
+
+    @staticmethod
+    def get_key_metadata(key: str, mode: str = "text") -> dict:
+        """
+        Menentukan urutan kolom (order) dan jumlah kolom berdasarkan mode.
+        """
+        compiled = compile_key(key, mode)
         return {
-            "ciphertext": ciphertext,
-            "grid": grid,
-            "order": order,
-            "fill_steps": fill_steps,
-            "read_steps": read_steps,
-            "padded_text": padded_text,
-            "display_key": metadata["clean_key_display"],
+            "order": list(compiled.order),
+            "num_cols": compiled.num_cols,
+            "clean_key_display": list(compiled.display_key),
         }
 
     @staticmethod
-    def decrypt_text(ciphertext: str, key: str, key_mode: str = "text") -> dict:
-        metadata = ColumnarTransposition.get_key_metadata(key, key_mode)
-        order = metadata["order"]
-        num_cols = metadata["num_cols"]
+    def get_plan(key: str, key_mode: str = "text", length: int = 0):
+        """
+        Mengambil TranspositionPlan dari cache LRU.
+        Mengembalikan None jika kunci tidak valid. ``key`` boleh berupa
+        string, ``CompiledKey``, atau array/buffer permutasi (kunci lebar).
+        """
+        if not isinstance(key, str):
+            key = compile_key(key, key_mode)
+        return _compile_plan(key, key_mode, length)
 
-        if num_cols == 0:
+    @staticmethod
+    def encrypt_text(
+        plaintext: str,
+        key: str,
+        padding_char: str = "X",
+        key_mode: str = "text",
+        with_steps: bool = True,
+    ) -> TextEncryptResult:
+        """
+        Enkripsi teks. Dengan ``with_steps=False`` hanya hasil yang dikembalikan
+        (tanpa grid/langkah); grid dan langkah selalu dihitung secara lazy
+        dari padded_text dan urutan kolom yang disimpan di objek hasil.
+        """
+        plan = ColumnarTransposition.get_plan(key, key_mode, len(plaintext))
+        if plan is None:
             return None
 
-        num_rows = math.ceil(len(ciphertext) / num_cols)
+        padded_text = plaintext
+        missing = plan.total_len - len(plaintext)
+        if missing > 0:
+            padded_text += padding_char * missing
 
-        grid = [["" for _ in range(num_cols)] for _ in range(num_rows)]
-        fill_steps = []
-        current_char_idx = 0
+        return TextEncryptResult(
+            plan.encrypt_str(padded_text),
+            padded_text,
+            plan.order,
+            plan.display_key,
+            with_steps,
+        )
 
-        for col_idx in order:
-            for row_idx in range(num_rows):
-                if current_char_idx < len(ciphertext):
-                    char = ciphertext[current_char_idx]
-                    grid[row_idx][col_idx] = char
-                    fill_steps.append((row_idx, col_idx, char))
-                    current_char_idx += 1
+    @staticmethod
+    def decrypt_text(
+        ciphertext: str, key: str, key_mode: str = "text", with_steps: bool = True
+    ) -> TextDecryptResult:
+        """Dekripsi teks; lihat ``encrypt_text`` untuk ``with_steps``."""
+        plan = ColumnarTransposition.get_plan(key, key_mode, len(ciphertext))
+        if plan is None:
+            return None
 
-        plaintext = ""
-        read_steps = []
-        for r in range(num_rows):
-            for c in range(num_cols):
-                char = grid[r][c]
-                plaintext += char
-                read_steps.append((r, c, char))
+        return TextDecryptResult(
+            ciphertext,
+            plan.decrypt_str(ciphertext),
+            plan.order,
+            plan.display_key,
+            with_steps,
+        )
 
-        return {
-            "plaintext": plaintext.rstrip(),
-            "raw_plaintext": plaintext,
-            "grid": grid,
-            "order": order,
-            "fill_steps": fill_steps,
-            "read_steps": read_steps,
-            "display_key": metadata["clean_key_display"],
-        }
+    @staticmethod
+    def encrypt_bytes(
+        data: bytes,
+        key: str,
+        key_mode: str = "text",
+        engine: str = "auto",
+        workers: int = 1,
+        block_size: int = None,
+    ) -> bytes:
+        """
+        Enkripsi bytes. Dengan ``block_size`` data dipotong menjadi blok
+        independen (lihat ``BlockLayout``) yang dienkripsi paralel di
+        ``workers`` thread; panjang asli dan ukuran blok disimpan di trailer.
+        """
+        if block_size is not None:
+            return ColumnarTransposition._encrypt_blocks(
+                data, key, key_mode, engine, workers, block_size
+            )
+        if not data:
+            return b""
+        plan = ColumnarTransposition.get_plan(key, key_mode, len(data))
+        if plan is None:
+            return b""
+        return plan.encrypt(data, engine, workers)
 
     @staticmethod
-    def encrypt_bytes(data: bytes, key: str, key_mode: str = "text") -> bytes:
+    def decrypt_bytes(
+        data: bytes,
+        key: str,
+        key_mode: str = "text",
+        engine: str = "auto",
+        workers: int = 1,
+        block_mode: bool = False,
+    ) -> bytes:
+        """
+        Dekripsi bytes. ``block_mode=True`` untuk ciphertext hasil
+        ``encrypt_bytes(..., block_size=...)``: plaintext dikembalikan persis
+        sepanjang aslinya.
+        """
+        if block_mode:
+            return ColumnarTransposition._decrypt_blocks(
+                data, key, key_mode, engine, workers
+            )
         if not data:
             return b""
-        metadata = ColumnarTransposition.get_key_metadata(key, key_mode)
-        order, num_cols = metadata["order"], metadata["num_cols"]
-        if num_cols == 0:
+        plan = ColumnarTransposition.get_plan(key, key_mode, len(data))
+        if plan is None:
             return b""
+        return plan.decrypt(data, engine, workers)
 
-        len_data = len(data)
-        num_rows = math.ceil(len_data / num_cols)
-        total_len = num_rows * num_cols
-        result = bytearray(total_len)
-
-        dest_idx = 0
-        for col_idx in order:
-            for row_idx in range(num_rows):
-                src_idx = (row_idx * num_cols) + col_idx
-                if src_idx < len_data:
-                    result[dest_idx] = data[src_idx]
-                else:
-                    result[dest_idx] = 0
-                dest_idx += 1
-        return bytes(result)
+    @staticmethod
+    def _encrypt_blocks(data, key, key_mode, engine, workers, block_size) -> bytes:
+        compiled = compile_key(key, key_mode)
+        if not compiled.order:
+            return b""
+        layout = BlockLayout(compiled.num_cols, block_size, len(data))
+        out = bytearray(layout.cipher_length + BLOCK_TRAILER.size)
+        src, dst = memoryview(data), memoryview(out)
+        jobs = []
+        for i in range(layout.num_blocks):
+            plain_start, plain_stop = layout.plain_span(i)
+            cipher_start, cipher_stop = layout.cipher_span(i)
+            jobs.append(
+                (
+                    compiled,
+                    key_mode,
+                    src[plain_start:plain_stop],
+                    dst[cipher_start:cipher_stop],
+                    engine,
+                )
+            )
+        _run_blocks(_encrypt_block, jobs, workers)
+        dst[layout.cipher_length :] = layout.trailer()
+        return bytes(out)
 
     @staticmethod
-    def decrypt_bytes(data: bytes, key: str, key_mode: str = "text") -> bytes:
-        if not data:
+    def _decrypt_blocks(data, key, key_mode, engine, workers) -> bytes:
+        compiled = compile_key(key, key_mode)
+        if not compiled.order:
             return b""
-        metadata = ColumnarTransposition.get_key_metadata(key, key_mode)
-        order, num_cols = metadata["order"], metadata["num_cols"]
-        if num_cols == 0:
+        layout = _read_layout(data, compiled)
+        out = bytearray(layout.length)
+        src, dst = memoryview(data), memoryview(out)
+        jobs = []
+        for i in range(layout.num_blocks):
+            plain_start, plain_stop = layout.plain_span(i)
+            cipher_start, cipher_stop = layout.cipher_span(i)
+            jobs.append(
+                (
+                    compiled,
+                    key_mode,
+                    src[cipher_start:cipher_stop],
+                    dst[plain_start:plain_stop],
+                    engine,
+                )
+            )
+        _run_blocks(_decrypt_block, jobs, workers)
+        return bytes(out)
+
+    @staticmethod
+    def decrypt_block(
+        source, key: str, index: int, key_mode: str = "text", engine: str = "auto"
+    ) -> bytes:
+        """
+        Akses acak mode blok: mendekripsi hanya blok ke-``index`` dari
+        ciphertext mode blok. ``source`` dapat berupa bytes, mmap, file-like
+        seekable, atau path; dari file hanya trailer dan blok itu yang dibaca.
+        """
+        if isinstance(source, (str, os.PathLike)):
+            with open(source, "rb") as stream:
+                return ColumnarTransposition.decrypt_block(
+                    stream, key, index, key_mode, engine
+                )
+        if hasattr(source, "seek") and not isinstance(source, mmap.mmap):
+            slicer = _StreamSlicer(source)
+            try:
+                return ColumnarTransposition.decrypt_block(
+                    slicer, key, index, key_mode, engine
+                )
+            finally:
+                source.seek(slicer.base)
+        compiled = compile_key(key, key_mode)
+        if not compiled.order:
             return b""
+        layout = _read_layout(source, compiled)
+        if not 0 <= index < layout.num_blocks:
+            raise IndexError("Indeks blok di luar jangkauan.")
+        plain_start, plain_stop = layout.plain_span(index)
+        cipher_start, cipher_stop = layout.cipher_span(index)
+        out = bytearray(plain_stop - plain_start)
+        _decrypt_block(
+            compiled,
+            key_mode,
+            bytes(source[cipher_start:cipher_stop]),
+            memoryview(out),
+            engine,
+        )
+        return bytes(out)
 
-        len_data = len(data)
-        num_rows = math.ceil(len_data / num_cols)
-        result = bytearray(len_data)
-
-        src_idx = 0
-        for col_idx in order:
-            for row_idx in range(num_rows):
-                if src_idx < len_data:
-                    dest_idx = (row_idx * num_cols) + col_idx
-                    if dest_idx < len_data:
-                        result[dest_idx] = data[src_idx]
-                    src_idx += 1
-        return bytes(result)
+    @staticmethod
+    def encrypt_bytes_multi(
+        data: bytes, keys, key_mode: str = "text", engine: str = "auto"
+    ) -> bytes:
+        """
+        Transposisi berulang (double/iterated) dengan kunci ``keys`` berurutan.
+        Hasil identik dengan memanggil ``encrypt_bytes`` per kunci. Untuk data
+        kecil dengan banyak round permutasinya digabung (dan di-cache) sehingga
+        buffer dilalui sekali; selain itu round dijalankan berurutan.
+        """
+        keys = _hashable_keys(keys, key_mode)
+        if not data or not keys:
+            return bytes(data)
+        engine = resolve_engine(engine)
+        if not _use_fused(engine, len(keys), len(data)):
+            rounds = _chain_rounds(keys, key_mode, len(data), "encrypt")
+            return _run_rounds(data, rounds, "encrypt", engine) if rounds else b""
+
+        fused = _compile_chain(keys, key_mode, len(data), "encrypt")
+        return fused.apply(data) if fused is not None else b""
+
+    @staticmethod
+    def decrypt_bytes_multi(
+        data: bytes,
+        keys,
+        key_mode: str = "text",
+        engine: str = "auto",
+        length: int = None,
+    ) -> bytes:
+        """
+        Kebalikan ``encrypt_bytes_multi``: ``keys`` diberikan dalam urutan yang
+        sama seperti saat enkripsi, round dibalik secara otomatis.
+
+        Tanpa ``length`` hasilnya sama dengan memanggil ``decrypt_bytes`` per
+        round. Dengan ``length`` (panjang plaintext asli) padding antar-round
+        dibuang sehingga plaintext kembali persis.
+        """
+        keys = tuple(reversed(_hashable_keys(keys, key_mode)))
+        if not data or not keys:
+            return bytes(data)
+        engine = resolve_engine(engine)
+        if not _use_fused(engine, len(keys), len(data)):
+            rounds = _chain_rounds(keys, key_mode, len(data), "decrypt", length)
+            return _run_rounds(data, rounds, "decrypt", engine) if rounds else b""
+
+        fused = _compile_chain(keys, key_mode, len(data), "decrypt", length)
+        return fused.apply(data) if fused is not None else b""
+
+    @staticmethod
+    def encrypt_into(
+        src,
+        dst,
+        key: str,
+        key_mode: str = "text",
+        engine: str = "auto",
+        workers: int = 1,
+    ) -> int:
+        """
+        Enkripsi dari buffer ``src`` ke buffer writable ``dst`` tanpa membuat
+        salinan ``bytes``. Gunakan ``get_plan(...).total_len`` untuk ukuran ``dst``.
+        """
+        if len(src) == 0:
+            return 0
+        plan = ColumnarTransposition.get_plan(key, key_mode, len(src))
+        if plan is None:
+            return 0
+        return plan.encrypt_into(src, dst, engine, workers)
+
+    @staticmethod
+    def decrypt_into(
+        src,
+        dst,
+        key: str,
+        key_mode: str = "text",
+        engine: str = "auto",
+        workers: int = 1,
+    ) -> int:
+        """Dekripsi dari buffer ``src`` ke buffer writable ``dst`` (panjang sama)."""
+        if len(src) == 0:
+            return 0
+        plan = ColumnarTransposition.get_plan(key, key_mode, len(src))
+        if plan is None:
+            return 0
+        return plan.decrypt_into(src, dst, engine, workers)
+
+    @staticmethod
+    def encrypt_range(
+        source, key: str, start: int, length: int, key_mode: str = "text"
+    ) -> bytes:
+        """
+        Potongan ``encrypt_bytes(source)[start:start + length]`` yang dihitung
+        langsung dari plaintext, tanpa mengenkripsi seluruh data.
+        """
+        plan = ColumnarTransposition.get_plan(key, key_mode, len(source))
+        if plan is None or len(source) == 0:
+            return b""
+        return plan.read_range(source, start, length, "encrypt")
+
+    @staticmethod
+    def decrypt_range(
+        ciphertext_source, key: str, start: int, length: int, key_mode: str = "text"
+    ) -> bytes:
+        """
+        Potongan ``decrypt_bytes(ciphertext)[start:start + length]`` tanpa
+        mendekripsi seluruh data. ``ciphertext_source`` dapat berupa bytes,
+        memoryview, mmap, file-like seekable, atau path; dari file hanya
+        potongan kolom yang dibutuhkan yang dibaca (seek + read), lalu posisi
+        stream dikembalikan.
+        """
+        if isinstance(ciphertext_source, (str, os.PathLike)):
+            with open(ciphertext_source, "rb") as stream:
+                return ColumnarTransposition.decrypt_range(
+                    stream, key, start, length, key_mode
+                )
+        source = ciphertext_source
+        if hasattr(source, "seek") and not isinstance(source, mmap.mmap):
+            slicer = _StreamSlicer(source)
+            try:
+                return ColumnarTransposition.decrypt_range(
+                    slicer, key, start, length, key_mode
+                )
+            finally:
+                source.seek(slicer.base)
+        if len(source) == 0:
+            return b""
+        plan = ColumnarTransposition.get_plan(key, key_mode, len(source))
+        if plan is None:
+            return b""
+        return plan.read_range(source, start, length, "decrypt")
+
+    @staticmethod
+    def encrypt_stream(
+        src,
+        dst,
+        key: str,
+        key_mode: str = "text",
+        length: int = None,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        block_size: int = None,
+        workers: int = 1,
+        engine: str = "auto",
+    ) -> int:
+        """
+        Enkripsi file-like ``src`` ke ``dst`` (seekable) tanpa memuat seluruh isi.
+        ``length`` adalah total byte sumber; jika None dihitung lewat seek.
+
+        Dengan ``block_size`` (mode blok) ``src`` dibaca berurutan per blok
+        dan ``dst`` cukup ditulis berurutan (tidak perlu seekable); ``workers``
+        blok dienkripsi paralel per batch dengan ``engine``. Mengembalikan
+        jumlah byte output termasuk trailer.
+        """
+        if block_size is not None:
+            return ColumnarTransposition._encrypt_block_stream(
+                src, dst, key, key_mode, length, block_size, workers, engine
+            )
+        if length is None:
+            length = _remaining_length(src)
+        if length == 0:
+            return 0
+        plan = ColumnarTransposition.get_plan(key, key_mode, length)
+        if plan is None:
+            return 0
+        return plan.encrypt_stream(src, dst, buffer_size)
+
+    @staticmethod
+    def decrypt_stream(
+        src,
+        dst,
+        key: str,
+        key_mode: str = "text",
+        length: int = None,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        block_mode: bool = False,
+        workers: int = 1,
+        engine: str = "auto",
+    ) -> int:
+        """
+        Dekripsi streaming; ``src`` (ciphertext) harus seekable. Dengan
+        ``block_mode=True`` trailer dibaca lebih dulu, lalu blok didekripsi
+        per batch ``workers`` dengan ``engine`` dan plaintext ditulis
+        berurutan ke ``dst``.
+        """
+        if block_mode:
+            return ColumnarTransposition._decrypt_block_stream(
+                src, dst, key, key_mode, workers, engine
+            )
+        if length is None:
+            length = _remaining_length(src)
+        if length == 0:
+            return 0
+        plan = ColumnarTransposition.get_plan(key, key_mode, length)
+        if plan is None:
+            return 0
+        return plan.decrypt_stream(src, dst, buffer_size)
+
+    @staticmethod
+    def _encrypt_block_stream(
+        src, dst, key, key_mode, length, block_size, workers, engine="auto"
+    ):
+        compiled = compile_key(key, key_mode)
+        if not compiled.order:
+            return 0
+        if block_size < 1:
+            raise ValueError("Ukuran blok minimal 1 byte.")
+        batch = max(1, workers)
+        remaining = length
+        total = written = 0
+        while remaining is None or remaining > 0:
+            chunks = []
+            for _ in range(batch):
+                want = block_size if remaining is None else min(block_size, remaining)
+                chunk = _read_exact(src, want) if want > 0 else b""
+                if not chunk:
+                    break
+                chunks.append(chunk)
+                total += len(chunk)
+                if remaining is not None:
+                    remaining -= len(chunk)
+            if not chunks:
+                break
+            outs = [
+                bytearray(-(-len(c) // compiled.num_cols) * compiled.num_cols)
+                for c in chunks
+            ]
+            jobs = [
+                (compiled, key_mode, chunk, memoryview(out), engine)
+                for chunk, out in zip(chunks, outs)
+            ]
+            _run_blocks(_encrypt_block, jobs, workers)
+            for out in outs:
+                dst.write(out)
+                written += len(out)
+            if len(chunks[-1]) < block_size:
+                break
+        trailer = BlockLayout(compiled.num_cols, block_size, total).trailer()
+        dst.write(trailer)
+        return written + len(trailer)
+
+    @staticmethod
+    def _decrypt_block_stream(src, dst, key, key_mode, workers, engine="auto") -> int:
+        compiled = compile_key(key, key_mode)
+        if not compiled.order:
+            return 0
+        slicer = _StreamSlicer(src)
+        layout = _read_layout(slicer, compiled)
+        batch = max(1, workers)
+        written = 0
+        for first in range(0, layout.num_blocks, batch):
+            indices = range(first, min(first + batch, layout.num_blocks))
+            jobs = []
+            for i in indices:
+                plain_start, plain_stop = layout.plain_span(i)
+                cipher_start, cipher_stop = layout.cipher_span(i)
+                jobs.append(
+                    (
+                        compiled,
+                        key_mode,
+                        slicer[cipher_start:cipher_stop],
+                        memoryview(bytearray(plain_stop - plain_start)),
+                        engine,
+                    )
+                )
+            _run_blocks(_decrypt_block, jobs, workers)
+            for job in jobs:
+                dst.write(job[3])
+                written += len(job[3])
+        src.seek(slicer.base + len(slicer))
+        return written
 
     @staticmethod
     def get_byte_steps(
         data_sample: bytes, key: str, mode="encrypt", key_mode="text"
-    ) -> dict:
-        byte_list = list(data_sample)
-        metadata = ColumnarTransposition.get_key_metadata(key, key_mode)
-        order, num_cols = metadata["order"], metadata["num_cols"]
-        if num_cols == 0:
-            return {}
-
-        num_rows = math.ceil(len(byte_list) / num_cols)
-        total_len = num_rows * num_cols
-        padded_data = byte_list + [None] * (total_len - len(byte_list))
-
-        grid = [[None for _ in range(num_cols)] for _ in range(num_rows)]
-        fill_steps = []
-        read_steps = []
-
-        if mode == "encrypt":
-            idx = 0
-            for r in range(num_rows):
-                for c in range(num_cols):
-                    val = padded_data[idx] if idx < len(padded_data) else 0
-                    grid[r][c] = val
-                    fill_steps.append((r, c, val))
-                    idx += 1
-            for col_idx in order:
-                for row_idx in range(num_rows):
-                    val = grid[row_idx][col_idx]
-                    read_steps.append((row_idx, col_idx, val))
-        else:
-            idx = 0
-            for col_idx in order:
-                for row_idx in range(num_rows):
-                    val = padded_data[idx] if idx < len(padded_data) else 0
-                    grid[row_idx][col_idx] = val
-                    fill_steps.append((row_idx, col_idx, val))
-                    idx += 1
-            for r in range(num_rows):
-                for c in range(num_cols):
-                    val = grid[r][c]
-                    read_steps.append((r, c, val))
+    ) -> ByteStepsResult:
+        """Langkah visualisasi byte; ``None`` bila kunci tidak valid."""
+        plan = ColumnarTransposition.get_plan(key, key_mode, len(data_sample))
+        if plan is None:
+            return None
 
-        return {
-            "grid": grid,
-            "fill_steps": fill_steps,
-            "read_steps": read_steps,
-            "order": order,
-            "display_key": metadata["clean_key_display"],
-        }
+        return ByteStepsResult(data_sample, plan.order, plan.display_key, mode)
@@ -0,0 +1,173 @@
+"""
+CLI batch untuk enkripsi/dekripsi banyak file sekaligus.
+
+Contoh:
+    python -m src.cli encrypt --key TEKNIK --key-mode text data/*.bin
+    python -m src.cli decrypt --key "4 1 3 2" --key-mode numeric -w 8 -o out/ enc_*
+"""
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from src import container
+from src.cipher import ColumnarTransposition
+from src.utils import validate_key
+
+# Prefix nama file output, sama dengan konvensi di tab_file.py
+OUTPUT_PREFIX = {"encrypt": "enc_", "decrypt": "dec_"}
+
+
+def output_path_for(
+    path: str, action: str, output_dir: str = None, rel_dir: str = ""
+) -> str:
+    """
+    Nama file output: ``enc_<nama>`` / ``dec_<nama>`` di folder tujuan. File
+    dari folder input ditempatkan di ``output_dir/<rel_dir>`` agar struktur
+    subfolder tetap terjaga.
+    """
+    folder = os.path.join(output_dir, rel_dir) if output_dir else os.path.dirname(path)
+    return os.path.join(folder, OUTPUT_PREFIX[action] + os.path.basename(path))
+
+
+def process_file(
+    path: str, action: str, key: str, key_mode: str, out_path: str
+) -> tuple[str, str, int, float]:
+    """Memproses satu file ke ``out_path`` (dijalankan di worker process)."""
+    start = time.perf_counter()
+    with open(path, "rb") as f:
+        data = f.read()
+
+    if action == "encrypt":
+        result = ColumnarTransposition.encrypt_bytes(data, key, key_mode)
+    elif container.is_container(data):
+        # Container dari aplikasi/FileHandler: panjang asli dari header
+        result = container.unpack(data, key, key_mode)
+    else:
+        result = ColumnarTransposition.decrypt_bytes(data, key, key_mode)
+
+    with open(out_path, "wb") as f:
+        f.write(result)
+    return path, out_path, len(data), time.perf_counter() - start
+
+
+def collect_paths(paths: list[str]) -> list[tuple[str, str]]:
+    """
+    Mengembangkan folder menjadi daftar file (rekursif). Mengembalikan
+    ``(path, rel_dir)``: ``rel_dir`` adalah subfolder relatif terhadap folder
+    input ("" untuk file yang diberikan langsung).
+    """
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, names in os.walk(path):
+                rel_dir = os.path.relpath(root, path)
+                rel_dir = "" if rel_dir == os.curdir else rel_dir
+                files.extend(
+                    (os.path.join(root, name), rel_dir) for name in sorted(names)
+                )
+        else:
+            files.append((path, ""))
+    return files
+
+
+def plan_outputs(files, action: str, output_dir: str = None) -> dict:
+    """
+    Memetakan path input ke path output. ValueError jika dua input akan
+    menulis ke file output yang sama (mis. ``a/x.bin`` dan ``b/x.bin`` dengan
+    ``-o``), sebelum ada file yang diproses.
+    """
+    outputs = {}
+    targets = {}
+    for path, rel_dir in files:
+        out_path = output_path_for(path, action, output_dir, rel_dir)
+        target = os.path.normcase(os.path.abspath(out_path))
+        if target in targets and targets[target] != path:
+            raise ValueError(
+                f"{targets[target]} dan {path} sama-sama ditulis ke {out_path}"
+            )
+        targets[target] = path
+        outputs[path] = out_path
+    return outputs
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m src.cli",
+        description="Batch Columnar Transposition untuk banyak file.",
+    )
+    parser.add_argument("action", choices=["encrypt", "decrypt"])
+    parser.add_argument("paths", nargs="+", help="File atau folder input")
+    parser.add_argument("-k", "--key", required=True, help="Kunci transposisi")
+    parser.add_argument("-m", "--key-mode", choices=["text", "numeric"], default="text")
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Jumlah worker process (default: jumlah CPU)",
+    )
+    parser.add_argument(
+        "-o", "--output-dir", default=None, help="Folder output (default: folder input)"
+    )
+    return parser
+
+
+def main(argv: list[str] = None) -> int:
+    args = build_parser().parse_args(argv)
+
+    valid, msg = validate_key(args.key, args.key_mode)
+    if not valid:
+        print(f"Kunci tidak valid: {msg}", file=sys.stderr)
+        return 2
+
+    files = collect_paths(args.paths)
+    if not files:
+        print("Tidak ada file untuk diproses.", file=sys.stderr)
+        return 1
+    try:
+        outputs = plan_outputs(files, args.action, args.output_dir)
+    except ValueError as e:
+        print(f"Nama output bentrok: {e}", file=sys.stderr)
+        return 2
+    for out_path in outputs.values():
+        os.makedirs(os.path.dirname(out_path) or os.curdir, exist_ok=True)
+
+    total_bytes = 0
+    failures = 0
+    start = time.perf_counter()
+
+    with ProcessPoolExecutor(max_workers=max(1, args.workers)) as pool:
+        futures = {
+            pool.submit(
+                process_file,
+                path,
+                args.action,
+                args.key,
+                args.key_mode,
+                out_path,
+            ): path
+            for path, out_path in outputs.items()
+        }
+        for future in as_completed(futures):
+            try:
+                _, out_path, size, _ = future.result()
+                total_bytes += size
+            except Exception as e:
+                failures += 1
+                print(f"Gagal: {futures[future]}: {e}", file=sys.stderr)
+
+    elapsed = time.perf_counter() - start
+    megabytes = total_bytes / (1024 * 1024)
+    throughput = megabytes / elapsed if elapsed > 0 else 0.0
+    print(
+        f"{len(outputs) - failures}/{len(outputs)} file diproses | "
+        f"{megabytes:.2f} MB dalam {elapsed:.2f} s | {throughput:.2f} MB/s"
+    )
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,442 @@
+"""
+Format container file terenkripsi yang mendeskripsikan dirinya sendiri.
+
+Susunan (little-endian)::
+
+    header  : magic "CTCF", versi, ukuran header, fingerprint kunci (16 B),
+              panjang asli, ukuran blok, jumlah blok, CRC32 index
+    index   : per blok (offset absolut, panjang ciphertext, CRC32 ciphertext)
+    data    : blok ciphertext mode blok (lihat ``cipher.BlockLayout``)
+
+Panjang asli ada di header, sehingga plaintext dikembalikan persis tanpa
+memindai padding di akhir. Index memungkinkan pembaca langsung seek ke blok
+mana pun, memverifikasi checksum-nya, lalu mendekripsinya sendiri (paralel
+atau lazy).
+"""
+
+import hashlib
+import struct
+import threading
+import zlib
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import NamedTuple
+
+from src.cipher import (
+    DEFAULT_BLOCK_SIZE,
+    BlockLayout,
+    ColumnarTransposition,
+    _decrypt_block,
+    _encrypt_block,
+    _read_exact,
+    _remaining_length,
+    _run_blocks,
+    _StreamSlicer,
+)
+from src.keys import compile_key
+
+MAGIC = b"CTCF"
+VERSION = 1
+
+# magic, versi, ukuran header, fingerprint, panjang, ukuran blok, jumlah blok, CRC index
+HEADER = struct.Struct("<4sHH16sQQII")
+
+# offset absolut, panjang ciphertext, CRC32 ciphertext
+INDEX_ENTRY = struct.Struct("<QII")
+
+
+class IndexEntry(NamedTuple):
+    offset: int
+    size: int
+    crc: int
+
+
+class ContainerHeader(NamedTuple):
+    """Header + index container yang sudah diparsing."""
+
+    fingerprint: bytes
+    length: int
+    block_size: int
+    entries: tuple
+
+    @property
+    def num_blocks(self) -> int:
+        return len(self.entries)
+
+    @property
+    def data_offset(self) -> int:
+        return data_offset(self.num_blocks)
+
+    def pack(self) -> bytes:
+        index = b"".join(INDEX_ENTRY.pack(*entry) for entry in self.entries)
+        header = HEADER.pack(
+            MAGIC,
+            VERSION,
+            HEADER.size,
+            self.fingerprint,
+            self.length,
+            self.block_size,
+            self.num_blocks,
+            zlib.crc32(index),
+        )
+        return header + index
+
+
+def data_offset(num_blocks: int) -> int:
+    """Offset blok pertama (ukuran header + index)."""
+    return HEADER.size + num_blocks * INDEX_ENTRY.size
+
+
+@lru_cache(maxsize=64)
+def _fingerprint(compiled) -> bytes:
+    # Fingerprint urutan kolom: kunci berbeda dengan urutan sama dianggap setara
+    h = hashlib.blake2b(digest_size=16, person=b"CTCF-key")
+    h.update(compiled.num_cols.to_bytes(8, "little"))
+    h.update(array("I", compiled.order).tobytes())
+    return h.digest()
+
+
+def key_fingerprint(key, key_mode: str = "text") -> bytes:
+    """Fingerprint 16 byte dari urutan kolom kunci (bukan kuncinya sendiri)."""
+    return _fingerprint(compile_key(key, key_mode))
+
+
+def _layout(key, key_mode: str, length: int, block_size: int):
+    compiled = compile_key(key, key_mode)
+    if not compiled.order:
+        return compiled, None
+    return compiled, BlockLayout(compiled.num_cols, block_size, length)
+
+
+def _entries(layout: BlockLayout, crcs) -> tuple:
+    base = data_offset(layout.num_blocks)
+    entries = []
+    for i, crc in enumerate(crcs):
+        start, stop = layout.cipher_span(i)
+        entries.append(IndexEntry(base + start, stop - start, crc))
+    return tuple(entries)
+
+
+def container_size(
+    length: int, key, key_mode: str = "text", block_size: int = DEFAULT_BLOCK_SIZE
+) -> int:
+    """Ukuran container untuk plaintext sepanjang ``length``; 0 jika kunci tidak valid."""
+    _, layout = _layout(key, key_mode, length, block_size)
+    if layout is None:
+        return 0
+    return data_offset(layout.num_blocks) + layout.cipher_length
+
+
+def _encrypt_entry(compiled, key_mode, src, dst, engine) -> int:
+    _encrypt_block(compiled, key_mode, src, dst, engine)
+    return zlib.crc32(dst)
+
+
+def pack_into(
+    src,
+    dst,
+    key,
+    key_mode: str = "text",
+    block_size: int = DEFAULT_BLOCK_SIZE,
+    engine: str = "auto",
+    workers: int = 1,
+) -> int:
+    """
+    Menulis container dari buffer ``src`` ke buffer writable ``dst`` (mmap,
+    bytearray) berukuran ``container_size``. Blok dienkripsi langsung ke
+    posisinya, paralel di ``workers`` thread. Mengembalikan ukuran container.
+    """
+    compiled, layout = _layout(key, key_mode, len(src), block_size)
+    if layout is None:
+        return 0
+    base = data_offset(layout.num_blocks)
+    size = base + layout.cipher_length
+    if len(dst) < size:
+        raise ValueError("Buffer tujuan lebih kecil dari ukuran container.")
+    src_view, dst_view = memoryview(src), memoryview(dst)
+    jobs = []
+    for i in range(layout.num_blocks):
+        plain_start, plain_stop = layout.plain_span(i)
+        cipher_start, cipher_stop = layout.cipher_span(i)
+        jobs.append(
+            (
+                compiled,
+                key_mode,
+                src_view[plain_start:plain_stop],
+                dst_view[base + cipher_start : base + cipher_stop],
+                engine,
+            )
+        )
+    crcs = _run_blocks(_encrypt_entry, jobs, workers)
+    header = ContainerHeader(
+        _fingerprint(compiled), layout.length, block_size, _entries(layout, crcs)
+    )
+    dst_view[:base] = header.pack()
+    return size
+
+
+def pack(
+    data,
+    key,
+    key_mode: str = "text",
+    block_size: int = DEFAULT_BLOCK_SIZE,
+    engine: str = "auto",
+    workers: int = 1,
+) -> bytes:
+    """Container dari ``data`` sebagai bytes; b"" jika kunci tidak valid."""
+    out = bytearray(container_size(len(data), key, key_mode, block_size))
+    if not out:
+        return b""
+    pack_into(data, out, key, key_mode, block_size, engine, workers)
+    return bytes(out)
+
+
+def write_container(
+    src,
+    dst,
+    key,
+    key_mode: str = "text",
+    length: int = None,
+    block_size: int = DEFAULT_BLOCK_SIZE,
+    workers: int = 1,
+    engine: str = "auto",
+) -> int:
+    """
+    Enkripsi streaming file-like ``src`` ke ``dst`` (seekable). ``src`` dibaca
+    berurutan per batch ``workers`` blok dengan ``engine``; header dan index ditulis ulang di
+    awal setelah semua checksum diketahui. Mengembalikan ukuran container.
+    """
+    if length is None:
+        length = _remaining_length(src)
+    compiled, layout = _layout(key, key_mode, length, block_size)
+    if layout is None:
+        return 0
+    base = dst.tell()
+    dst.write(bytes(data_offset(layout.num_blocks)))
+
+    crcs = []
+    batch = max(1, workers)
+    for first in range(0, layout.num_blocks, batch):
+        jobs = []
+        for i in range(first, min(first + batch, layout.num_blocks)):
+            plain_start, plain_stop = layout.plain_span(i)
+            cipher_start, cipher_stop = layout.cipher_span(i)
+            chunk = _read_exact(src, plain_stop - plain_start)
+            if len(chunk) != plain_stop - plain_start:
+                raise ValueError("Sumber lebih pendek dari panjang yang diberikan.")
+            out = bytearray(cipher_stop - cipher_start)
+            jobs.append((compiled, key_mode, chunk, memoryview(out), engine))
+        crcs.extend(_run_blocks(_encrypt_entry, jobs, workers))
+        for job in jobs:
+            dst.write(job[3])
+
+    end = dst.tell()
+    header = ContainerHeader(
+        _fingerprint(compiled), length, block_size, _entries(layout, crcs)
+    )
+    dst.seek(base)
+    dst.write(header.pack())
+    dst.seek(end)
+    return end - base
+
+
+def _sliceable(source):
+    if hasattr(source, "seek") and not hasattr(source, "__getitem__"):
+        return _StreamSlicer(source)
+    return source
+
+
+def is_container(source) -> bool:
+    """``source`` (buffer atau file-like seekable) diawali magic container."""
+    if hasattr(source, "seek") and not hasattr(source, "__getitem__"):
+        pos = source.tell()
+        magic = source.read(len(MAGIC))
+        source.seek(pos)
+    else:
+        magic = bytes(source[: len(MAGIC)])
+    return magic == MAGIC
+
+
+def parse_header(source) -> ContainerHeader:
+    """Membaca dan memvalidasi header + index dari awal ``source``."""
+    source = _sliceable(source)
+    raw = bytes(source[: HEADER.size])
+    if len(raw) < HEADER.size or raw[: len(MAGIC)] != MAGIC:
+        raise ValueError("Data bukan container CryptoExpert.")
+    _, version, header_size, fingerprint, length, block_size, num_blocks, crc = (
+        HEADER.unpack(raw)
+    )
+    if version != VERSION or header_size != HEADER.size:
+        raise ValueError(f"Versi container {version} tidak didukung.")
+    index = bytes(source[HEADER.size : data_offset(num_blocks)])
+    if len(index) != num_blocks * INDEX_ENTRY.size or zlib.crc32(index) != crc:
+        raise ValueError("Index container rusak.")
+    entries = tuple(
+        IndexEntry(*INDEX_ENTRY.unpack_from(index, i * INDEX_ENTRY.size))
+        for i in range(num_blocks)
+    )
+    return ContainerHeader(fingerprint, length, block_size, entries)
+
+
+def read_prefix(source) -> bytes:
+    """Byte header + index dari awal ``source``; posisi stream dikembalikan."""
+    if hasattr(source, "seek") and not hasattr(source, "__getitem__"):
+        pos = source.tell()
+        try:
+            return read_prefix(_StreamSlicer(source))
+        finally:
+            source.seek(pos)
+    return bytes(source[: parse_header(source).data_offset])
+
+
+class ContainerReader:
+    """
+    Pembaca container: blok dibaca, diverifikasi, dan didekripsi sesuai
+    kebutuhan. ``source`` dapat berupa bytes, memoryview, mmap, atau
+    file-like seekable (posisi stream dipakai bersama oleh pembaca).
+    """
+
+    def __init__(self, source, key, key_mode: str = "text", engine: str = "auto"):
+        self.source = _sliceable(source)
+        self.key_mode = key_mode
+        self.engine = engine
+        self.compiled = compile_key(key, key_mode)
+        if not self.compiled.order:
+            raise ValueError("Kunci tidak valid.")
+        self.header = parse_header(self.source)
+        if self.header.fingerprint != _fingerprint(self.compiled):
+            raise ValueError("Kunci tidak cocok dengan container.")
+        self.layout = BlockLayout(
+            self.compiled.num_cols, self.header.block_size, self.header.length
+        )
+        self._check_index()
+        self._lock = threading.Lock()
+
+    def _check_index(self) -> None:
+        if self.layout.num_blocks != self.header.num_blocks:
+            raise ValueError("Jumlah blok container tidak sesuai panjang data.")
+        expected = _entries(self.layout, (entry.crc for entry in self.header.entries))
+        if expected != self.header.entries:
+            raise ValueError("Index container tidak sesuai kunci/ukuran blok.")
+        if self.num_blocks and expected[-1].offset + expected[-1].size > len(
+            self.source
+        ):
+            raise ValueError("Container terpotong.")
+
+    @property
+    def length(self) -> int:
+        return self.header.length
+
+    @property
+    def block_size(self) -> int:
+        return self.header.block_size
+
+    @property
+    def num_blocks(self) -> int:
+        return self.header.num_blocks
+
+    def _raw_block(self, index: int, verify: bool):
+        if not 0 <= index < self.num_blocks:
+            raise IndexError("Indeks blok di luar jangkauan.")
+        entry = self.header.entries[index]
+        with self._lock:
+            raw = self.source[entry.offset : entry.offset + entry.size]
+        if verify and zlib.crc32(raw) != entry.crc:
+            raise ValueError(f"Checksum blok {index} tidak cocok.")
+        return raw
+
+    def verify_block(self, index: int) -> bool:
+        """Memeriksa CRC32 ciphertext blok tanpa mendekripsinya."""
+        try:
+            self._raw_block(index, True)
+        except ValueError:
+            return False
+        return True
+
+    def _decrypt_to(self, index: int, dst, verify: bool) -> None:
+        raw = self._raw_block(index, verify)
+        _decrypt_block(self.compiled, self.key_mode, raw, dst, self.engine)
+
+    def read_block(self, index: int, verify: bool = True) -> bytes:
+        """Plaintext blok ke-``index`` (persis, tanpa padding)."""
+        plain_start, plain_stop = self.layout.plain_span(index)
+        out = bytearray(plain_stop - plain_start)
+        self._decrypt_to(index, memoryview(out), verify)
+        return bytes(out)
+
+    def iter_blocks(self, verify: bool = True):
+        """Generator plaintext per blok (lazy, satu blok di memori)."""
+        for index in range(self.num_blocks):
+            yield self.read_block(index, verify)
+
+    def read_range(self, start: int, length: int, verify: bool = True) -> bytes:
+        """``plaintext[start:start + length]``; hanya blok yang tercakup didekripsi."""
+        start = max(0, start)
+        end = min(self.length, start + max(0, length))
+        if start >= end:
+            return b""
+        first, last = start // self.block_size, (end - 1) // self.block_size
+        parts = [self.read_block(i, verify) for i in range(first, last + 1)]
+        offset = first * self.block_size
+        return b"".join(parts)[start - offset : end - offset]
+
+    def decrypt_into(self, dst, workers: int = 1, verify: bool = True) -> int:
+        """Dekripsi semua blok langsung ke buffer writable ``dst`` (paralel)."""
+        if len(dst) < self.length:
+            raise ValueError("Buffer tujuan lebih kecil dari panjang data.")
+        dst_view = memoryview(dst)
+        jobs = []
+        for index in range(self.num_blocks):
+            plain_start, plain_stop = self.layout.plain_span(index)
+            jobs.append((index, dst_view[plain_start:plain_stop], verify))
+        _run_blocks(self._decrypt_to, jobs, workers)
+        return self.length
+
+    def decrypt_to(self, stream, workers: int = 1, verify: bool = True) -> int:
+        """Dekripsi ke file-like ``stream`` berurutan, per batch ``workers`` blok."""
+        batch = max(1, workers)
+        written = 0
+        with ThreadPoolExecutor(max_workers=batch) as pool:
+            for first in range(0, self.num_blocks, batch):
+                indices = range(first, min(first + batch, self.num_blocks))
+                for chunk in pool.map(lambda i: self.read_block(i, verify), indices):
+                    stream.write(chunk)
+                    written += len(chunk)
+        return written
+
+    def read_all(self, workers: int = 1, verify: bool = True) -> bytes:
+        out = bytearray(self.length)
+        self.decrypt_into(out, workers, verify)
+        return bytes(out)
+
+
+def unpack(data, key, key_mode: str = "text", workers: int = 1) -> bytes:
+    """Plaintext lengkap dari container ``data``."""
+    return ContainerReader(data, key, key_mode).read_all(workers)
+
+
+def encrypted_range(source, prefix: bytes, key, key_mode: str, start: int, length: int):
+    """
+    ``container[start:start + length]`` tanpa membentuk seluruh container:
+    header + index diambil dari ``prefix`` (awal container yang sudah ditulis),
+    byte blok dihitung dari plaintext ``source`` lewat aritmetika permutasi.
+    """
+    header = parse_header(prefix)
+    base = header.data_offset
+    size = base + sum(entry.size for entry in header.entries)
+    start = max(0, start)
+    end = min(size, start + max(0, length))
+    if start >= end:
+        return b""
+    out = bytearray(prefix[start : min(end, base)])
+    for index, entry in enumerate(header.entries):
+        lo, hi = max(start, entry.offset), min(end, entry.offset + entry.size)
+        if lo >= hi:
+            continue
+        plain_start = index * header.block_size
+        plain_stop = min(plain_start + header.block_size, header.length)
+        plan = ColumnarTransposition.get_plan(key, key_mode, plain_stop - plain_start)
+        block = memoryview(source)[plain_start:plain_stop]
+        out += plan.read_range(block, lo - entry.offset, hi - lo, "encrypt")
+    return bytes(out)
@@ -0,0 +1,658 @@
+"""
+Pemecah kunci untuk ciphertext ``decrypt_text`` yang kuncinya tidak
+diketahui: brute force untuk kunci pendek, simulated annealing untuk kunci
+panjang.
+
+Setiap lebar kunci 2..N dicoba dengan seluruh permutasi urutan kolomnya.
+Calon plaintext tidak dibuat lewat ``decrypt_str`` per kandidat, melainkan
+lewat tabel indeks (gather) numpy untuk satu batch permutasi sekaligus, lalu
+dinilai dengan tabel log-probabilitas quadgram yang dibangun dari korpus
+bawaan (``assets/corpus/<bahasa>.txt``). Ruang permutasi dibagi per prefix
+urutan kolom ke process pool dan pencarian berhenti lebih awal begitu skor
+kandidat melewati ambang.
+
+Annealing bekerja pada susunan segmen per kolom grid. Skor teks dipecah
+menjadi jendela quadgram per kolom awal, sehingga setiap langkah hanya
+menilai ulang jendela di sekitar kolom yang berubah.
+"""
+
+import heapq
+import itertools
+import math
+import multiprocessing
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import lru_cache
+from typing import NamedTuple
+
+from src.cipher import _numpy
+
+CORPUS_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "assets", "corpus"
+)
+
+# Bahasa korpus bawaan (nama file di CORPUS_DIR)
+LANGUAGES = ("id", "en")
+
+# Alfabet skor: A-Z = 0..25, spasi = 26, karakter lain = 27
+ALPHABET_SIZE = 28
+SPACE_CODE = 26
+OTHER_CODE = 27
+
+# Batas lebar brute force (10! = 3,6 juta permutasi)
+MAX_BRUTE_FORCE_WIDTH = 10
+
+# Ambang berhenti dini (rata-rata log10 per quadgram). Teks bahasa alami
+# berada di kisaran -3,4 .. -4,0; susunan kolom yang salah di bawah -4,8.
+DEFAULT_STOP_SCORE = -4.4
+
+# Lebar maksimal yang dinilai oleh rank_widths secara default
+DETECT_MAX_WIDTH = 50
+
+# Simulated annealing: langkah per restart dan suhu awal/akhir per baris grid
+ANNEAL_ITERATIONS = 20_000
+ANNEAL_START_TEMPERATURE = 0.25
+ANNEAL_END_TEMPERATURE = 0.005
+
+# Interval (langkah) pemeriksaan sinyal berhenti selama annealing
+ANNEAL_CHECK_INTERVAL = 256
+
+# Jumlah sel (kandidat x panjang teks) per batch numpy
+BATCH_CELLS = 1 << 20
+
+# Permutasi per tugas pool; prefix diperpanjang sampai sisa <= nilai ini
+TASK_PERMUTATIONS = math.factorial(7)
+
+
+def _require_numpy():
+    np = _numpy()
+    if np is None:
+        raise ImportError("Pemecah kunci membutuhkan paket numpy.")
+    return np
+
+
+@lru_cache(maxsize=1)
+def _code_table():
+    """Tabel 256 entri: byte ASCII -> kode alfabet skor."""
+    np = _require_numpy()
+    table = np.full(256, OTHER_CODE, dtype=np.uint8)
+    letters = np.arange(26, dtype=np.uint8)
+    table[ord("A") : ord("Z") + 1] = letters
+    table[ord("a") : ord("z") + 1] = letters
+    table[[ord(c) for c in " \t\r\n"]] = SPACE_CODE
+    return table
+
+
+def encode_text(text: str):
+    """Kode alfabet skor per karakter (panjang hasil = ``len(text)``)."""
+    np = _require_numpy()
+    if text.isascii():
+        raw = np.frombuffer(text.encode("ascii"), dtype=np.uint8)
+    else:
+        raw = np.fromiter((min(ord(c), 255) for c in text), np.uint8, len(text))
+    return _code_table()[raw]
+
+
+class QuadgramScorer:
+    """
+    Tabel log10 peluang quadgram atas alfabet 28 simbol. Quadgram yang tidak
+    pernah muncul di korpus mendapat nilai ``floor``.
+    """
+
+    __slots__ = ("table", "floor")
+
+    def __init__(self, table, floor: float):
+        self.table = table
+        self.floor = floor
+
+    @classmethod
+    def from_text(cls, corpus: str) -> "QuadgramScorer":
+        np = _require_numpy()
+        # Spasi/baris baru berurutan diringkas menjadi satu spasi
+        codes = encode_text(" ".join(corpus.split())).astype(np.int64)
+        size = ALPHABET_SIZE
+        idx = ((codes[:-3] * size + codes[1:-2]) * size + codes[2:-1]) * size
+        idx += codes[3:]
+        counts = np.bincount(idx, minlength=size**4)
+        total = float(len(idx))
+        floor = math.log10(0.01 / total)
+        table = np.full(size**4, floor, dtype=np.float32)
+        seen = counts > 0
+        table[seen] = np.log10(counts[seen] / total)
+        return cls(table, floor)
+
+    def score_batch(self, codes):
+        """
+        Rata-rata log10 peluang per quadgram untuk setiap baris ``codes``
+        (matriks kandidat x panjang teks). Makin besar makin mirip bahasa.
+        """
+        np = _require_numpy()
+        codes = codes.astype(np.int32)
+        size = ALPHABET_SIZE
+        idx = ((codes[:, :-3] * size + codes[:, 1:-2]) * size + codes[:, 2:-1]) * size
+        idx += codes[:, 3:]
+        return self.table[idx].sum(axis=1, dtype=np.float64) / max(idx.shape[1], 1)
+
+    def score(self, text: str) -> float:
+        """Skor (rata-rata per quadgram) untuk satu teks."""
+        if len(text) < 4:
+            return self.floor
+        return float(self.score_batch(encode_text(text)[None, :])[0])
+
+
+@lru_cache(maxsize=len(LANGUAGES))
+def load_scorer(language: str = "id") -> QuadgramScorer:
+    """Scorer dari korpus bawaan (dibangun sekali per proses)."""
+    if language not in LANGUAGES:
+        raise ValueError(f"Bahasa tidak dikenal: {language!r}. Pilihan: {LANGUAGES}")
+    with open(os.path.join(CORPUS_DIR, f"{language}.txt"), encoding="utf-8") as f:
+        return QuadgramScorer.from_text(f.read())
+
+
+class Candidate(NamedTuple):
+    """Kandidat kunci: skor, urutan kolom, dan plaintext hasil dekripsinya."""
+
+    score: float
+    order: tuple
+    plaintext: str = ""
+
+    @property
+    def num_cols(self) -> int:
+        return len(self.order)
+
+    @property
+    def key(self) -> str:
+        """Kunci numerik yang setara, siap dipakai ``decrypt_text(..., "numeric")``."""
+        return " ".join(str(col_idx + 1) for col_idx in self.order)
+
+
+class CrackReport(NamedTuple):
+    """Hasil pencarian: kandidat terbaik (urut skor) dan statistik kecepatan."""
+
+    candidates: list
+    keys_tested: int
+    elapsed: float
+    stopped_early: bool
+
+    @property
+    def best(self):
+        return self.candidates[0] if self.candidates else None
+
+    @property
+    def keys_per_second(self) -> float:
+        return self.keys_tested / self.elapsed if self.elapsed > 0 else 0.0
+
+
+class WidthScore(NamedTuple):
+    """
+    Peringkat satu lebar kunci. ``score`` adalah z-score chi-kuadrat sebaran
+    kelas huruf per baris grid: makin negatif makin mungkin lebar yang benar.
+    """
+
+    num_cols: int
+    score: float
+    num_rows: int
+    full_grid: bool
+
+
+@lru_cache(maxsize=1)
+def _class_table():
+    """Kode alfabet skor -> kelas: 0 = vokal, 1 = konsonan, 2 = spasi/lainnya."""
+    np = _require_numpy()
+    table = np.ones(ALPHABET_SIZE, dtype=np.uint8)
+    table[[ord(c) - ord("A") for c in "AEIOU"]] = 0
+    table[[SPACE_CODE, OTHER_CODE]] = 2
+    return table
+
+
+def rank_widths(
+    ciphertext: str,
+    max_width: int = DETECT_MAX_WIDTH,
+    min_width: int = 2,
+    min_rows: int = 4,
+    full_grid_only: bool = False,
+) -> list:
+    """
+    Memperkirakan jumlah kolom kunci untuk ``min_width..max_width``.
+
+    Dengan lebar yang benar, setiap baris grid ``decrypt_text`` (karakter ke-r
+    dari tiap segmen ciphertext, apa pun urutan kolomnya) adalah potongan
+    plaintext yang berurutan, sehingga jumlah vokal/konsonan/spasi per baris
+    jauh lebih seragam daripada sebaran acak. Keseragaman diukur dengan
+    statistik chi-kuadrat yang dinormalisasi menjadi z-score; lebar yang
+    menghasilkan lebih banyak baris (bukan kelipatannya) mendapat z-score
+    lebih kuat. Satu pass vektor (reshape + sum) per lebar.
+
+    Lebar dengan kurang dari ``min_rows`` baris tidak dinilai (sampel terlalu
+    sedikit). ``full_grid_only``: hanya lebar yang membagi habis panjang ciphertext
+    (ciphertext ``encrypt_text`` dengan padding selalu memenuhi grid).
+    """
+    np = _require_numpy()
+    length = len(ciphertext)
+    classes = _class_table()[encode_text(ciphertext)]
+    freq = np.bincount(classes, minlength=3) / max(length, 1)
+    # Indikator uint8 per kelas yang muncul; kelas terakhir = sisa sel baris
+    present = np.flatnonzero(freq)
+    flags = [(classes == c).view(np.uint8) for c in present[:-1]]
+    freq = freq[present]
+
+    ranking = []
+    for num_cols in range(max(min_width, 2), max_width + 1):
+        num_rows = -(-length // num_cols)
+        if num_rows < min_rows or not flags:
+            break
+        if full_grid_only and length % num_cols:
+            continue
+        # Segmen penuh membentuk matriks (segmen x baris); sisa segmen terakhir
+        # (jika ciphertext tidak memenuhi grid) hanya mengisi baris awal
+        full = length // num_rows
+        tail = length - full * num_rows
+        # Setiap baris berisi ``full`` atau ``full + 1`` sel (tidak pernah kosong)
+        cells = np.full(num_rows, full, dtype=np.int64)
+        cells[:tail] += 1
+        inv_cells = 1.0 / cells
+        chi2, rest = 0.0, cells.copy()
+        for flag, p in zip(flags, freq):
+            observed = (
+                flag[: full * num_rows]
+                .reshape(full, num_rows)
+                .sum(axis=0, dtype=np.int64)
+            )
+            observed[:tail] += flag[full * num_rows :]
+            rest -= observed
+            chi2 += float(((observed - cells * p) ** 2 @ inv_cells)) / p
+        chi2 += float(((rest - cells * freq[-1]) ** 2 @ inv_cells)) / freq[-1]
+        dof = num_rows * len(flags)
+        score = (chi2 - dof) / math.sqrt(2 * dof)
+        ranking.append(
+            WidthScore(num_cols, float(score), num_rows, length % num_cols == 0)
+        )
+    # Skor sama (segmen terakhir kosong) -> utamakan grid penuh, lalu lebar kecil
+    ranking.sort(key=lambda w: (w.score, not w.full_grid, w.num_cols))
+    return ranking
+
+
+def _prefix_length(num_cols: int) -> int:
+    """Panjang prefix urutan kolom agar tiap tugas <= TASK_PERMUTATIONS."""
+    depth = 0
+    while depth < num_cols and math.factorial(num_cols - depth) > TASK_PERMUTATIONS:
+        depth += 1
+    return depth
+
+
+def _tasks(widths) -> list:
+    """Tugas ``(num_cols, prefix)``; lebar kecil dikerjakan lebih dulu."""
+    return [
+        (num_cols, prefix)
+        for num_cols in widths
+        for prefix in itertools.permutations(range(num_cols), _prefix_length(num_cols))
+    ]
+
+
+class _Searcher:
+    """
+    Penilai kandidat untuk satu ciphertext. Geometri grid sama dengan
+    ``TranspositionPlan.decrypt_str``: segmen ke-k ciphertext (panjang
+    ``num_rows``) mengisi kolom ``order[k]``; sel di luar ciphertext kosong.
+    """
+
+    def __init__(self, codes, scorer, top: int, stop_score, max_width):
+        np = _require_numpy()
+        self.length = len(codes)
+        # Sel kosong menunjuk ke sentinel di akhir ciphertext
+        self.codes = np.append(codes, np.uint8(OTHER_CODE))
+        self.scorer = scorer
+        self.top = top
+        self.stop_score = stop_score
+        # Nilai bersama antar proses: tugas dengan lebar di atasnya dihentikan
+        self.max_width = max_width
+
+    def _geometry(self, num_cols: int):
+        np = _numpy()
+        num_rows = -(-self.length // num_cols)
+        cells = np.arange(num_rows * num_cols)
+        return num_rows, cells % num_cols, cells // num_cols
+
+    def _keep(self, best: list, item) -> None:
+        if len(best) < self.top:
+            heapq.heappush(best, item)
+        else:
+            heapq.heappushpop(best, item)
+
+    def _active(self, num_cols: int) -> bool:
+        return num_cols <= self.max_width.value
+
+    def _reached(self, score: float, max_width: int) -> bool:
+        """Jika skor melewati ambang, lebar > ``max_width`` tidak dicoba lagi."""
+        if self.stop_score is None or score < self.stop_score:
+            return False
+        with self.max_width.get_lock():
+            self.max_width.value = min(self.max_width.value, max_width)
+        return True
+
+    def permutations(self, task) -> tuple:
+        """Brute force: (jumlah permutasi diuji, [(skor, order)], berhenti_dini)."""
+        np = _numpy()
+        num_cols, prefix = task
+        num_rows, col_of, row_of = self._geometry(num_cols)
+        rest = [c for c in range(num_cols) if c not in prefix]
+        perms = itertools.permutations(rest)
+        batch_size = max(1, BATCH_CELLS // (num_rows * num_cols))
+        ranks = np.arange(num_cols)
+
+        best, tested, stopped = [], 0, False
+        while self._active(num_cols):
+            chunk = list(itertools.islice(perms, batch_size))
+            if not chunk:
+                break
+            orders = np.empty((len(chunk), num_cols), dtype=np.intp)
+            orders[:, : len(prefix)] = prefix
+            orders[:, len(prefix) :] = chunk
+            # rank[b, col] = posisi segmen ciphertext untuk kolom col
+            rank = np.empty_like(orders)
+            rank[np.arange(len(chunk))[:, None], orders] = ranks
+            table = rank[:, col_of] * num_rows + row_of
+            np.minimum(table, self.length, out=table)
+            scores = self.scorer.score_batch(self.codes[table])
+            tested += len(chunk)
+
+            keep = min(self.top, len(chunk))
+            for b in np.argpartition(-scores, keep - 1)[:keep]:
+                self._keep(best, (float(scores[b]), tuple(int(c) for c in orders[b])))
+            # Lebar ini tetap diselesaikan; hanya lebar yang lebih besar dilewati
+            stopped = self._reached(max(best)[0], num_cols)
+        return tested, best, stopped
+
+    def anneal(self, task) -> tuple:
+        """
+        Simulated annealing atas susunan segmen per kolom grid. Skor teks
+        adalah jumlah skor "jendela" quadgram per kolom awal; setiap langkah
+        (tukar dua kolom, balik atau geser blok kolom) hanya menghitung ulang
+        jendela yang menyentuh kolom yang berubah.
+        """
+        num_cols, seed, iterations, initial = task
+        windows = _Windows(self, num_cols)
+        rng = random.Random(seed)
+        if initial is None:
+            layout = list(range(num_cols))
+            rng.shuffle(layout)
+        else:
+            layout = _invert(initial)
+        scores = windows.score(layout, range(num_cols))
+        current = float(scores.sum())
+
+        temperature = ANNEAL_START_TEMPERATURE * windows.num_rows
+        cooling = (ANNEAL_END_TEMPERATURE / ANNEAL_START_TEMPERATURE) ** (
+            1 / max(iterations, 1)
+        )
+        best = []
+        best_score, best_layout = current, list(layout)
+        tested, stopped = 0, False
+        for step in range(iterations):
+            candidate, changed = _move(layout, rng)
+            affected = windows.affected(changed)
+            new_scores = windows.score(candidate, affected)
+            delta = float(new_scores.sum() - scores[affected].sum())
+            tested += 1
+            if delta >= 0 or rng.random() < math.exp(delta / temperature):
+                layout = candidate
+                scores[affected] = new_scores
+                current += delta
+                if current > best_score:
+                    best_score, best_layout = current, list(layout)
+            temperature *= cooling
+
+            if step % ANNEAL_CHECK_INTERVAL == 0:
+                if not self._active(num_cols):
+                    break
+                # Restart lain (lebar sama) ikut dihentikan
+                if self._reached(best_score / windows.num_quadgrams, num_cols - 1):
+                    stopped = True
+                    break
+
+        # Skor akhir dihitung ulang penuh (tanpa akumulasi galat float)
+        final = float(windows.score(best_layout, range(num_cols)).sum())
+        self._keep(best, (final / windows.num_quadgrams, tuple(_invert(best_layout))))
+        return tested, best, stopped or self._reached(best[0][0], num_cols - 1)
+
+
+def _invert(perm) -> list:
+    """``order`` (kolom per segmen) <-> susunan (segmen per kolom grid)."""
+    inverse = [0] * len(perm)
+    for idx, value in enumerate(perm):
+        inverse[value] = idx
+    return inverse
+
+
+def _move(layout: list, rng) -> tuple:
+    """Langkah acak: tukar dua kolom, balik blok, atau tukar dua blok bersebelahan."""
+    num_cols = len(layout)
+    a, b = sorted(rng.sample(range(num_cols), 2))
+    candidate = list(layout)
+    kind = rng.random()
+    if kind < 0.4:
+        candidate[a], candidate[b] = candidate[b], candidate[a]
+        return candidate, (a, b)
+    if kind < 0.6:
+        candidate[a : b + 1] = candidate[a : b + 1][::-1]
+    else:
+        # Blok a..a+k-1 dipindah ke belakang blok a+k..b (rotasi)
+        k = rng.randint(1, b - a)
+        candidate[a : b + 1] = candidate[a + k : b + 1] + candidate[a : a + k]
+    return candidate, range(a, b + 1)
+
+
+class _Windows:
+    """
+    Skor quadgram per kolom awal ``j``: jumlah log10 peluang quadgram yang
+    dimulai di kolom ``j`` pada setiap baris. Quadgram di ujung baris
+    melanjutkan ke baris berikutnya, sehingga total seluruh jendela sama
+    dengan skor teks hasil dekripsi penuh.
+    """
+
+    def __init__(self, searcher: _Searcher, num_cols: int):
+        np = _numpy()
+        self.num_cols = num_cols
+        self.num_rows = num_rows = -(-searcher.length // num_cols)
+        self.table = searcher.scorer.table
+        shift = (num_cols + 2) // num_cols
+        # segs[s, r] = karakter ke-r segmen s; kolom tambahan = sentinel
+        cells = np.arange(num_cols)[:, None] * num_rows + np.arange(num_rows + shift)
+        cells[:, num_rows:] = searcher.length
+        self.segs = searcher.codes[np.minimum(cells, searcher.length)].astype(np.int32)
+        offsets = np.arange(num_cols)[:, None] + np.arange(4)
+        self.cols = offsets % num_cols
+        self.shifts = offsets // num_cols
+        # Baris yang quadgram-nya masih berada di dalam grid
+        self.mask = (
+            np.arange(num_rows)[None, :] + self.shifts[:, 3:4] < num_rows
+        ).astype(np.float64)
+        self.num_quadgrams = max(int(self.mask.sum()), 1)
+        self.rows = np.arange(num_rows)
+
+    def affected(self, changed):
+        """Kolom awal jendela yang memuat salah satu kolom ``changed``."""
+        np = _numpy()
+        starts = {(col - t) % self.num_cols for col in changed for t in range(4)}
+        return np.fromiter(starts, dtype=np.intp, count=len(starts))
+
+    def score(self, layout, starts):
+        np = _numpy()
+        starts = np.asarray(starts, dtype=np.intp)
+        segs = np.asarray(layout, dtype=np.intp)[self.cols[starts]]
+        rows = self.shifts[starts][:, :, None] + self.rows
+        codes = self.segs[segs[:, :, None], rows]
+        size = ALPHABET_SIZE
+        idx = ((codes[:, 0] * size + codes[:, 1]) * size + codes[:, 2]) * size
+        idx += codes[:, 3]
+        return (self.table[idx] * self.mask[starts]).sum(axis=1)
+
+
+# State per proses worker (diisi oleh initializer pool)
+_SEARCHER = None
+
+
+def _init_worker(codes, language, top, stop_score, max_width):
+    global _SEARCHER
+    _SEARCHER = _Searcher(codes, load_scorer(language), top, stop_score, max_width)
+
+
+def _run_task(method, task):
+    return getattr(_SEARCHER, method)(task)
+
+
+def _candidates(ciphertext: str, best, top: int) -> list:
+    from src.cipher import ColumnarTransposition
+
+    result = []
+    for score, order in sorted(set(best), reverse=True)[:top]:
+        key = " ".join(str(col_idx + 1) for col_idx in order)
+        dec = ColumnarTransposition.decrypt_text(ciphertext, key, "numeric", False)
+        result.append(Candidate(score, order, dec.plaintext))
+    return result
+
+
+def _search(
+    ciphertext, method, tasks, total, language, workers, top, stop_score, progress
+):
+    """
+    Menjalankan ``tasks`` dengan metode ``_Searcher`` di process pool (atau
+    di proses ini jika ``workers == 1``) dan menggabungkan kandidat terbaik.
+    """
+    workers = workers or os.cpu_count() or 1
+    codes = encode_text(ciphertext)
+
+    start = time.perf_counter()
+    best, tested, stopped = [], 0, False
+
+    def collect(result):
+        nonlocal best, tested, stopped
+        task_tested, task_best, task_stopped = result
+        tested += task_tested
+        stopped = stopped or task_stopped
+        best = heapq.nlargest(top, set(best) | set(task_best))
+        if progress is not None:
+            # Tugas yang dilewati (lebar di atas batas) tidak membawa kandidat
+            leader = _candidates(ciphertext, best, 1)[0] if best else None
+            progress(tested, total, leader)
+
+    # Server Streamlit multi-thread: fork bisa deadlock pada lock milik
+    # thread lain, jadi worker selalu dibuat dengan spawn
+    ctx = multiprocessing.get_context("spawn")
+    max_width = ctx.Value("i", max(task[0] for task in tasks) if tasks else 0)
+    if workers == 1 or len(tasks) == 1:
+        searcher = _Searcher(codes, load_scorer(language), top, stop_score, max_width)
+        for task in tasks:
+            if searcher._active(task[0]):
+                collect(getattr(searcher, method)(task))
+    else:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=ctx,
+            initializer=_init_worker,
+            initargs=(codes, language, top, stop_score, max_width),
+        ) as pool:
+            futures = {pool.submit(_run_task, method, task): task for task in tasks}
+            for future in as_completed(futures):
+                if future.cancelled():
+                    continue
+                collect(future.result())
+                for pending, task in futures.items():
+                    if task[0] > max_width.value:
+                        pending.cancel()
+
+    elapsed = time.perf_counter() - start
+    return CrackReport(_candidates(ciphertext, best, top), tested, elapsed, stopped)
+
+
+def brute_force(
+    ciphertext: str,
+    max_width: int = 8,
+    min_width: int = 2,
+    language: str = "id",
+    workers: int = None,
+    top: int = 5,
+    stop_score: float = DEFAULT_STOP_SCORE,
+    progress=None,
+) -> CrackReport:
+    """
+    Mencoba semua urutan kolom untuk lebar ``min_width..max_width``.
+
+    ``workers``: jumlah proses (default jumlah CPU; 1 = tanpa pool).
+    ``stop_score``: begitu ada kandidat dengan skor (rata-rata log10 per
+    quadgram) >= nilai ini, lebar tersebut diselesaikan lalu lebar yang
+    lebih besar dilewati; None = coba semua. Lebar kecil dicoba lebih dulu.
+    ``progress(tested, total, best)``: callback opsional per tugas selesai,
+    ``best`` adalah ``Candidate`` terbaik sejauh ini (None jika belum ada).
+    """
+    if max_width > MAX_BRUTE_FORCE_WIDTH:
+        raise ValueError(
+            f"Lebar kunci maksimal untuk brute force adalah {MAX_BRUTE_FORCE_WIDTH}."
+        )
+    widths = range(max(min_width, 2), min(max_width, len(ciphertext)) + 1)
+    total = sum(math.factorial(w) for w in widths)
+    return _search(
+        ciphertext,
+        "permutations",
+        _tasks(widths),
+        total,
+        language,
+        workers,
+        top,
+        stop_score,
+        progress,
+    )
+
+
+def anneal(
+    ciphertext: str,
+    num_cols: int = None,
+    restarts: int = 8,
+    iterations: int = ANNEAL_ITERATIONS,
+    language: str = "id",
+    workers: int = None,
+    top: int = 5,
+    stop_score: float = None,
+    progress=None,
+    initial_order=None,
+    seed: int = None,
+) -> CrackReport:
+    """
+    Pencarian stokastik urutan kolom untuk kunci panjang. Jika ``num_cols``
+    tidak diberikan, lebar teratas dari ``rank_widths`` yang dipakai.
+
+    Setiap restart adalah simulated annealing independen (dijalankan paralel
+    di process pool) dari susunan acak, atau dari ``initial_order`` (format
+    ``order`` milik ``get_key_metadata``) jika diberikan. Parameter lain sama
+    dengan ``brute_force``; ``progress`` dipanggil setiap restart selesai.
+    Dengan ``stop_score`` restart yang tersisa dihentikan begitu satu restart
+    melewati ambang; default None karena susunan yang hampir benar (mis.
+    satu blok kolom tertukar) juga bisa melewati ambang.
+    """
+    if num_cols is None:
+        ranking = rank_widths(ciphertext, max_width=DETECT_MAX_WIDTH)
+        if not ranking:
+            raise ValueError("Ciphertext terlalu pendek untuk memperkirakan lebar.")
+        num_cols = ranking[0].num_cols
+    if not 2 <= num_cols <= len(ciphertext):
+        raise ValueError("Jumlah kolom harus antara 2 dan panjang ciphertext.")
+    if initial_order is not None and sorted(initial_order) != list(range(num_cols)):
+        raise ValueError("initial_order harus permutasi 0..jumlah kolom - 1.")
+    rng = random.Random(seed)
+    initial = tuple(initial_order) if initial_order is not None else None
+    tasks = [
+        (num_cols, rng.getrandbits(32), iterations, initial) for _ in range(restarts)
+    ]
+    return _search(
+        ciphertext,
+        "anneal",
+        tasks,
+        restarts * iterations,
+        language,
+        workers,
+        top,
+        stop_score,
+        progress,
+    )
@@ -1,4 +1,12 @@
 import io
+import mmap
+import os
+import tempfile
+from contextlib import contextmanager
+
+from src import container
+from src.cache import RESULTS, digest
+from src.cipher import DEFAULT_BLOCK_SIZE, DEFAULT_BUFFER_SIZE, ColumnarTransposition
 
 
 class FileHandler:
@@ -6,6 +14,22 @@ class FileHandler:
     Menangani input/output file byte-per-byte.
     """
 
+    # Ukuran buffer stripe untuk pemrosesan streaming
+    STREAM_BUFFER_SIZE = DEFAULT_BUFFER_SIZE
+
+    # Ukuran blok dan jumlah thread untuk format container
+    BLOCK_SIZE = DEFAULT_BLOCK_SIZE
+    BLOCK_WORKERS = os.cpu_count() or 1
+
+    ACTIONS = ("encrypt", "decrypt")
+
+    @staticmethod
+    def _check_action(action: str):
+        if action not in FileHandler.ACTIONS:
+            raise ValueError(
+                f"Aksi tidak dikenal: {action!r}. Pilihan: {FileHandler.ACTIONS}"
+            )
+
     @staticmethod
     def read_file(uploaded_file):
         """Membaca Streamlit UploadedFile sebagai bytes."""
@@ -13,6 +37,210 @@ class FileHandler:
             return uploaded_file.getvalue()
         return None
 
+    @staticmethod
+    def read_sample(uploaded_file, size: int = 50, offset: int = 0) -> bytes:
+        """Membaca ``size`` byte mulai ``offset`` tanpa memuat seluruh file."""
+        if uploaded_file is None:
+            return b""
+        uploaded_file.seek(offset)
+        sample = uploaded_file.read(size)
+        uploaded_file.seek(0)
+        return sample
+
+    @staticmethod
+    @contextmanager
+    def buffer_view(uploaded_file):
+        """memoryview (zero-copy) atas isi UploadedFile/BytesIO."""
+        view = uploaded_file.getbuffer()
+        try:
+            yield view
+        finally:
+            view.release()
+
+    @staticmethod
+    def get_size(file_obj) -> int:
+        """Ukuran file-like dalam byte (tanpa membaca isinya)."""
+        size = getattr(file_obj, "size", None)
+        if size is not None:
+            return size
+        pos = file_obj.tell()
+        end = file_obj.seek(0, io.SEEK_END)
+        file_obj.seek(pos)
+        return end
+
+    @staticmethod
+    def create_output_buffer():
+        """
+        File sementara (seekable) sebagai tujuan hasil streaming. Tanpa buffer
+        (``io.FileIO``) agar bisa langsung diberikan ke ``st.download_button``.
+        """
+        return tempfile.TemporaryFile(buffering=0)
+
+    @staticmethod
+    @contextmanager
+    def map_file(path, size: int = None):
+        """
+        Membuka file sebagai mmap. Tanpa ``size`` file dibuka read-only;
+        dengan ``size`` file dibuat/diubah ukurannya dan dipetakan writable.
+        """
+        if size is None:
+            with open(path, "rb") as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as view:
+                    yield view
+        else:
+            with open(path, "w+b") as f:
+                f.truncate(size)
+                with mmap.mmap(f.fileno(), size, access=mmap.ACCESS_WRITE) as view:
+                    yield view
+
+    @staticmethod
+    def transform_file(
+        src_path,
+        dst_path,
+        key: str,
+        key_mode: str = "text",
+        action: str = "encrypt",
+        engine: str = "auto",
+        use_container: bool = True,
+    ) -> int:
+        """
+        Enkripsi/dekripsi file di disk melalui mmap: engine membaca dan menulis
+        langsung ke view yang dipetakan, tanpa objek ``bytes`` seukuran file.
+        Mengembalikan ukuran file hasil.
+
+        Enkripsi menulis format container (lihat ``src.container``) kecuali
+        ``use_container=False``; dekripsi mengenali container dari magic-nya
+        dan mengembalikan panjang asli, file lain didekripsi sebagai
+        ciphertext mentah. ``action`` selain "encrypt"/"decrypt" ditolak
+        dengan ``ValueError``.
+        """
+        FileHandler._check_action(action)
+        with open(src_path, "rb") as f:
+            length = f.seek(0, io.SEEK_END)
+
+        plan = ColumnarTransposition.get_plan(key, key_mode, length)
+        if length == 0 or plan is None:
+            open(dst_path, "wb").close()
+            return 0
+
+        with FileHandler.map_file(src_path) as src_view:
+            if use_container and action == "encrypt":
+                return FileHandler._pack_file(src_view, dst_path, key, key_mode, engine)
+            if action == "decrypt" and container.is_container(src_view):
+                return FileHandler._unpack_file(
+                    src_view, dst_path, key, key_mode, engine
+                )
+            out_size = plan.total_len if action == "encrypt" else plan.length
+            with FileHandler.map_file(dst_path, out_size) as dst_view:
+                if action == "encrypt":
+                    plan.encrypt_into(src_view, dst_view, engine)
+                else:
+                    plan.decrypt_into(src_view, dst_view, engine)
+                dst_view.flush()
+        return out_size
+
+    @staticmethod
+    def _pack_file(src_view, dst_path, key, key_mode, engine) -> int:
+        block_size = FileHandler.BLOCK_SIZE
+        out_size = container.container_size(len(src_view), key, key_mode, block_size)
+        with FileHandler.map_file(dst_path, out_size) as dst_view:
+            container.pack_into(
+                src_view,
+                dst_view,
+                key,
+                key_mode,
+                block_size,
+                engine,
+                FileHandler.BLOCK_WORKERS,
+            )
+            dst_view.flush()
+        return out_size
+
+    @staticmethod
+    def _unpack_file(src_view, dst_path, key, key_mode, engine) -> int:
+        reader = container.ContainerReader(src_view, key, key_mode, engine)
+        if reader.length == 0:
+            open(dst_path, "wb").close()
+            return 0
+        with FileHandler.map_file(dst_path, reader.length) as dst_view:
+            reader.decrypt_into(dst_view, FileHandler.BLOCK_WORKERS)
+            dst_view.flush()
+        return reader.length
+
+    @staticmethod
+    def digest(uploaded_file) -> str:
+        """Digest isi UploadedFile/BytesIO tanpa menyalin isinya."""
+        with FileHandler.buffer_view(uploaded_file) as view:
+            return digest(view)
+
+    @staticmethod
+    def transform_upload(
+        uploaded_file,
+        key: str,
+        key_mode: str = "text",
+        action: str = "encrypt",
+        use_container: bool = True,
+    ):
+        """
+        Enkripsi/dekripsi UploadedFile secara streaming. Hasil disimpan di
+        cache berdasarkan digest isi file + kunci, sehingga proses ulang input
+        yang sama langsung diambil dari cache. Mengembalikan ``(output, ukuran)``;
+        ``output`` berupa bytes, atau file sementara jika terlalu besar untuk cache.
+        Format container dan validasi ``action`` sama seperti ``transform_file``.
+        """
+        FileHandler._check_action(action)
+        cache_key = (
+            "file",
+            action,
+            FileHandler.digest(uploaded_file),
+            key,
+            key_mode,
+            use_container,
+        )
+        cached = RESULTS.get(cache_key)
+        if cached is not None:
+            return cached, len(cached)
+
+        file_size = FileHandler.get_size(uploaded_file)
+        output_file = FileHandler.create_output_buffer()
+        uploaded_file.seek(0)
+        if file_size and use_container and action == "encrypt":
+            result_size = container.write_container(
+                uploaded_file,
+                output_file,
+                key,
+                key_mode,
+                length=file_size,
+                block_size=FileHandler.BLOCK_SIZE,
+                workers=FileHandler.BLOCK_WORKERS,
+            )
+        elif action == "decrypt" and container.is_container(uploaded_file):
+            with FileHandler.buffer_view(uploaded_file) as view:
+                reader = container.ContainerReader(view, key, key_mode)
+                result_size = reader.decrypt_to(output_file, FileHandler.BLOCK_WORKERS)
+        else:
+            stream = (
+                ColumnarTransposition.encrypt_stream
+                if action == "encrypt"
+                else ColumnarTransposition.decrypt_stream
+            )
+            result_size = stream(
+                uploaded_file,
+                output_file,
+                key,
+                key_mode,
+                length=file_size,
+                buffer_size=FileHandler.STREAM_BUFFER_SIZE,
+            )
+        output_file.seek(0)
+        if result_size > RESULTS.max_entry_bytes:
+            return output_file, result_size
+
+        output = output_file.read()
+        output_file.close()
+        RESULTS.put(cache_key, output, len(output))
+        return output, result_size
+
     @staticmethod
     def create_download_link(data: bytes, filename: str):
         return io.BytesIO(data)
@@ -0,0 +1,310 @@
+"""
+Kompilasi kunci transposisi: validasi dan parsing dilakukan sekali per
+(kunci, mode), hasilnya ``CompiledKey`` yang immutable dan hashable, lalu
+disimpan di cache LRU. Dipakai bersama oleh ``utils.validate_key`` dan
+seluruh metode ``ColumnarTransposition``.
+
+Kunci lebar (ribuan hingga jutaan kolom, mis. diturunkan dari hash) dapat
+diberikan langsung sebagai array/buffer. Urutan kolomnya dihitung dengan
+argsort stabil dan disimpan sebagai ``array`` (4 byte per kolom), tanpa
+objek Python per kolom.
+"""
+
+import hashlib
+import re
+import threading
+from array import array
+from collections import OrderedDict
+from collections.abc import Sequence
+from functools import lru_cache
+from typing import NamedTuple
+
+# Jumlah kunci terkompilasi yang disimpan di cache LRU
+KEY_CACHE_SIZE = 256
+
+# Di atas jumlah kolom ini urutan disimpan sebagai array, bukan tuple
+WIDE_KEY_COLUMNS = 4096
+
+# Jumlah kunci array (kunci lebar) terkompilasi yang disimpan; urutannya
+# bisa berukuran megabyte sehingga cache dibuat kecil
+ARRAY_KEY_CACHE_SIZE = 16
+
+_NUMERIC_CHARS = re.compile(r"[\d\s,]+")
+_SEPARATOR = re.compile(r"[\s,]")
+_NUMBER = re.compile(r"\d+")
+_DIGIT = re.compile(r"\d")
+
+
+class ColumnLabels(Sequence):
+    """Label kolom "1".."N" yang dihitung saat diakses (tanpa N objek str)."""
+
+    __slots__ = ("count",)
+
+    def __init__(self, count: int):
+        self.count = count
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return [str(i + 1) for i in range(*idx.indices(self.count))]
+        if idx < 0:
+            idx += self.count
+        if not 0 <= idx < self.count:
+            raise IndexError("Indeks kolom di luar jangkauan.")
+        return str(idx + 1)
+
+    def __eq__(self, other):
+        if isinstance(other, ColumnLabels):
+            return self.count == other.count
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(("ColumnLabels", self.count))
+
+
+class CompiledKey(NamedTuple):
+    """
+    Kunci terkompilasi. ``order`` kosong jika kunci tidak bisa dipakai cipher;
+    ``error`` berisi pesan validasi untuk UI ("" jika valid). Kesetaraan dan
+    hash ditentukan oleh ``(key, mode)``; untuk kunci array ``key`` berisi
+    digest isinya.
+    """
+
+    key: str
+    mode: str
+    order: Sequence
+    display_key: Sequence
+    error: str
+
+    @property
+    def num_cols(self) -> int:
+        return len(self.order)
+
+    @property
+    def valid(self) -> bool:
+        return not self.error
+
+    def __eq__(self, other):
+        if not isinstance(other, CompiledKey):
+            return NotImplemented
+        return (self.key, self.mode) == (other.key, other.mode)
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    def __hash__(self) -> int:
+        return hash((self.key, self.mode))
+
+
+def _numpy():
+    from src.cipher import _numpy
+
+    return _numpy()
+
+
+def _pack_order(order) -> Sequence:
+    """Tuple untuk kunci biasa, ``array('I')`` untuk kunci lebar."""
+    if len(order) <= WIDE_KEY_COLUMNS:
+        return tuple(int(i) for i in order)
+    if hasattr(order, "astype"):
+        packed = array("I")
+        packed.frombytes(order.astype("uint32").tobytes())
+        return packed
+    return array("I", order)
+
+
+def _is_permutation(numbers) -> bool:
+    """``numbers`` adalah permutasi 1..N."""
+    num_cols = len(numbers)
+    if num_cols == 0:
+        return False
+    if hasattr(numbers, "dtype"):
+        np = _numpy()
+        if numbers.min() < 1 or numbers.max() > num_cols:
+            return False
+        return bool(np.bincount(numbers, minlength=num_cols + 1)[1:].all())
+    return set(numbers) == set(range(1, num_cols + 1))
+
+
+def parse_numeric_key(key_str: str) -> list[int]:
+    """
+    Memparsing kunci numerik. Mendukung format spasi/koma "4 1 3 2"
+    maupun format sambung "4132" (setiap digit satu kolom).
+    """
+    if not _SEPARATOR.search(key_str):
+        return [int(n) for n in _DIGIT.findall(key_str)]
+    if _NUMERIC_CHARS.fullmatch(key_str):
+        # Jalur cepat: hanya angka dan pemisah, cukup split tanpa regex
+        return list(map(int, key_str.replace(",", " ").split()))
+    return [int(n) for n in _NUMBER.findall(key_str)]
+
+
+def _parse_numbers(key_str: str):
+    """
+    Seperti ``parse_numeric_key``; kunci lebar yang hanya berisi angka dan
+    pemisah diparsing langsung menjadi ndarray oleh numpy (tanpa list int).
+    """
+    # numpy hanya di-import untuk kunci lebar
+    if (
+        len(key_str) > WIDE_KEY_COLUMNS
+        and _numpy() is not None
+        and _SEPARATOR.search(key_str)
+        and _NUMERIC_CHARS.fullmatch(key_str)
+    ):
+        try:
+            return _numpy().array(key_str.replace(",", " ").split(), dtype="int64")
+        except OverflowError:
+            # Angka di luar int64 pasti bukan bagian permutasi 1..N
+            pass
+    return parse_numeric_key(key_str)
+
+
+def _numeric_order(numbers) -> Sequence:
+    """Urutan kolom dari permutasi 1..N; tuple kosong jika bukan permutasi."""
+    if len(numbers) > WIDE_KEY_COLUMNS and _numpy() is not None:
+        try:
+            numbers = _numpy().asarray(numbers, dtype="int64")
+        except OverflowError:
+            return ()
+    if not _is_permutation(numbers):
+        return ()
+    if hasattr(numbers, "dtype"):
+        return _pack_order(numbers - 1)
+    return _pack_order([k - 1 for k in numbers])
+
+
+def _stable_argsort(values) -> Sequence:
+    """Indeks yang mengurutkan ``values`` secara stabil (duplikat tetap urut)."""
+    if hasattr(values, "dtype"):
+        return _pack_order(_numpy().argsort(values, kind="stable"))
+    return _pack_order(sorted(range(len(values)), key=values.__getitem__))
+
+
+def _text_order(key: str) -> Sequence:
+    # Urutan alfabet (tanpa membedakan huruf besar/kecil), stabil untuk duplikat
+    upper = key.upper()
+    if len(upper) == len(key) and key.isascii():
+        if len(key) > WIDE_KEY_COLUMNS and _numpy() is not None:
+            codes = _numpy().frombuffer(upper.encode("ascii"), dtype="uint8")
+            return _stable_argsort(codes)
+        return _stable_argsort(upper)
+    return _pack_order(sorted(range(len(key)), key=lambda i: key[i].upper()))
+
+
+def _display_labels(num_cols: int) -> Sequence:
+    if num_cols > WIDE_KEY_COLUMNS:
+        return ColumnLabels(num_cols)
+    return tuple(str(i) for i in range(1, num_cols + 1))
+
+
+def _validation_error(key: str, mode: str, numbers, order) -> str:
+    if not key:
+        return "Kunci tidak boleh kosong."
+
+    if mode == "text":
+        if not key.isalpha() and not key.isalnum():
+            return "Kunci text harus berupa alphanumeric."
+
+    elif mode == "numeric":
+        # ndarray dari _parse_numbers berarti karakter kunci sudah diperiksa
+        if not hasattr(numbers, "dtype") and not _NUMERIC_CHARS.fullmatch(key):
+            return "Kunci numerik hanya boleh berisi angka."
+        if len(numbers) == 0:
+            return "Tidak ditemukan angka pada kunci."
+        if not order:
+            num_cols = len(numbers)
+            return f"Kunci Numerik harus berupa permutasi angka 1 sampai {num_cols}. (Tidak boleh ada angka yang hilang atau duplikat)"
+
+    return ""
+
+
+@lru_cache(maxsize=KEY_CACHE_SIZE)
+def _compile(key: str, mode: str) -> CompiledKey:
+    if mode == "numeric":
+        numbers = _parse_numbers(key)
+        order = _numeric_order(numbers)
+        display_key = _display_labels(len(order))
+    else:
+        numbers = None
+        order = _text_order(key)
+        display_key = key if len(key) > WIDE_KEY_COLUMNS else tuple(key)
+    error = _validation_error(key, mode, numbers, order)
+    return CompiledKey(key, mode, order, display_key, error)
+
+
+def _key_values(values):
+    """Nilai kunci array sebagai ndarray (jika numpy tersedia) atau list."""
+    np = _numpy()
+    if isinstance(values, (bytes, bytearray)):
+        return np.frombuffer(values, dtype="uint8") if np is not None else values
+    if np is not None:
+        return np.asarray(values)
+    return list(values)
+
+
+_ARRAY_KEYS = OrderedDict()
+_ARRAY_KEYS_LOCK = threading.Lock()
+
+
+def _array_key_label(values) -> str:
+    """Label unik kunci array: jumlah kolom + digest isinya."""
+    fingerprint = hashlib.blake2b(digest_size=16)
+    if hasattr(values, "dtype"):
+        fingerprint.update(str(values.dtype).encode())
+        fingerprint.update(values.tobytes())
+    else:
+        fingerprint.update(repr(list(values)).encode())
+    return f"<array {len(values)} kolom {fingerprint.hexdigest()}>"
+
+
+def _compile_values(values, key: str, mode: str) -> CompiledKey:
+    if mode == "numeric":
+        if hasattr(values, "dtype"):
+            values = values.astype("int64")
+        order = _numeric_order(values)
+        error = "" if order else "Array kunci harus berupa permutasi 1 sampai N."
+    else:
+        order = _stable_argsort(values)
+        error = "" if len(order) else "Kunci tidak boleh kosong."
+    return CompiledKey(key, mode, order, _display_labels(len(order)), error)
+
+
+def compile_permutation(values, mode: str = "numeric") -> CompiledKey:
+    """
+    Kompilasi kunci lebar dari array/buffer (list, ``array``, bytes, ndarray).
+
+    ``mode="numeric"``: ``values`` adalah permutasi 1..N, sama seperti kunci
+    numerik "4 1 3 2". Mode lain: ``values`` diperlakukan seperti huruf kunci
+    teks, urutan kolom = argsort stabil dari nilainya.
+
+    Hasil di-cache berdasarkan digest isi array, sehingga pemanggilan ulang
+    dengan kunci yang sama hanya menghitung digest (tanpa validasi/argsort).
+    """
+    values = _key_values(values)
+    key = _array_key_label(values)
+    with _ARRAY_KEYS_LOCK:
+        compiled = _ARRAY_KEYS.get((key, mode))
+        if compiled is not None:
+            _ARRAY_KEYS.move_to_end((key, mode))
+            return compiled
+    compiled = _compile_values(values, key, mode)
+    with _ARRAY_KEYS_LOCK:
+        _ARRAY_KEYS[(key, mode)] = compiled
+        while len(_ARRAY_KEYS) > ARRAY_KEY_CACHE_SIZE:
+            _ARRAY_KEYS.popitem(last=False)
+    return compiled
+
+
+def compile_key(key, mode: str = "text") -> CompiledKey:
+    """
+    Mengompilasi kunci (dengan cache). ``CompiledKey`` dikembalikan apa adanya;
+    kunci berupa array/buffer dikompilasi lewat ``compile_permutation``.
+    """
+    if isinstance(key, CompiledKey):
+        return key
+    if isinstance(key, str):
+        return _compile(key, mode)
+    return compile_permutation(key, mode)
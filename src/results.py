@@ -0,0 +1,185 @@
+"""
+Objek hasil enkripsi/dekripsi yang ringkas untuk disimpan di session state.
+
+Hanya input ringkas yang disimpan (teks/bytes dan urutan kolom sebagai
+``array``); grid dan langkah visualisasi dihitung sebagai properti. Objek
+tetap bisa diakses seperti dict (``res["ciphertext"]``, ``res.get(...)``)
+sehingga kode view tidak perlu berubah.
+"""
+
+import sys
+from array import array
+
+from src.keys import ColumnLabels
+from src.steps import LazyGrid, StepSequence
+
+
+def _compact_order(order) -> array:
+    # "I" (unsigned int) cukup untuk indeks kolom
+    return order if isinstance(order, array) else array("I", order)
+
+
+class _Result:
+    """Basis hasil: akses gaya dict atas atribut yang terdaftar di ``FIELDS``."""
+
+    __slots__ = ("_order", "_display_key", "with_steps")
+
+    FIELDS = ()
+    STEP_FIELDS = ("grid", "fill_steps", "read_steps")
+
+    def __init__(self, order, display_key, with_steps: bool = True):
+        self._order = _compact_order(order)
+        # Label kunci lebar (str/ColumnLabels) disimpan apa adanya
+        if not isinstance(display_key, (tuple, str, ColumnLabels)):
+            display_key = tuple(display_key)
+        self._display_key = display_key
+        self.with_steps = with_steps
+
+    @property
+    def order(self) -> list[int]:
+        return list(self._order)
+
+    @property
+    def display_key(self) -> list[str]:
+        return list(self._display_key)
+
+    @property
+    def num_cols(self) -> int:
+        return len(self._order)
+
+    def keys(self) -> list[str]:
+        if self.with_steps:
+            return list(self.FIELDS + self.STEP_FIELDS)
+        return list(self.FIELDS)
+
+    def __contains__(self, name) -> bool:
+        return name in self.keys()
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __getitem__(self, name):
+        if name not in self.keys():
+            raise KeyError(name)
+        return getattr(self, name)
+
+    def get(self, name, default=None):
+        return self[name] if name in self.keys() else default
+
+    def __sizeof__(self) -> int:
+        return (
+            object.__sizeof__(self)
+            + sys.getsizeof(self._order)
+            + sys.getsizeof(self._display_key)
+        )
+
+    def _num_rows(self, length: int) -> int:
+        return -(-length // self.num_cols) if self.num_cols else 0
+
+
+class TextEncryptResult(_Result):
+    """Hasil ``encrypt_text``: menyimpan padded_text dan ciphertext."""
+
+    __slots__ = ("padded_text", "ciphertext")
+
+    FIELDS = ("ciphertext", "order", "padded_text", "display_key")
+
+    def __init__(self, ciphertext, padded_text, order, display_key, with_steps=True):
+        super().__init__(order, display_key, with_steps)
+        self.ciphertext = ciphertext
+        self.padded_text = padded_text
+
+    @property
+    def grid(self) -> LazyGrid:
+        num_rows = self._num_rows(len(self.padded_text))
+        return LazyGrid(self.padded_text, self._order, num_rows, "row", "")
+
+    @property
+    def fill_steps(self) -> StepSequence:
+        grid = self.grid
+        total = grid.num_rows * grid.num_cols
+        return StepSequence(grid, "row", min(len(self.padded_text), total))
+
+    @property
+    def read_steps(self) -> StepSequence:
+        grid = self.grid
+        return StepSequence(grid, "column", grid.num_rows * grid.num_cols)
+
+    def __sizeof__(self) -> int:
+        return (
+            super().__sizeof__()
+            + sys.getsizeof(self.padded_text)
+            + sys.getsizeof(self.ciphertext)
+        )
+
+
+class TextDecryptResult(_Result):
+    """Hasil ``decrypt_text``: menyimpan ciphertext dan plaintext mentah."""
+
+    __slots__ = ("ciphertext", "raw_plaintext")
+
+    FIELDS = ("plaintext", "raw_plaintext", "order", "display_key")
+
+    def __init__(self, ciphertext, raw_plaintext, order, display_key, with_steps=True):
+        super().__init__(order, display_key, with_steps)
+        self.ciphertext = ciphertext
+        self.raw_plaintext = raw_plaintext
+
+    @property
+    def plaintext(self) -> str:
+        return self.raw_plaintext.rstrip()
+
+    @property
+    def grid(self) -> LazyGrid:
+        num_rows = self._num_rows(len(self.ciphertext))
+        return LazyGrid(self.ciphertext, self._order, num_rows, "column", "")
+
+    @property
+    def fill_steps(self) -> StepSequence:
+        return StepSequence(self.grid, "column", len(self.ciphertext))
+
+    @property
+    def read_steps(self) -> StepSequence:
+        grid = self.grid
+        return StepSequence(grid, "row", grid.num_rows * grid.num_cols)
+
+    def __sizeof__(self) -> int:
+        return (
+            super().__sizeof__()
+            + sys.getsizeof(self.ciphertext)
+            + sys.getsizeof(self.raw_plaintext)
+        )
+
+
+class ByteStepsResult(_Result):
+    """Hasil ``get_byte_steps``: sampel bytes; sel padding bernilai None."""
+
+    __slots__ = ("data", "mode")
+
+    FIELDS = ("order", "display_key")
+
+    def __init__(self, data: bytes, order, display_key, mode: str = "encrypt"):
+        super().__init__(order, display_key)
+        self.data = bytes(data)
+        self.mode = mode
+
+    @property
+    def grid(self) -> LazyGrid:
+        layout = "row" if self.mode == "encrypt" else "column"
+        num_rows = self._num_rows(len(self.data))
+        return LazyGrid(self.data, self._order, num_rows, layout, None)
+
+    @property
+    def fill_steps(self) -> StepSequence:
+        grid = self.grid
+        traversal = "row" if self.mode == "encrypt" else "column"
+        return StepSequence(grid, traversal, grid.num_rows * grid.num_cols)
+
+    @property
+    def read_steps(self) -> StepSequence:
+        grid = self.grid
+        traversal = "column" if self.mode == "encrypt" else "row"
+        return StepSequence(grid, traversal, grid.num_rows * grid.num_cols)
+
+    def __sizeof__(self) -> int:
+        return super().__sizeof__() + sys.getsizeof(self.data)
@@ -0,0 +1,412 @@
+"""
+Layanan HTTP lokal (asyncio) untuk Columnar Transposition.
+
+Contoh:
+    python -m src.server --port 8080 --workers 4 --max-pending 16
+
+Endpoint:
+    GET  /health
+    POST /encrypt/text, /decrypt/text
+         body JSON {"text", "key", "key_mode", "padding_char"}
+    POST /encrypt/bytes, /decrypt/bytes?key=...&key_mode=...
+         body biner (Content-Length atau chunked), respons dikirim bertahap
+
+Transposisi dijalankan di thread pool terbatas agar event loop tetap
+responsif. Jika jumlah request yang sedang diproses/antre mencapai
+``max_pending``, request baru langsung ditolak dengan 503 (backpressure).
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from urllib.parse import parse_qs, urlsplit
+
+from src import container
+from src.cipher import DEFAULT_BUFFER_SIZE, ColumnarTransposition
+from src.utils import validate_key
+
+# Ukuran potongan baca/tulis body
+READ_CHUNK = 64 * 1024
+
+# Body biner disimpan di memori hingga ukuran ini, selebihnya di file sementara
+SPOOL_SIZE = 8 * 1024 * 1024
+
+# Batas ukuran body
+MAX_BODY_SIZE = 1024 * 1024 * 1024
+MAX_TEXT_BODY_SIZE = 16 * 1024 * 1024
+
+MAX_HEADER_LINES = 100
+
+STATUS_TEXT = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    411: "Length Required",
+    413: "Payload Too Large",
+    500: "Internal Server Error",
+    503: "Service Unavailable",
+}
+
+
+class HTTPError(Exception):
+    """Kesalahan yang dikirim ke klien sebagai respons JSON."""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+async def read_request_head(reader: asyncio.StreamReader):
+    """Membaca request line dan header. Mengembalikan (method, path, query, headers)."""
+    request_line = await reader.readline()
+    if not request_line:
+        raise ConnectionError("Koneksi ditutup klien")
+    try:
+        method, target, _ = request_line.decode("latin-1").split(" ", 2)
+    except ValueError:
+        raise HTTPError(400, "Request line tidak valid")
+
+    headers = {}
+    for _ in range(MAX_HEADER_LINES):
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    else:
+        raise HTTPError(400, "Header terlalu banyak")
+
+    url = urlsplit(target)
+    query = {name: values[0] for name, values in parse_qs(url.query).items()}
+    return method.upper(), url.path, query, headers
+
+
+async def iter_body(reader: asyncio.StreamReader, headers: dict, max_size: int):
+    """Membaca body per potongan (Content-Length atau chunked)."""
+    received = 0
+    if headers.get("transfer-encoding", "").lower() == "chunked":
+        while True:
+            size_line = await reader.readline()
+            try:
+                size = int(size_line.split(b";")[0].strip(), 16)
+            except ValueError:
+                raise HTTPError(400, "Chunk tidak valid")
+            if size == 0:
+                # Lewati trailer hingga baris kosong
+                while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                    pass
+                return
+            received += size
+            if received > max_size:
+                raise HTTPError(413, "Body terlalu besar")
+            while size > 0:
+                chunk = await reader.readexactly(min(size, READ_CHUNK))
+                size -= len(chunk)
+                yield chunk
+            await reader.readline()
+        return
+
+    if "content-length" not in headers:
+        raise HTTPError(411, "Content-Length atau chunked diperlukan")
+    try:
+        remaining = int(headers["content-length"])
+    except ValueError:
+        raise HTTPError(400, "Content-Length tidak valid")
+    if remaining > max_size:
+        raise HTTPError(413, "Body terlalu besar")
+    while remaining > 0:
+        chunk = await reader.readexactly(min(remaining, READ_CHUNK))
+        remaining -= len(chunk)
+        yield chunk
+
+
+def response_head(status: int, headers: dict) -> bytes:
+    lines = [f"HTTP/1.1 {status} {STATUS_TEXT.get(status, '')}"]
+    lines += [f"{name}: {value}" for name, value in headers.items()]
+    lines.append("Connection: close")
+    return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+
+
+async def send_json(writer: asyncio.StreamWriter, status: int, payload: dict, **extra):
+    body = json.dumps(payload).encode("utf-8")
+    headers = {"Content-Type": "application/json", "Content-Length": len(body)}
+    headers.update(extra)
+    writer.write(response_head(status, headers) + body)
+    await writer.drain()
+
+
+async def linger(reader, writer, limit: int = SPOOL_SIZE, timeout: float = 1.0):
+    """
+    Menutup sisi tulis lalu membuang sisa body yang belum dibaca, agar klien
+    sempat menerima respons error sebelum koneksi ditutup (tanpa RST).
+    """
+    if writer.can_write_eof():
+        writer.write_eof()
+
+    async def discard(remaining: int) -> None:
+        while remaining > 0:
+            chunk = await reader.read(READ_CHUNK)
+            if not chunk:
+                break
+            remaining -= len(chunk)
+
+    try:
+        await asyncio.wait_for(discard(limit), timeout)
+    except (asyncio.TimeoutError, ConnectionError):
+        pass
+
+
+def check_key(key, key_mode) -> None:
+    if key_mode not in ("text", "numeric"):
+        raise HTTPError(400, "key_mode harus 'text' atau 'numeric'")
+    valid, msg = validate_key(key, key_mode)
+    if not valid:
+        raise HTTPError(400, msg)
+
+
+def transform_text(action: str, payload: dict) -> dict:
+    """Enkripsi/dekripsi teks (dijalankan di worker pool)."""
+    text, key = payload["text"], payload["key"]
+    key_mode = payload.get("key_mode", "text")
+    if action == "encrypt":
+        result = ColumnarTransposition.encrypt_text(
+            text, key, payload.get("padding_char", "X"), key_mode, with_steps=False
+        )
+        return {"result": result["ciphertext"], "padded_text": result["padded_text"]}
+    result = ColumnarTransposition.decrypt_text(text, key, key_mode, with_steps=False)
+    return {"result": result["plaintext"], "raw_plaintext": result["raw_plaintext"]}
+
+
+def transform_spooled(
+    action: str, src, length: int, key: str, key_mode: str, buffer_size: int
+):
+    """Transposisi body yang sudah di-spool ke file output sementara."""
+    dst = tempfile.TemporaryFile()
+    src.seek(0)
+    if action == "encrypt":
+        size = ColumnarTransposition.encrypt_stream(
+            src, dst, key, key_mode, length, buffer_size
+        )
+    elif container.is_container(src):
+        reader = container.ContainerReader(src, key, key_mode)
+        size = reader.decrypt_to(dst)
+    else:
+        size = ColumnarTransposition.decrypt_stream(
+            src, dst, key, key_mode, length, buffer_size
+        )
+    dst.seek(0)
+    return dst, size
+
+
+class CipherServer:
+    """Server HTTP asyncio dengan worker pool terbatas dan backpressure."""
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 8080,
+        workers: int = None,
+        max_pending: int = None,
+        max_body_size: int = MAX_BODY_SIZE,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+    ):
+        self.host = host
+        self.port = port
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self.max_pending = max(1, max_pending or self.workers * 4)
+        self.max_body_size = max_body_size
+        self.buffer_size = buffer_size
+        self.pending = 0
+        self.executor = None
+        self.server = None
+
+    async def start(self) -> None:
+        self.executor = ThreadPoolExecutor(self.workers, thread_name_prefix="cipher")
+        self.server = await asyncio.start_server(
+            self.handle_connection, self.host, self.port
+        )
+        # Port 0 berarti port bebas dipilih OS
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def close(self) -> None:
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+        if self.executor is not None:
+            self.executor.shutdown(wait=True)
+
+    async def serve_forever(self) -> None:
+        await self.start()
+        try:
+            await self.server.serve_forever()
+        finally:
+            await self.close()
+
+    @contextmanager
+    def slot(self):
+        """Memesan tempat di antrean; 503 jika antrean penuh."""
+        if self.pending >= self.max_pending:
+            raise HTTPError(503, "Server sibuk, coba lagi nanti")
+        self.pending += 1
+        try:
+            yield
+        finally:
+            self.pending -= 1
+
+    async def run_job(self, fn, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, fn, *args)
+
+    async def handle_connection(self, reader, writer) -> None:
+        try:
+            method, path, query, headers = await read_request_head(reader)
+            await self.dispatch(method, path, query, headers, reader, writer)
+        except HTTPError as e:
+            extra = {"Retry-After": 1} if e.status == 503 else {}
+            await send_json(writer, e.status, {"error": e.message}, **extra)
+            await linger(reader, writer)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        except Exception as e:
+            await send_json(writer, 500, {"error": str(e)})
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def dispatch(self, method, path, query, headers, reader, writer) -> None:
+        if path == "/health":
+            await send_json(
+                writer,
+                200,
+                {
+                    "status": "ok",
+                    "pending": self.pending,
+                    "max_pending": self.max_pending,
+                },
+            )
+            return
+
+        action, _, kind = path.strip("/").partition("/")
+        if action not in ("encrypt", "decrypt") or kind not in ("text", "bytes"):
+            raise HTTPError(404, "Endpoint tidak ditemukan")
+        if method != "POST":
+            raise HTTPError(405, "Gunakan POST")
+
+        # Slot dipesan sebelum body dibaca agar request ditolak lebih awal
+        with self.slot():
+            if kind == "text":
+                await self.handle_text(action, headers, reader, writer)
+            else:
+                await self.handle_bytes(action, query, headers, reader, writer)
+
+    async def handle_text(self, action, headers, reader, writer) -> None:
+        body = bytearray()
+        async for chunk in iter_body(reader, headers, MAX_TEXT_BODY_SIZE):
+            body += chunk
+        try:
+            payload = json.loads(body)
+            text, key = payload["text"], payload["key"]
+        except (ValueError, KeyError, TypeError):
+            raise HTTPError(400, "Body harus JSON dengan field 'text' dan 'key'")
+        if not isinstance(text, str) or not isinstance(key, str):
+            raise HTTPError(400, "Field 'text' dan 'key' harus string")
+        padding_char = payload.get("padding_char", "X")
+        if not isinstance(padding_char, str) or len(padding_char) != 1:
+            raise HTTPError(400, "padding_char harus satu karakter")
+        check_key(key, payload.get("key_mode", "text"))
+        result = await self.run_job(transform_text, action, payload)
+        await send_json(writer, 200, result)
+
+    async def handle_bytes(self, action, query, headers, reader, writer) -> None:
+        key, key_mode = query.get("key", ""), query.get("key_mode", "text")
+        check_key(key, key_mode)
+
+        with tempfile.SpooledTemporaryFile(max_size=SPOOL_SIZE) as src:
+            length = 0
+            async for chunk in iter_body(reader, headers, self.max_body_size):
+                # Setelah rollover spool menulis ke disk: jangan blok event loop
+                await asyncio.to_thread(src.write, chunk)
+                length += len(chunk)
+
+            try:
+                dst, size = await self.run_job(
+                    transform_spooled,
+                    action,
+                    src,
+                    length,
+                    key,
+                    key_mode,
+                    self.buffer_size,
+                )
+            except ValueError as e:
+                # Container rusak atau kunci tidak cocok
+                raise HTTPError(400, str(e))
+
+        with dst:
+            writer.write(
+                response_head(
+                    200,
+                    {
+                        "Content-Type": "application/octet-stream",
+                        "Content-Length": size,
+                    },
+                )
+            )
+            while True:
+                chunk = await asyncio.to_thread(dst.read, READ_CHUNK)
+                if not chunk:
+                    break
+                writer.write(chunk)
+                await writer.drain()
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m src.server",
+        description="Layanan HTTP lokal untuk Columnar Transposition.",
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("-p", "--port", type=int, default=8080)
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=None,
+        help="Jumlah worker thread (default: jumlah CPU)",
+    )
+    parser.add_argument(
+        "--max-pending",
+        type=int,
+        default=None,
+        help="Batas request yang diproses/antre sebelum 503 (default: 4 x workers)",
+    )
+    return parser
+
+
+def main(argv: list[str] = None) -> int:
+    args = build_parser().parse_args(argv)
+    server = CipherServer(args.host, args.port, args.workers, args.max_pending)
+    print(
+        f"Melayani di http://{args.host}:{args.port} "
+        f"({server.workers} worker, antrean {server.max_pending})",
+        file=sys.stderr,
+    )
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
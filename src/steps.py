@@ -0,0 +1,196 @@
+import hashlib
+from collections.abc import Sequence
+
+# Jumlah baris default yang dirender di sekitar sel aktif (0/None = semua).
+# Disimpan di sini (tanpa streamlit) agar app.py bisa mengimpornya saat startup.
+DEFAULT_WINDOW_ROWS = 20
+
+
+class LazyGrid(Sequence):
+    """
+    Grid transposisi yang dihitung dari aritmetika indeks, bukan list-of-lists.
+
+    ``layout="row"``: sel (r, c) adalah ``source[r * num_cols + c]`` (grid enkripsi).
+    ``layout="column"``: sel (r, c) adalah ``source[rank[c] * num_rows + r]``
+    (grid dekripsi, kolom diisi sesuai urutan kunci).
+    Sel di luar panjang ``source`` bernilai ``empty``.
+    """
+
+    __slots__ = (
+        "source",
+        "order",
+        "num_rows",
+        "num_cols",
+        "layout",
+        "empty",
+        "_rank",
+        "_hash",
+        "_digest",
+    )
+
+    def __init__(self, source, order, num_rows: int, layout: str = "row", empty=""):
+        self.source = source
+        self.order = tuple(order)
+        self.num_rows = num_rows
+        self.num_cols = len(self.order)
+        self.layout = layout
+        self.empty = empty
+        self._rank = [0] * self.num_cols
+        for rank, col_idx in enumerate(self.order):
+            self._rank[col_idx] = rank
+        self._hash = None
+        self._digest = None
+
+    def _key(self) -> tuple:
+        return (self.source, self.order, self.num_rows, self.layout, self.empty)
+
+    # Grid dengan isi yang sama dianggap sama, sehingga cache render tetap
+    # berlaku meski objek grid dibuat ulang dari hasil yang sama
+    def __eq__(self, other):
+        if self is other:
+            return True
+        if not isinstance(other, LazyGrid):
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            self._hash = hash(self._key())
+        return self._hash
+
+    def digest(self) -> str:
+        """
+        Digest isi grid. Dipakai sebagai kunci cache render agar cache tidak
+        menyimpan referensi ke pesan/sampel aslinya.
+        """
+        if self._digest is None:
+            source = self.source
+            h = hashlib.blake2b(digest_size=16)
+            if isinstance(source, str):
+                h.update(b"s" + source.encode("utf-8", "surrogatepass"))
+            else:
+                h.update(b"b" + bytes(memoryview(source)))
+            h.update(
+                repr((self.order, self.num_rows, self.layout, self.empty)).encode()
+            )
+            self._digest = h.hexdigest()
+        return self._digest
+
+    def index_of(self, row_idx: int, col_idx: int) -> int:
+        """Posisi sel (r, c) di dalam ``source``."""
+        if self.layout == "row":
+            return row_idx * self.num_cols + col_idx
+        return self._rank[col_idx] * self.num_rows + row_idx
+
+    def cell(self, row_idx: int, col_idx: int):
+        idx = self.index_of(row_idx, col_idx)
+        return self.source[idx] if idx < len(self.source) else self.empty
+
+    def __len__(self) -> int:
+        return self.num_rows
+
+    def __getitem__(self, row_idx):
+        if isinstance(row_idx, slice):
+            return [self[r] for r in range(*row_idx.indices(self.num_rows))]
+        if row_idx < 0:
+            row_idx += self.num_rows
+        if not 0 <= row_idx < self.num_rows:
+            raise IndexError("Indeks baris di luar grid.")
+        return [self.cell(row_idx, c) for c in range(self.num_cols)]
+
+
+class StepSequence(Sequence):
+    """
+    Langkah visualisasi ``(row, col, value)`` yang dihitung saat diindeks.
+
+    ``traversal="row"`` membaca grid baris-per-baris, ``"column"`` membaca
+    kolom sesuai urutan kunci. Memori O(1) terhadap panjang pesan.
+    """
+
+    __slots__ = ("grid", "traversal", "length", "__weakref__")
+
+    def __init__(self, grid: LazyGrid, traversal: str, length: int):
+        self.grid = grid
+        self.traversal = traversal
+        self.length = length
+
+    def __eq__(self, other):
+        if not isinstance(other, StepSequence):
+            return NotImplemented
+        return (self.grid, self.traversal, self.length) == (
+            other.grid,
+            other.traversal,
+            other.length,
+        )
+
+    def __hash__(self) -> int:
+        return hash((self.grid, self.traversal, self.length))
+
+    def cache_key(self) -> tuple:
+        """Kunci cache berisi primitif kecil (digest), bukan isi grid."""
+        return (self.grid.digest(), self.traversal, self.length)
+
+    def position(self, step_idx: int) -> tuple[int, int]:
+        """Koordinat (row, col) untuk langkah ke-``step_idx``."""
+        grid = self.grid
+        if self.traversal == "row":
+            return divmod(step_idx, grid.num_cols)
+        rank, row_idx = divmod(step_idx, grid.num_rows)
+        return row_idx, grid.order[rank]
+
+    @property
+    def fill_order(self):
+        """Urutan kolom yang terisi di setiap baris selama traversal."""
+        if self.traversal == "row":
+            return range(self.grid.num_cols)
+        return self.grid.order
+
+    def filled_in_row(self, row_idx: int, count: int) -> int:
+        """
+        Jumlah sel baris ``row_idx`` yang sudah terisi setelah ``count`` langkah;
+        sel yang terisi adalah ``fill_order[:hasil]``. Dihitung tanpa replay.
+        """
+        grid = self.grid
+        if self.traversal == "row":
+            return max(0, min(grid.num_cols, count - row_idx * grid.num_cols))
+        full, rem = divmod(count, grid.num_rows)
+        return min(grid.num_cols, full + (1 if row_idx < rem else 0))
+
+    def prefix(self, count: int) -> str:
+        """Gabungan nilai ``count`` langkah pertama (buffer hasil sementara)."""
+        grid = self.grid
+        source = grid.source
+        count = max(0, min(count, self.length))
+        if count == 0:
+            return source[:0]
+        if self.traversal == grid.layout and count <= len(source):
+            return source[:count]
+        if self.traversal == "column" and grid.layout == "row":
+            # Kolom ke-k pada grid baris adalah slice berjarak num_cols
+            cells = source[: grid.num_rows * grid.num_cols]
+            full, rem = divmod(count, grid.num_rows)
+            parts = [cells[col_idx :: grid.num_cols] for col_idx in grid.order[:full]]
+            if rem:
+                col_idx = grid.order[full]
+                parts.append(
+                    cells[col_idx : col_idx + rem * grid.num_cols : grid.num_cols]
+                )
+            return "".join(parts)
+        return "".join(str(value) for _, _, value in self[:count])
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __getitem__(self, step_idx):
+        if isinstance(step_idx, slice):
+            return [self[i] for i in range(*step_idx.indices(self.length))]
+        if step_idx < 0:
+            step_idx += self.length
+        if not 0 <= step_idx < self.length:
+            raise IndexError("Indeks langkah di luar jangkauan.")
+        row_idx, col_idx = self.position(step_idx)
+        return (row_idx, col_idx, self.grid.cell(row_idx, col_idx))
+
+    def __iter__(self):
+        for step_idx in range(self.length):
+            yield self[step_idx]
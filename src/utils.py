@@ -1,4 +1,4 @@
-import re
+from src.keys import compile_key
 
 
 def sanitize_input(text: str) -> str:
@@ -12,39 +12,11 @@ def sanitize_input(text: str) -> str:
 
 def validate_key(key: str, mode: str = "text") -> tuple[bool, str]:
     """
-    Memastikan kunci valid sesuai mode.
+    Memastikan kunci valid sesuai mode. Kunci dikompilasi sekali (cache
+    ``src.keys``), sehingga cipher tidak perlu memparsing ulang.
     """
-    if not key:
-        return False, "Kunci tidak boleh kosong."
-
-    if mode == "text":
-        if not key.isalpha() and not key.isalnum():
-            return False, "Kunci text harus berupa alphanumeric."
-
-    elif mode == "numeric":
-        if not re.match(r"^[\d\s,]+$", key):
-            return False, "Kunci numerik hanya boleh berisi angka."
-
-        # 2. Parse angka
-        if re.search(r"[\s,]", key):
-            numbers = [int(n) for n in re.findall(r"\d+", key)]
-        else:
-            numbers = [int(n) for n in re.findall(r"\d", key)]
-
-        if not numbers:
-            return False, "Tidak ditemukan angka pada kunci."
-
-        num_cols = len(numbers)
-        expected_set = set(range(1, num_cols + 1))
-        current_set = set(numbers)
-
-        if current_set != expected_set:
-            return (
-                False,
-                f"Kunci Numerik harus berupa permutasi angka 1 sampai {num_cols}. (Tidak boleh ada angka yang hilang atau duplikat)",
-            )
-
-    return True, ""
+    compiled = compile_key(key, mode)
+    return compiled.valid, compiled.error
 
 
 def format_step_description(step_idx, total_steps, action, detail):
@@ -1,16 +1,48 @@
 import streamlit as st
 import math
 import html
+from functools import lru_cache
 
-def render_grid(grid, key, order, active_cell=None, action_type="read"):
-    """Merender grid TEKS."""
+from src.cache import ResultCache
 
-    html_table = '<table class="crypto-table">'
+# Batas total fragmen HTML baris per sesi (byte) untuk render inkremental;
+# cukup untuk beberapa jendela baris, tetap kecil meski sesinya ratusan
+ROW_CACHE_BYTES = 512 * 1024
 
-    # Header & Order
-    safe_key = [html.escape(k) for k in key]
 
-    html_table += (
+def window_bounds(num_rows: int, focus_row: int = 0, window: int = None):
+    """Rentang baris [start, stop) yang dirender di sekitar ``focus_row``."""
+    if not window or window >= num_rows:
+        return 0, num_rows
+    start = max(0, min(focus_row - window // 2, num_rows - window))
+    return start, start + window
+
+
+def _hidden_rows_html(count: int, first: int, last: int, num_cols: int) -> str:
+    """Baris ringkasan pengganti baris yang tidak dirender."""
+    if count <= 0:
+        return ""
+    return (
+        f'<tr><td class="window-cell" colspan="{max(1, num_cols)}">'
+        f"&#8942; {count} baris disembunyikan (baris {first}&ndash;{last}) &#8942;"
+        "</td></tr>"
+    )
+
+
+def _windowed_rows(num_rows, num_cols, focus_row, window, render_row) -> str:
+    start, stop = window_bounds(num_rows, focus_row, window)
+    return (
+        _hidden_rows_html(start, 1, start, num_cols)
+        + "".join(render_row(r_idx) for r_idx in range(start, stop))
+        + _hidden_rows_html(num_rows - stop, stop + 1, num_rows, num_cols)
+    )
+
+
+@lru_cache(maxsize=256)
+def _header_html(key: tuple, order: tuple) -> str:
+    """Baris header kunci + urutan kolom."""
+    safe_key = [html.escape(k) for k in key]
+    header = (
         "<tr>"
         + "".join([f'<th class="header-cell">{char}</th>' for char in safe_key])
         + "</tr>"
@@ -18,86 +50,176 @@ def render_grid(grid, key, order, active_cell=None, action_type="read"):
     display_order = [""] * len(key)
     for rank, original_idx in enumerate(order):
         display_order[original_idx] = rank + 1
-    html_table += (
+    header += (
         "<tr>"
         + "".join([f'<td class="order-cell">{r}</td>' for r in display_order])
         + "</tr>"
     )
+    return header
 
-    # Data Rows
-    for r_idx, row in enumerate(grid):
-        html_table += "<tr>"
-        for c_idx, char in enumerate(row):
-            safe_char = html.escape(str(char)) if char != "" else "&nbsp;"
 
-            cell_content = safe_char
-            is_active = active_cell and active_cell == (r_idx, c_idx)
-            class_name = "empty-cell"
+def _text_cell(char, is_active, action_type) -> str:
+    safe_char = html.escape(str(char)) if char != "" else "&nbsp;"
+    class_name = "empty-cell"
+    if is_active:
+        class_name = "active-write" if action_type == "write" else "active-read"
+    elif char != "":
+        class_name = "filled-cell"
+    return f'<td class="{class_name}">{safe_char}</td>'
 
-            if is_active:
-                class_name = "active-write" if action_type == "write" else "active-read"
-            elif char != "":
-                class_name = "filled-cell"
 
-            html_table += f'<td class="{class_name}">{cell_content}</td>'
-        html_table += "</tr>"
+def _byte_cell(val, is_active, action_type) -> str:
+    if val is None:
+        hex_str = "&nbsp;"
+    elif isinstance(val, int):
+        hex_str = f"{val:02X}"
+    else:
+        hex_str = "PAD"
+
+    class_name = "empty-cell"
+    if is_active:
+        class_name = "active-write" if action_type == "write" else "active-read"
+    elif val is not None:
+        if isinstance(val, int) and val == 0:
+            class_name = "filled-cell padding-cell"
+        else:
+            class_name = "filled-cell"
+    return f'<td class="{class_name}">{hex_str}</td>'
+
+
+def _step_row_html(steps, row_idx, level, active_col, action_type, kind) -> str:
+    """
+    Fragmen HTML satu baris pada state langkah tertentu. ``level`` adalah
+    jumlah sel terisi (None = baris penuh).
+    """
+    row = steps.grid[row_idx]
+    blank = "" if kind == "text" else None
+    if level is not None:
+        visible = set(steps.fill_order[:level])
+        row = [val if c_idx in visible else blank for c_idx, val in enumerate(row)]
+
+    make_cell = _text_cell if kind == "text" else _byte_cell
+    return (
+        "<tr>"
+        + "".join(
+            make_cell(val, c_idx == active_col, action_type)
+            for c_idx, val in enumerate(row)
+        )
+        + "</tr>"
+    )
+
+
+def _row_cache() -> ResultCache:
+    """
+    Cache LRU fragmen baris milik sesi ini (tidak dibagi antar pengguna),
+    dibatasi total byte ``ROW_CACHE_BYTES``. Kuncinya hanya primitif kecil
+    (digest isi, indeks, state), sehingga objek langkah dan pesannya tetap
+    bisa dibebaskan setelah dirender.
+    """
+    return st.session_state.setdefault(
+        "row_html_cache", ResultCache(max_bytes=ROW_CACHE_BYTES)
+    )
+
+
+def _cached_row_html(cache, steps_key, steps, row_idx, *state) -> str:
+    """Hanya baris yang berubah antar langkah yang benar-benar dirender ulang."""
+    key = (steps_key, row_idx) + state
+    row_html = cache.get(key)
+    if row_html is None:
+        row_html = _step_row_html(steps, row_idx, *state)
+        cache.put(key, row_html, len(row_html))
+    return row_html
+
+
+def render_grid_step(
+    steps, key, order, step_count, action_type="read", kind="text", window=None
+):
+    """
+    Merender grid pada langkah ke-``step_count`` langsung dari aritmetika
+    ``StepSequence`` (tanpa replay langkah). ``kind``: "text" atau "bytes".
+    ``window`` membatasi baris yang dirender di sekitar sel aktif.
+    """
+    active_cell = None
+    if 0 < step_count <= len(steps):
+        active_cell = steps.position(step_count - 1)
+
+    cache, steps_key = _row_cache(), steps.cache_key()
+
+    def render_row(r_idx):
+        level = (
+            steps.filled_in_row(r_idx, step_count) if action_type == "write" else None
+        )
+        active_col = active_cell[1] if active_cell and active_cell[0] == r_idx else None
+        return _cached_row_html(
+            cache, steps_key, steps, r_idx, level, active_col, action_type, kind
+        )
+
+    focus_row = active_cell[0] if active_cell else 0
+    html_table = (
+        '<table class="crypto-table">'
+        + _header_html(tuple(key), tuple(order))
+        + _windowed_rows(len(steps.grid), len(key), focus_row, window, render_row)
+        + "</table>"
+    )
+    st.markdown(html_table, unsafe_allow_html=True)
+
+
+def render_grid(grid, key, order, active_cell=None, action_type="read", window=None):
+    """Merender grid TEKS."""
+
+    html_table = '<table class="crypto-table">'
+
+    # Header & Order
+    html_table += _header_html(tuple(key), tuple(order))
+
+    # Data Rows (hanya jendela di sekitar sel aktif)
+    def render_row(r_idx):
+        cells = "".join(
+            _text_cell(char, active_cell == (r_idx, c_idx), action_type)
+            for c_idx, char in enumerate(grid[r_idx])
+        )
+        return f"<tr>{cells}</tr>"
+
+    focus_row = active_cell[0] if active_cell else 0
+    html_table += _windowed_rows(len(grid), len(key), focus_row, window, render_row)
     html_table += "</table>"
 
     st.markdown(html_table, unsafe_allow_html=True)
 
 
 def render_bytes_dynamic(
-    grid, key, order, active_cell=None, action_type="read", title="Visualisasi Byte"
+    grid,
+    key,
+    order,
+    active_cell=None,
+    action_type="read",
+    title="Visualisasi Byte",
+    window=None,
 ):
     """Merender grid HEXADECIMAL."""
 
     html_table = '<table class="crypto-table">'
 
-    # Header
-    safe_key = [html.escape(k) for k in key]
-    html_table += (
-        "<tr>"
-        + "".join([f'<th class="header-cell">{char}</th>' for char in safe_key])
-        + "</tr>"
-    )
+    # Header & Order
+    html_table += _header_html(tuple(key), tuple(order))
 
-    # Order row
-    display_order = [""] * len(key)
-    for rank, original_idx in enumerate(order):
-        display_order[original_idx] = rank + 1
-    html_table += (
-        "<tr>"
-        + "".join([f'<td class="order-cell">{r}</td>' for r in display_order])
-        + "</tr>"
-    )
+    # Data Rows (hanya jendela di sekitar sel aktif)
+    def render_row(r_idx):
+        cells = "".join(
+            _byte_cell(val, active_cell == (r_idx, c_idx), action_type)
+            for c_idx, val in enumerate(grid[r_idx])
+        )
+        return f"<tr>{cells}</tr>"
 
-    # Data Rows
-    for r_idx, row in enumerate(grid):
-        html_table += "<tr>"
-        for c_idx, val in enumerate(row):
-            if val is None:
-                hex_str = "&nbsp;"
-            elif isinstance(val, int):
-                hex_str = f"{val:02X}"
-            else:
-                hex_str = "PAD"
-
-            is_active = active_cell and active_cell == (r_idx, c_idx)
-            class_name = "empty-cell"
-            if is_active:
-                class_name = "active-write" if action_type == "write" else "active-read"
-            elif val is not None:
-                if isinstance(val, int) and val == 0:
-                    class_name = "filled-cell padding-cell"
-                else:
-                    class_name = "filled-cell"
-            html_table += f'<td class="{class_name}">{hex_str}</td>'
-        html_table += "</tr>"
+    focus_row = active_cell[0] if active_cell else 0
+    html_table += _windowed_rows(len(grid), len(key), focus_row, window, render_row)
     html_table += "</table>"
     st.markdown(html_table, unsafe_allow_html=True)
 
 
-def render_output_hex_grid(byte_data, num_cols, title="Output Result"):
+def render_output_hex_grid(
+    byte_data, num_cols, title="Output Result", window=None, focus_row=0
+):
     st.markdown(f"#### {title}")
 
     if not byte_data:
@@ -106,23 +228,40 @@ def render_output_hex_grid(byte_data, num_cols, title="Output Result"):
 
     num_rows = math.ceil(len(byte_data) / num_cols)
 
-    html_table = '<table class="crypto-table">'
-
-    idx = 0
-    for r in range(num_rows):
-        html_table += "<tr>"
-        for c in range(num_cols):
+    def render_row(r):
+        html_row = "<tr>"
+        for idx in range(r * num_cols, (r + 1) * num_cols):
             if idx < len(byte_data):
                 val = byte_data[idx]
                 hex_str = f"{val:02X}" if isinstance(val, int) else "00"
                 class_name = "result-cell"
-                idx += 1
             else:
                 hex_str = "&nbsp;"
                 class_name = "empty-cell"
 
-            html_table += f'<td class="{class_name}">{hex_str}</td>'
-        html_table += "</tr>"
+            html_row += f'<td class="{class_name}">{hex_str}</td>'
+        return html_row + "</tr>"
+
+    html_table = '<table class="crypto-table">'
+    html_table += _windowed_rows(num_rows, num_cols, focus_row, window, render_row)
+    html_table += "</table>"
+    st.markdown(html_table, unsafe_allow_html=True)
+
+
+def render_hex_page(page_bytes, offset, bytes_per_row=16, title="Hex Viewer"):
+    """Merender satu halaman hex dengan kolom offset di sisi kiri."""
+    st.markdown(f"#### {html.escape(title)}")
 
+    if not page_bytes:
+        st.info("Halaman kosong.")
+        return
+
+    html_table = '<table class="crypto-table">'
+    for row_start in range(0, len(page_bytes), bytes_per_row):
+        row = page_bytes[row_start : row_start + bytes_per_row]
+        html_table += f'<tr><td class="order-cell">{offset + row_start:08X}</td>'
+        html_table += "".join(f'<td class="result-cell">{val:02X}</td>' for val in row)
+        html_table += '<td class="empty-cell">&nbsp;</td>' * (bytes_per_row - len(row))
+        html_table += "</tr>"
     html_table += "</table>"
     st.markdown(html_table, unsafe_allow_html=True)
@@ -0,0 +1,80 @@
+import unittest
+import sys
+import os
+
+# Setup path agar bisa import dari src
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import io
+from unittest import mock
+
+from src import cache
+from src.cache import ResultCache, digest
+from src.cipher import ColumnarTransposition
+from src.file_handler import FileHandler
+
+
+class TestResultCache(unittest.TestCase):
+    """Cache hasil berbasis digest isi dengan batas ukuran byte."""
+
+    def setUp(self):
+        cache.RESULTS.clear()
+
+    def test_1_digest_separates_parts(self):
+        self.assertEqual(digest(b"abc"), digest(memoryview(b"abc")))
+        self.assertEqual(digest("abc"), digest(b"abc"))
+        self.assertNotEqual(digest(b"ab", b"c"), digest(b"a", b"bc"))
+
+    def test_2_evicts_lru_by_size(self):
+        results = ResultCache(max_bytes=100, max_entry_bytes=60)
+        self.assertTrue(results.put("a", b"", 40))
+        self.assertTrue(results.put("b", b"", 40))
+        results.get("a")
+        self.assertTrue(results.put("c", b"", 40))
+        self.assertIn("a", results)
+        self.assertNotIn("b", results)
+        self.assertEqual(results.nbytes, 80)
+        # Entri di atas batas per entri tidak disimpan
+        self.assertFalse(results.put("d", b"", 61))
+        self.assertNotIn("d", results)
+
+    def test_3_text_results_computed_once(self):
+        with mock.patch.object(
+            ColumnarTransposition,
+            "encrypt_text",
+            wraps=ColumnarTransposition.encrypt_text,
+        ) as spy:
+            first = cache.cached_encrypt_text("HELLO WORLD", "TEKNIK")
+            second = cache.cached_encrypt_text("HELLO WORLD", "TEKNIK")
+            other = cache.cached_encrypt_text("HELLO WORLD", "TEKNIK", "Z")
+        self.assertIs(first, second)
+        self.assertEqual(spy.call_count, 2)
+        self.assertEqual(other["padded_text"], "HELLO WORLDZ")
+
+    def test_4_upload_transform_cached(self):
+        data = bytes(range(256)) * 40
+        upload = io.BytesIO(data)
+        with mock.patch.object(
+            ColumnarTransposition,
+            "encrypt_stream",
+            wraps=ColumnarTransposition.encrypt_stream,
+        ) as spy:
+            first, size = FileHandler.transform_upload(
+                upload, "TEKNIK", use_container=False
+            )
+            second, _ = FileHandler.transform_upload(
+                upload, "TEKNIK", use_container=False
+            )
+        self.assertEqual(spy.call_count, 1)
+        self.assertIs(first, second)
+        self.assertEqual(size, len(first))
+        self.assertEqual(first, ColumnarTransposition.encrypt_bytes(data, "TEKNIK"))
+
+        decrypted, _ = FileHandler.transform_upload(
+            io.BytesIO(first), "TEKNIK", action="decrypt"
+        )
+        self.assertEqual(decrypted[: len(data)], data)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,7 +5,60 @@ import os
 # Setup path agar bisa import dari src
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
-from src.cipher import ColumnarTransposition
+import io
+import math
+import mmap
+import random
+import tempfile
+
+from src import cipher, container
+from src.cipher import ColumnarTransposition, np
+
+
+def reference_encrypt_bytes(data: bytes, key: str, key_mode: str = "text") -> bytes:
+    """Implementasi loop awal (per-byte) sebagai acuan kesetaraan engine."""
+    metadata = ColumnarTransposition.get_key_metadata(key, key_mode)
+    order, num_cols = metadata["order"], metadata["num_cols"]
+    if not data or num_cols == 0:
+        return b""
+    len_data = len(data)
+    num_rows = math.ceil(len_data / num_cols)
+    result = bytearray(num_rows * num_cols)
+    dest_idx = 0
+    for col_idx in order:
+        for row_idx in range(num_rows):
+            src_idx = (row_idx * num_cols) + col_idx
+            result[dest_idx] = data[src_idx] if src_idx < len_data else 0
+            dest_idx += 1
+    return bytes(result)
+
+
+def reference_decrypt_bytes(data: bytes, key: str, key_mode: str = "text") -> bytes:
+    metadata = ColumnarTransposition.get_key_metadata(key, key_mode)
+    order, num_cols = metadata["order"], metadata["num_cols"]
+    if not data or num_cols == 0:
+        return b""
+    len_data = len(data)
+    num_rows = math.ceil(len_data / num_cols)
+    result = bytearray(len_data)
+    src_idx = 0
+    for col_idx in order:
+        for row_idx in range(num_rows):
+            if src_idx < len_data:
+                dest_idx = (row_idx * num_cols) + col_idx
+                if dest_idx < len_data:
+                    result[dest_idx] = data[src_idx]
+                src_idx += 1
+    return bytes(result)
+
+
+ENGINE_KEYS = [
+    ("ZEBRA", "text"),
+    ("APPLE", "text"),
+    ("A", "text"),
+    ("4 1 3 2", "numeric"),
+    ("31524", "numeric"),
+]
 
 
 class TestColumnarTransposition(unittest.TestCase):
@@ -126,6 +179,427 @@ class TestColumnarTransposition(unittest.TestCase):
         res_short = ColumnarTransposition.encrypt_text("HI", "XYZ", padding_char="X")
         self.assertEqual(len(res_short["ciphertext"]), 3)
 
+    def test_7_plan_cache_reused(self):
+        """Plan untuk (key, mode, length) yang sama diambil dari cache"""
+        plan_a = ColumnarTransposition.get_plan("ZEBRA", "text", 11)
+        plan_b = ColumnarTransposition.get_plan("ZEBRA", "text", 11)
+        self.assertIs(plan_a, plan_b)
+        self.assertIsNone(ColumnarTransposition.get_plan("1 1 2", "numeric", 11))
+
+        # Tabel gather harus konsisten dengan hasil enkripsi
+        data = bytes(range(1, 12))
+        padded = data + b"\x00" * (plan_a.total_len - len(data))
+        expected = bytes(padded[i] for i in plan_a.gather_table())
+        self.assertEqual(plan_a.encrypt(data), expected)
+        dec_plan = ColumnarTransposition.get_plan("ZEBRA", "text", plan_a.total_len)
+        self.assertEqual(dec_plan.decrypt(plan_a.encrypt(data))[:11], data)
+
+    def test_8_lazy_steps_and_result_only(self):
+        """Langkah visualisasi dihitung lazy dan sesuai grid manual"""
+        enc = ColumnarTransposition.encrypt_text("DEFEND", "KEY", padding_char="")
+        self.assertEqual(
+            list(enc["fill_steps"]),
+            [
+                (0, 0, "D"),
+                (0, 1, "E"),
+                (0, 2, "F"),
+                (1, 0, "E"),
+                (1, 1, "N"),
+                (1, 2, "D"),
+            ],
+        )
+        self.assertEqual(enc["read_steps"][0], (0, 1, "E"))
+        self.assertEqual(enc["read_steps"][-1], (1, 2, "D"))
+        self.assertEqual(
+            [list(row) for row in enc["grid"]], [["D", "E", "F"], ["E", "N", "D"]]
+        )
+
+        dec = ColumnarTransposition.decrypt_text(enc["ciphertext"], "KEY")
+        self.assertEqual(dec["fill_steps"][:2], [(0, 1, "E"), (1, 1, "N")])
+        self.assertEqual(dec["plaintext"], "DEFEND")
+
+        fast = ColumnarTransposition.encrypt_text(
+            "DEFEND", "KEY", padding_char="", with_steps=False
+        )
+        self.assertEqual(fast["ciphertext"], "ENDEFD")
+        self.assertNotIn("fill_steps", fast)
+
+    def test_9_text_slicing_engine(self):
+        """Engine teks berbasis slicing konsisten dengan pembacaan grid"""
+        for text in ["KRIPTOGRAFI SERU", "ÁRVÍZTŰRŐ 漢字 TEXT", "ABCDEFGHIJK"]:
+            for key in ["ZEBRA", "KEY", "A"]:
+                enc = ColumnarTransposition.encrypt_text(text, key, padding_char="")
+                expected = "".join(step[2] for step in enc["read_steps"])
+                self.assertEqual(enc["ciphertext"], expected)
+
+                dec = ColumnarTransposition.decrypt_text(text, key)
+                expected = "".join(step[2] for step in dec["read_steps"])
+                self.assertEqual(dec["raw_plaintext"], expected)
+
+
+class TestByteEngines(unittest.TestCase):
+    """Kesetaraan engine byte terhadap implementasi loop awal."""
+
+    def _check_engine(self, engine):
+        rng = random.Random(42)
+        for length in list(range(1, 30)) + [257, 4096, 4099]:
+            data = bytes(rng.randrange(256) for _ in range(length))
+            for key, key_mode in ENGINE_KEYS:
+                self.assertEqual(
+                    ColumnarTransposition.encrypt_bytes(data, key, key_mode, engine),
+                    reference_encrypt_bytes(data, key, key_mode),
+                )
+                self.assertEqual(
+                    ColumnarTransposition.decrypt_bytes(data, key, key_mode, engine),
+                    reference_decrypt_bytes(data, key, key_mode),
+                )
+
+    def test_1_python_engine_matches_loop(self):
+        self._check_engine("python")
+
+    @unittest.skipIf(np is None, "numpy tidak terpasang")
+    def test_2_numpy_engine_matches_loop(self):
+        self._check_engine("numpy")
+
+    def test_3_unknown_engine_rejected(self):
+        with self.assertRaises(ValueError):
+            ColumnarTransposition.encrypt_bytes(b"data", "KEY", engine="gpu")
+
+    def test_4_into_buffers_match_loop(self):
+        """encrypt_into/decrypt_into menulis langsung ke buffer tujuan"""
+        engines = ["python"] + (["numpy"] if np is not None else [])
+        data = bytes(range(251)) * 3
+        for engine in engines:
+            for key, key_mode in ENGINE_KEYS:
+                plan = ColumnarTransposition.get_plan(key, key_mode, len(data))
+                out = bytearray(b"\xff" * plan.total_len)
+                ColumnarTransposition.encrypt_into(
+                    memoryview(data), out, key, key_mode, engine
+                )
+                self.assertEqual(
+                    bytes(out), reference_encrypt_bytes(data, key, key_mode)
+                )
+
+                out = bytearray(b"\xff" * len(data))
+                ColumnarTransposition.decrypt_into(data, out, key, key_mode, engine)
+                self.assertEqual(
+                    bytes(out), reference_decrypt_bytes(data, key, key_mode)
+                )
+
+    def test_5_parallel_columns_match_loop(self):
+        """Mode paralel (kelompok kolom per thread) identik dengan loop"""
+        engines = ["python"] + (["numpy"] if np is not None else [])
+        data = bytes(range(256)) * 40 + b"tail"
+        for engine in engines:
+            for workers in (2, 3, 8):
+                for key, key_mode in ENGINE_KEYS:
+                    self.assertEqual(
+                        ColumnarTransposition.encrypt_bytes(
+                            data, key, key_mode, engine, workers
+                        ),
+                        reference_encrypt_bytes(data, key, key_mode),
+                    )
+                    self.assertEqual(
+                        ColumnarTransposition.decrypt_bytes(
+                            data, key, key_mode, engine, workers
+                        ),
+                        reference_decrypt_bytes(data, key, key_mode),
+                    )
+
+
+class TestMultiRound(unittest.TestCase):
+    """Transposisi berulang dengan tabel permutasi gabungan."""
+
+    KEY_CHAINS = [("ZEBRA", "KEY"), ("TEKNIK", "A", "KRIPTOGRAFI")]
+
+    def _engines(self):
+        return ["python"] + (["numpy"] if np is not None else [])
+
+    def test_1_matches_chained_calls(self):
+        data = bytes(range(256)) * 3 + b"sisa"
+        for engine in self._engines():
+            for keys in self.KEY_CHAINS:
+                expected = data
+                for key in keys:
+                    expected = ColumnarTransposition.encrypt_bytes(expected, key)
+                self.assertEqual(
+                    ColumnarTransposition.encrypt_bytes_multi(
+                        data, keys, engine=engine
+                    ),
+                    expected,
+                )
+
+                chained = expected
+                for key in reversed(keys):
+                    chained = ColumnarTransposition.decrypt_bytes(chained, key)
+                self.assertEqual(
+                    ColumnarTransposition.decrypt_bytes_multi(
+                        expected, keys, engine=engine
+                    ),
+                    chained,
+                )
+
+    def test_2_exact_round_trip_with_length(self):
+        """Dengan panjang asli, padding antar-round dibuang dengan tepat"""
+        for engine in self._engines():
+            for length in [1, 7, 29, 1000]:
+                data = bytes((i * 7) % 256 for i in range(length))
+                for keys in self.KEY_CHAINS:
+                    enc = ColumnarTransposition.encrypt_bytes_multi(
+                        data, keys, engine=engine
+                    )
+                    dec = ColumnarTransposition.decrypt_bytes_multi(
+                        enc, keys, engine=engine, length=length
+                    )
+                    self.assertEqual(dec, data)
+
+    @unittest.skipIf(np is None, "numpy tidak tersedia")
+    def test_3_fused_table_compact_and_cache_bounded(self):
+        keys = ("TEKNIK", "ZEBRA", "KRIPTOGRAFI", "KEY")
+        data = bytes(range(256)) * 8
+        fused = cipher._compile_chain(keys, "text", len(data), "encrypt")
+        self.assertEqual(fused.table.dtype, np.uint32)
+        expected = cipher._run_rounds(
+            data,
+            cipher._chain_rounds(keys, "text", len(data), "encrypt"),
+            "encrypt",
+            "numpy",
+        )
+        self.assertEqual(fused.apply(data), expected)
+
+        cache = cipher._ChainCache(fused.nbytes * 4)
+        for name in "abcde":
+            cache.put((name,), fused)
+        self.assertEqual(len(cache), 4)
+        self.assertIsNone(cache.get(("a",)))
+        self.assertLessEqual(cache.nbytes, cache.max_bytes)
+        # Tabel di atas seperempat batas tidak di-cache sama sekali
+        small = cipher._ChainCache(fused.nbytes * 2)
+        small.put(("a",), fused)
+        self.assertEqual(len(small), 0)
+
+
+class TestRangeReads(unittest.TestCase):
+    """Halaman output dihitung dari input tanpa memproses seluruh data."""
+
+    def test_1_encrypt_range_matches_slice(self):
+        rng = random.Random(11)
+        data = bytes(rng.randrange(256) for _ in range(1003))
+        for key, key_mode in ENGINE_KEYS:
+            full = ColumnarTransposition.encrypt_bytes(data, key, key_mode)
+            for start, length in [(0, 16), (5, 300), (990, 64), (2000, 10)]:
+                self.assertEqual(
+                    ColumnarTransposition.encrypt_range(
+                        data, key, start, length, key_mode
+                    ),
+                    full[start : start + length],
+                )
+
+    def test_2_plan_decrypt_page_matches_slice(self):
+        data = bytes(range(256)) * 4 + b"xyz"
+        for key, key_mode in ENGINE_KEYS:
+            plan = ColumnarTransposition.get_plan(key, key_mode, len(data))
+            full = ColumnarTransposition.decrypt_bytes(data, key, key_mode)
+            for start in range(0, len(data), 97):
+                self.assertEqual(
+                    plan.read_range(memoryview(data), start, 256, "decrypt"),
+                    full[start : start + 256],
+                )
+
+    def test_3_decrypt_range_from_file_sources(self):
+        """bytes, file-like, path, dan mmap memberi hasil yang sama."""
+        rng = random.Random(5)
+        data = bytes(rng.randrange(256) for _ in range(5000))
+        cipher = ColumnarTransposition.encrypt_bytes(data, "TEKNIK")
+        expected = ColumnarTransposition.decrypt_bytes(cipher, "TEKNIK")
+        with tempfile.NamedTemporaryFile(delete=False) as handle:
+            handle.write(cipher)
+        try:
+            with open(handle.name, "rb") as stream, mmap.mmap(
+                stream.fileno(), 0, access=mmap.ACCESS_READ
+            ) as view:
+                sources = [cipher, io.BytesIO(cipher), handle.name, view]
+                for source in sources:
+                    for start, length in [(0, 10), (1234, 512), (4990, 100)]:
+                        self.assertEqual(
+                            ColumnarTransposition.decrypt_range(
+                                source, "TEKNIK", start, length
+                            ),
+                            expected[start : start + length],
+                        )
+        finally:
+            os.remove(handle.name)
+
+    def test_4_decrypt_range_reads_only_needed_bytes(self):
+        cipher = ColumnarTransposition.encrypt_bytes(bytes(1 << 20), "KUNCI")
+        stream = io.BytesIO(cipher)
+        read_sizes = []
+        original_read = stream.read
+        stream.read = lambda size=-1: read_sizes.append(size) or original_read(size)
+        ColumnarTransposition.decrypt_range(stream, "KUNCI", 300000, 100)
+        self.assertLessEqual(sum(read_sizes), 100 + 5)
+
+
+class TestStreaming(unittest.TestCase):
+    """Mode streaming per stripe harus identik dengan encrypt/decrypt_bytes."""
+
+    def test_1_stream_matches_in_memory(self):
+        rng = random.Random(7)
+        for length in [1, 5, 19, 1000, 4099]:
+            data = bytes(rng.randrange(256) for _ in range(length))
+            for key, key_mode in ENGINE_KEYS:
+                for buffer_size in [1, 7, 64, 1 << 20]:
+                    enc = io.BytesIO()
+                    ColumnarTransposition.encrypt_stream(
+                        io.BytesIO(data), enc, key, key_mode, buffer_size=buffer_size
+                    )
+                    self.assertEqual(
+                        enc.getvalue(),
+                        ColumnarTransposition.encrypt_bytes(data, key, key_mode),
+                    )
+                    dec = io.BytesIO()
+                    ColumnarTransposition.decrypt_stream(
+                        io.BytesIO(data), dec, key, key_mode, buffer_size=buffer_size
+                    )
+                    self.assertEqual(
+                        dec.getvalue(),
+                        ColumnarTransposition.decrypt_bytes(data, key, key_mode),
+                    )
+
+    def test_2_stream_into_mmap(self):
+        data = bytes(range(256)) * 10
+        expected = ColumnarTransposition.encrypt_bytes(data, "TEKNIK")
+        with tempfile.TemporaryFile() as out:
+            out.truncate(len(expected))
+            with mmap.mmap(out.fileno(), len(expected)) as view:
+                written = ColumnarTransposition.encrypt_stream(
+                    io.BytesIO(data), view, "TEKNIK", buffer_size=100
+                )
+                self.assertEqual(written, len(expected))
+                self.assertEqual(view[:], expected)
+
+
+class TestBlockMode(unittest.TestCase):
+    """Mode blok: blok independen, panjang asli kembali persis."""
+
+    def test_1_round_trip_restores_exact_length(self):
+        rng = random.Random(11)
+        for length in [0, 1, 6, 100, 1001]:
+            data = bytes(rng.randrange(256) for _ in range(length))
+            for key, key_mode in ENGINE_KEYS:
+                for block_size in [1, 7, 64, 5000]:
+                    enc = ColumnarTransposition.encrypt_bytes(
+                        data, key, key_mode, block_size=block_size
+                    )
+                    self.assertEqual(
+                        ColumnarTransposition.decrypt_bytes(
+                            enc, key, key_mode, block_mode=True
+                        ),
+                        data,
+                    )
+        with self.assertRaises(ValueError):
+            ColumnarTransposition.decrypt_bytes(b"ABCDEFGH", "KRIPTO", block_mode=True)
+
+    def test_2_blocks_are_independent_and_parallel_safe(self):
+        data = bytes(range(256)) * 9
+        block_size = 500
+        enc = ColumnarTransposition.encrypt_bytes(data, "ZEBRA", block_size=block_size)
+        # Blok penuh = enkripsi biasa atas potongan plaintext-nya
+        self.assertEqual(
+            enc[:block_size], ColumnarTransposition.encrypt_bytes(data[:500], "ZEBRA")
+        )
+        for engine in ["python", "numpy"]:
+            self.assertEqual(
+                ColumnarTransposition.encrypt_bytes(
+                    data, "ZEBRA", engine=engine, workers=4, block_size=block_size
+                ),
+                enc,
+            )
+            self.assertEqual(
+                ColumnarTransposition.decrypt_bytes(
+                    enc, "ZEBRA", engine=engine, workers=4, block_mode=True
+                ),
+                data,
+            )
+
+    def test_3_random_access_block(self):
+        data = bytes(range(256)) * 5 + b"sisa"
+        block_size = 300
+        enc = ColumnarTransposition.encrypt_bytes(data, "KRIPTO", block_size=block_size)
+        stream = io.BytesIO(b"xx" + enc)
+        stream.seek(2)
+        with tempfile.NamedTemporaryFile(delete=False) as tmp:
+            tmp.write(enc)
+        try:
+            for index in range(math.ceil(len(data) / block_size)):
+                expected = data[index * block_size : (index + 1) * block_size]
+                for source in [enc, stream, tmp.name]:
+                    self.assertEqual(
+                        ColumnarTransposition.decrypt_block(source, "KRIPTO", index),
+                        expected,
+                    )
+                self.assertEqual(stream.tell(), 2)
+        finally:
+            os.remove(tmp.name)
+        with self.assertRaises(IndexError):
+            ColumnarTransposition.decrypt_block(enc, "KRIPTO", 5)
+
+    def test_4_block_stream_matches_in_memory(self):
+        data = bytes(range(256)) * 7 + b"ekor"
+        for workers in [1, 3]:
+            enc = io.BytesIO()
+            written = ColumnarTransposition.encrypt_stream(
+                io.BytesIO(data), enc, "TEKNIK", block_size=100, workers=workers
+            )
+            expected = ColumnarTransposition.encrypt_bytes(
+                data, "TEKNIK", block_size=100
+            )
+            self.assertEqual(enc.getvalue(), expected)
+            self.assertEqual(written, len(expected))
+            dec = io.BytesIO()
+            ColumnarTransposition.decrypt_stream(
+                io.BytesIO(expected), dec, "TEKNIK", block_mode=True, workers=workers
+            )
+            self.assertEqual(dec.getvalue(), data)
+
+    def test_5_short_reads_and_engine(self):
+        class ShortReader(io.BytesIO):
+            # Seperti pipe/socket: read mengembalikan paling banyak 7 byte
+            def read(self, size=-1):
+                return super().read(7 if size < 0 else min(size, 7))
+
+        data = bytes(range(256)) * 3 + b"ekor"
+        expected = ColumnarTransposition.encrypt_bytes(data, "TEKNIK", block_size=100)
+        enc = io.BytesIO()
+        ColumnarTransposition.encrypt_stream(
+            ShortReader(data), enc, "TEKNIK", block_size=100, workers=2
+        )
+        self.assertEqual(enc.getvalue(), expected)
+        packed = io.BytesIO()
+        container.write_container(
+            ShortReader(data), packed, "TEKNIK", length=len(data), block_size=100
+        )
+        self.assertEqual(container.unpack(packed.getvalue(), "TEKNIK"), data)
+        plain = io.BytesIO()
+        ColumnarTransposition.encrypt_stream(ShortReader(data), plain, "TEKNIK")
+        self.assertEqual(
+            plain.getvalue(), ColumnarTransposition.encrypt_bytes(data, "TEKNIK")
+        )
+
+        # Engine pemanggil diteruskan ke tiap blok, bukan "auto"
+        with self.assertRaises(ValueError):
+            ColumnarTransposition.encrypt_stream(
+                io.BytesIO(data), io.BytesIO(), "TEKNIK", block_size=100, engine="x"
+            )
+        with self.assertRaises(ValueError):
+            ColumnarTransposition.decrypt_stream(
+                io.BytesIO(expected),
+                io.BytesIO(),
+                "TEKNIK",
+                block_mode=True,
+                engine="x",
+            )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,111 @@
+import unittest
+import sys
+import os
+import tempfile
+from contextlib import redirect_stderr, redirect_stdout
+from io import StringIO
+
+# Setup path agar bisa import dari src
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src import cli
+from src.cipher import ColumnarTransposition
+from src.file_handler import FileHandler
+
+
+class TestBatchCli(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def test_1_encrypt_then_decrypt_batch(self):
+        """Batch enkripsi/dekripsi dengan penamaan enc_/dec_"""
+        payloads = {f"file{i}.bin": os.urandom(100 + i) for i in range(4)}
+        paths = []
+        for name, data in payloads.items():
+            path = os.path.join(self.tmp.name, name)
+            with open(path, "wb") as f:
+                f.write(data)
+            paths.append(path)
+
+        out_dir = os.path.join(self.tmp.name, "out")
+        with redirect_stdout(StringIO()) as out:
+            code = cli.main(
+                ["encrypt", "-k", "TEKNIK", "-w", "2", "-o", out_dir, *paths]
+            )
+        self.assertEqual(code, 0)
+        self.assertIn("MB/s", out.getvalue())
+
+        for name, data in payloads.items():
+            with open(os.path.join(out_dir, f"enc_{name}"), "rb") as f:
+                self.assertEqual(
+                    f.read(), ColumnarTransposition.encrypt_bytes(data, "TEKNIK")
+                )
+
+        enc_paths = [os.path.join(out_dir, f"enc_{name}") for name in payloads]
+        with redirect_stdout(StringIO()):
+            cli.main(["decrypt", "-k", "TEKNIK", "-w", "2", *enc_paths])
+        for name, data in payloads.items():
+            with open(os.path.join(out_dir, f"dec_enc_{name}"), "rb") as f:
+                self.assertEqual(f.read()[: len(data)], data)
+
+    def test_2_invalid_numeric_key(self):
+        """Kunci numerik yang bukan permutasi ditolak sebelum memproses"""
+        path = os.path.join(self.tmp.name, "a.bin")
+        with open(path, "wb") as f:
+            f.write(b"abc")
+        with redirect_stdout(StringIO()):
+            code = cli.main(["encrypt", "-k", "1 1 2", "-m", "numeric", path])
+        self.assertEqual(code, 2)
+
+    def test_3_decrypt_file_handler_container(self):
+        """File container dari aplikasi/FileHandler didekripsi ke panjang asli"""
+        data = os.urandom(5_003)
+        plain = os.path.join(self.tmp.name, "data.bin")
+        with open(plain, "wb") as f:
+            f.write(data)
+        enc = os.path.join(self.tmp.name, "enc_data.bin")
+        FileHandler.transform_file(plain, enc, "TEKNIK")
+
+        with redirect_stdout(StringIO()):
+            code = cli.main(["decrypt", "-k", "TEKNIK", "-w", "1", enc])
+        self.assertEqual(code, 0)
+        with open(os.path.join(self.tmp.name, "dec_enc_data.bin"), "rb") as f:
+            self.assertEqual(f.read(), data)
+
+        with redirect_stdout(StringIO()), redirect_stderr(StringIO()):
+            code = cli.main(["decrypt", "-k", "KRIPTO", "-w", "1", enc])
+        self.assertEqual(code, 1)
+
+    def test_4_output_dir_keeps_subfolders(self):
+        """Folder input dengan nama file sama tidak saling menimpa di -o"""
+        root = os.path.join(self.tmp.name, "input")
+        payloads = {"a": b"isi file a" * 10, "b": b"isi file b" * 12}
+        for sub, data in payloads.items():
+            os.makedirs(os.path.join(root, sub))
+            with open(os.path.join(root, sub, "x.bin"), "wb") as f:
+                f.write(data)
+
+        out_dir = os.path.join(self.tmp.name, "out")
+        with redirect_stdout(StringIO()):
+            code = cli.main(["encrypt", "-k", "TEKNIK", "-w", "1", "-o", out_dir, root])
+        self.assertEqual(code, 0)
+        for sub, data in payloads.items():
+            with open(os.path.join(out_dir, sub, "enc_x.bin"), "rb") as f:
+                self.assertEqual(
+                    f.read(), ColumnarTransposition.encrypt_bytes(data, "TEKNIK")
+                )
+
+        # File yang diberikan langsung dan bentrok ditolak sebelum diproses
+        paths = [os.path.join(root, sub, "x.bin") for sub in payloads]
+        clash_dir = os.path.join(self.tmp.name, "clash")
+        with redirect_stdout(StringIO()), redirect_stderr(StringIO()) as err:
+            code = cli.main(["encrypt", "-k", "TEKNIK", "-o", clash_dir, *paths])
+        self.assertEqual(code, 2)
+        self.assertIn("bentrok", err.getvalue())
+        self.assertFalse(os.path.exists(clash_dir))
+
+
+if __name__ == "__main__":
+    unittest.main()
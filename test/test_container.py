@@ -0,0 +1,103 @@
+import unittest
+import sys
+import os
+
+# Setup path agar bisa import dari src
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import io
+import random
+
+from src import container
+from src.cipher import ColumnarTransposition
+
+
+class TestContainer(unittest.TestCase):
+    """Container: panjang asli di header, index per blok dengan checksum."""
+
+    def setUp(self):
+        rng = random.Random(25)
+        self.data = bytes(rng.randrange(256) for _ in range(4_321))
+
+    def test_1_round_trip_exact_length(self):
+        for length in [0, 1, 999, 1000, 4_321]:
+            data = self.data[:length]
+            for workers in [1, 3]:
+                packed = container.pack(
+                    data, "KRIPTO", block_size=1000, workers=workers
+                )
+                self.assertEqual(
+                    len(packed),
+                    container.container_size(length, "KRIPTO", block_size=1000),
+                )
+                self.assertEqual(
+                    container.unpack(packed, "KRIPTO", workers=workers), data
+                )
+
+    def test_2_header_and_index(self):
+        packed = container.pack(self.data, "4 1 3 2", "numeric", block_size=1000)
+        header = container.parse_header(packed)
+        self.assertEqual(header.length, len(self.data))
+        self.assertEqual(header.block_size, 1000)
+        self.assertEqual(header.num_blocks, 5)
+        self.assertEqual(
+            header.fingerprint, container.key_fingerprint("4 1 3 2", "numeric")
+        )
+        # Setiap entri index menunjuk blok mode blok yang sama
+        for index, entry in enumerate(header.entries):
+            block = self.data[index * 1000 : (index + 1) * 1000]
+            self.assertEqual(
+                packed[entry.offset : entry.offset + entry.size],
+                ColumnarTransposition.encrypt_bytes(block, "4 1 3 2", "numeric"),
+            )
+        self.assertEqual(
+            container.read_prefix(io.BytesIO(packed)), packed[: header.data_offset]
+        )
+
+    def test_3_stream_writer_and_random_access(self):
+        out = io.BytesIO()
+        size = container.write_container(
+            io.BytesIO(self.data), out, "ZEBRA", block_size=700, workers=2
+        )
+        packed = out.getvalue()
+        self.assertEqual(size, len(packed))
+        self.assertEqual(packed, container.pack(self.data, "ZEBRA", block_size=700))
+
+        stream = io.BytesIO(packed)
+        reader = container.ContainerReader(stream, "ZEBRA")
+        self.assertEqual(reader.read_block(3), self.data[2100:2800])
+        self.assertEqual(reader.read_range(650, 900), self.data[650:1550])
+        self.assertEqual(b"".join(reader.iter_blocks()), self.data)
+        plain = io.BytesIO()
+        reader.decrypt_to(plain, workers=3)
+        self.assertEqual(plain.getvalue(), self.data)
+        prefix = packed[: reader.header.data_offset]
+        self.assertEqual(
+            container.encrypted_range(self.data, prefix, "ZEBRA", "text", 30, 2000),
+            packed[30:2030],
+        )
+
+    def test_4_detects_wrong_key_and_corruption(self):
+        packed = container.pack(self.data, "KRIPTO", block_size=1000)
+        with self.assertRaises(ValueError):
+            container.ContainerReader(packed, "ZEBRA")
+        with self.assertRaises(ValueError):
+            container.parse_header(b"bukan container")
+
+        damaged = bytearray(packed)
+        damaged[-1] ^= 0xFF
+        reader = container.ContainerReader(bytes(damaged), "KRIPTO")
+        self.assertTrue(reader.verify_block(0))
+        self.assertFalse(reader.verify_block(4))
+        self.assertEqual(reader.read_block(0), self.data[:1000])
+        with self.assertRaises(ValueError):
+            reader.read_all()
+
+        damaged = bytearray(packed)
+        damaged[container.HEADER.size] ^= 0xFF
+        with self.assertRaises(ValueError):
+            container.parse_header(bytes(damaged))
+
+
+if __name__ == "__main__":
+    unittest.main()
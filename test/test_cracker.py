@@ -0,0 +1,205 @@
+import unittest
+import sys
+import os
+
+# Setup path agar bisa import dari src
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import random
+from unittest import mock
+
+from src import cracker
+from src.cipher import ColumnarTransposition
+
+PLAINTEXT = "KAMI AKAN BERANGKAT KE SURABAYA BESOK PAGI DENGAN KERETA API"
+
+LONG_PLAINTEXT = (
+    "SETIAP PAGI PETANI DI DESA ITU BERANGKAT KE SAWAH SEBELUM MATAHARI TERBIT. "
+    "MEREKA MEMBAWA CANGKUL DAN BEKAL NASI YANG DIBUNGKUS DAUN PISANG. ANAK ANAK "
+    "MEREKA BERJALAN KE SEKOLAH MELEWATI JEMBATAN KAYU DI ATAS SUNGAI YANG JERNIH. "
+    "SIANG HARI UDARA MENJADI PANAS SEHINGGA PARA PETANI BERISTIRAHAT DI BAWAH "
+    "POHON BESAR SAMBIL MINUM AIR KELAPA."
+)
+
+
+class TestBruteForce(unittest.TestCase):
+    """Pemulihan kunci pendek lewat brute force + skor quadgram."""
+
+    def test_1_scorer_prefers_language(self):
+        scorer = cracker.load_scorer("id")
+        shuffled = "".join(sorted(PLAINTEXT))
+        self.assertGreater(scorer.score(PLAINTEXT), scorer.score(shuffled))
+        self.assertGreater(scorer.score(PLAINTEXT), cracker.DEFAULT_STOP_SCORE)
+        with self.assertRaises(ValueError):
+            cracker.load_scorer("xx")
+
+    def test_2_recovers_key_in_process(self):
+        ciphertext = ColumnarTransposition.encrypt_text(PLAINTEXT, "TEKNIK")[
+            "ciphertext"
+        ]
+        report = cracker.brute_force(
+            ciphertext, max_width=7, workers=1, stop_score=None
+        )
+        self.assertFalse(report.stopped_early)
+        self.assertEqual(
+            report.keys_tested, sum(cracker.math.factorial(w) for w in range(2, 8))
+        )
+        expected = ColumnarTransposition.get_key_metadata("TEKNIK")["order"]
+        self.assertEqual(list(report.best.order), expected)
+        dec = ColumnarTransposition.decrypt_text(ciphertext, report.best.key, "numeric")
+        self.assertEqual(dec["plaintext"], report.best.plaintext)
+        self.assertEqual(report.best.plaintext, PLAINTEXT)
+        self.assertGreater(report.keys_per_second, 0)
+
+    def test_3_process_pool_stops_early(self):
+        ciphertext = ColumnarTransposition.encrypt_text(
+            PLAINTEXT, "3 1 4 2", key_mode="numeric"
+        )["ciphertext"]
+        seen = []
+        report = cracker.brute_force(
+            ciphertext,
+            max_width=9,
+            workers=2,
+            progress=lambda tested, total, best: seen.append(tested),
+        )
+        self.assertTrue(report.stopped_early)
+        self.assertEqual(report.best.key, "3 1 4 2")
+        self.assertLess(
+            report.keys_tested, sum(cracker.math.factorial(w) for w in range(2, 10))
+        )
+        self.assertEqual(seen[-1], report.keys_tested)
+
+        with self.assertRaises(ValueError):
+            cracker.brute_force(ciphertext, max_width=cracker.MAX_BRUTE_FORCE_WIDTH + 1)
+
+    def test_4_progress_without_candidates_and_spawn_pool(self):
+        """Tugas tanpa kandidat tidak membuat callback progres gagal"""
+        ciphertext = ColumnarTransposition.encrypt_text(
+            PLAINTEXT, "3 1 4 2", key_mode="numeric"
+        )["ciphertext"]
+        original = cracker._Searcher.permutations
+        calls = []
+
+        def permutations(searcher, task):
+            calls.append(task)
+            if len(calls) == 1:
+                return 0, [], False
+            return original(searcher, task)
+
+        seen = []
+        with mock.patch.object(cracker._Searcher, "permutations", permutations):
+            report = cracker.brute_force(
+                ciphertext,
+                max_width=4,
+                workers=1,
+                progress=lambda tested, total, best: seen.append(best),
+            )
+        self.assertIsNone(seen[0])
+        self.assertEqual(report.best.key, "3 1 4 2")
+
+        with mock.patch.object(
+            cracker.multiprocessing,
+            "get_context",
+            wraps=cracker.multiprocessing.get_context,
+        ) as get_context:
+            cracker.brute_force(ciphertext, max_width=4, workers=2)
+        get_context.assert_called_with("spawn")
+
+
+class TestAnnealing(unittest.TestCase):
+    """Simulated annealing dengan skor jendela quadgram inkremental."""
+
+    def test_1_incremental_windows_match_full_score(self):
+        rng = random.Random(5)
+        # 84 habis dibagi semua lebar uji (grid penuh, tanpa sel kosong)
+        ciphertext = "".join(rng.choice("ABEKLMN RST") for _ in range(84))
+        scorer = cracker.load_scorer("id")
+        searcher = cracker._Searcher(
+            cracker.encode_text(ciphertext), scorer, 1, None, None
+        )
+        for num_cols in (3, 7, 12):
+            windows = cracker._Windows(searcher, num_cols)
+            layout = list(range(num_cols))
+            rng.shuffle(layout)
+            scores = windows.score(layout, range(num_cols))
+            for _ in range(50):
+                layout, changed = cracker._move(layout, rng)
+                affected = windows.affected(changed)
+                scores[affected] = windows.score(layout, affected)
+            order = cracker._invert(layout)
+            key = " ".join(str(c + 1) for c in order)
+            plaintext = ColumnarTransposition.decrypt_text(ciphertext, key, "numeric")[
+                "raw_plaintext"
+            ]
+            self.assertEqual(windows.num_quadgrams, len(plaintext) - 3)
+            self.assertAlmostEqual(
+                scores.sum() / windows.num_quadgrams, scorer.score(plaintext), 4
+            )
+            full = windows.score(layout, range(num_cols))
+            self.assertTrue(cracker._numpy().allclose(scores, full))
+
+    def test_2_recovers_long_key(self):
+        key = "7 3 12 1 9 5 14 2 11 4 8 13 6 10"
+        ciphertext = ColumnarTransposition.encrypt_text(
+            LONG_PLAINTEXT, key, key_mode="numeric"
+        )["ciphertext"]
+        seen = []
+        report = cracker.anneal(
+            ciphertext,
+            14,
+            restarts=2,
+            workers=1,
+            seed=1,
+            progress=lambda tested, total, best: seen.append(best.score),
+        )
+        self.assertEqual(report.best.key, key)
+        self.assertTrue(report.best.plaintext.startswith("SETIAP PAGI PETANI"))
+        self.assertEqual(report.keys_tested, 2 * cracker.ANNEAL_ITERATIONS)
+        self.assertEqual(len(seen), 2)
+
+        # Restart berikutnya dilewati setelah ambang tercapai
+        report = cracker.anneal(
+            ciphertext, 14, restarts=4, workers=1, seed=1, stop_score=-4.2
+        )
+        self.assertTrue(report.stopped_early)
+        self.assertLess(report.keys_tested, cracker.ANNEAL_ITERATIONS)
+        with self.assertRaises(ValueError):
+            cracker.anneal(ciphertext, 14, initial_order=[0, 1])
+
+
+class TestWidthDetection(unittest.TestCase):
+    """Peringkat lebar kunci dari statistik baris grid."""
+
+    def test_1_true_width_ranked_first(self):
+        rng = random.Random(2)
+        text = LONG_PLAINTEXT * 3
+        for num_cols in (5, 9, 14):
+            perm = list(range(1, num_cols + 1))
+            rng.shuffle(perm)
+            ciphertext = ColumnarTransposition.encrypt_text(
+                text, " ".join(map(str, perm)), key_mode="numeric"
+            )["ciphertext"]
+            ranking = cracker.rank_widths(ciphertext, max_width=40)
+            self.assertEqual(ranking[0].num_cols, num_cols)
+            self.assertTrue(ranking[0].full_grid)
+            # Kelipatan lebar (baris lebih sedikit) berada di bawahnya
+            scores = {w.num_cols: w.score for w in ranking}
+            self.assertLess(scores[num_cols], scores[num_cols * 2])
+
+        full = cracker.rank_widths(ciphertext, max_width=40, full_grid_only=True)
+        self.assertTrue(all(len(ciphertext) % w.num_cols == 0 for w in full))
+        self.assertEqual(cracker.rank_widths("ABC"), [])
+
+    def test_2_partial_grid_matches_decrypt_geometry(self):
+        # Segmen terakhir lebih pendek (sel kosong di akhir, seperti decrypt_text)
+        ciphertext = ColumnarTransposition.encrypt_text(LONG_PLAINTEXT, "KRIPTO")[
+            "ciphertext"
+        ][:-4]
+        ranking = cracker.rank_widths(ciphertext, max_width=30)
+        self.assertEqual(ranking[0].num_cols, 6)
+        self.assertFalse(ranking[0].full_grid)
+        self.assertEqual(ranking[0].num_rows, -(-len(ciphertext) // 6))
+
+
+if __name__ == "__main__":
+    unittest.main()
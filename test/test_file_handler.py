@@ -0,0 +1,106 @@
+import unittest
+import sys
+import os
+import tempfile
+
+# Setup path agar bisa import dari src
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import io
+from unittest import mock
+
+from src import container
+from src.cipher import ColumnarTransposition
+from src.file_handler import FileHandler
+
+
+class TestFileHandler(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def _path(self, name):
+        return os.path.join(self.tmp.name, name)
+
+    def _write(self, name, data):
+        path = self._path(name)
+        with open(path, "wb") as f:
+            f.write(data)
+        return path
+
+    def _read(self, path):
+        with open(path, "rb") as f:
+            return f.read()
+
+    def test_1_mmap_round_trip(self):
+        """Enkripsi lalu dekripsi file via mmap sama dengan versi in-memory"""
+        data = os.urandom(10_007)
+        src = self._write("plain.bin", data)
+        for engine in ("python", "auto"):
+            enc = self._path(f"enc_{engine}.bin")
+            dec = self._path(f"dec_{engine}.bin")
+
+            size = FileHandler.transform_file(
+                src, enc, "TEKNIK", engine=engine, use_container=False
+            )
+            expected = ColumnarTransposition.encrypt_bytes(data, "TEKNIK")
+            self.assertEqual(size, len(expected))
+            self.assertEqual(self._read(enc), expected)
+
+            FileHandler.transform_file(enc, dec, "TEKNIK", action="decrypt")
+            self.assertEqual(self._read(dec)[: len(data)], data)
+
+    def test_2_empty_file(self):
+        """File kosong menghasilkan file kosong"""
+        src = self._write("empty.bin", b"")
+        dst = self._path("enc_empty.bin")
+        self.assertEqual(FileHandler.transform_file(src, dst, "KEY"), 0)
+        self.assertEqual(self._read(dst), b"")
+
+    def test_3_container_round_trip(self):
+        """Enkripsi default menulis container; dekripsi mengembalikan panjang asli"""
+        data = os.urandom(10_007)
+        src = self._write("plain.bin", data)
+        enc, dec = self._path("enc.bin"), self._path("dec.bin")
+        with mock.patch.object(FileHandler, "BLOCK_SIZE", 1000):
+            size = FileHandler.transform_file(src, enc, "TEKNIK")
+        self.assertEqual(size, os.path.getsize(enc))
+        self.assertEqual(
+            self._read(enc), container.pack(data, "TEKNIK", block_size=1000)
+        )
+
+        self.assertEqual(
+            FileHandler.transform_file(enc, dec, "TEKNIK", action="decrypt"), len(data)
+        )
+        self.assertEqual(self._read(dec), data)
+        with self.assertRaises(ValueError):
+            FileHandler.transform_file(enc, dec, "KRIPTO", action="decrypt")
+
+    def test_4_upload_container_round_trip(self):
+        """transform_upload menulis dan membaca container yang sama"""
+        data = os.urandom(5_001)
+        output, size = FileHandler.transform_upload(io.BytesIO(data), "ZEBRA")
+        self.assertTrue(container.is_container(output))
+        self.assertEqual(size, len(output))
+        plain, plain_size = FileHandler.transform_upload(
+            io.BytesIO(output), "ZEBRA", action="decrypt"
+        )
+        self.assertEqual((plain, plain_size), (data, len(data)))
+
+    def test_5_unknown_action_rejected(self):
+        """Aksi selain encrypt/decrypt ditolak sebelum file tujuan disentuh"""
+        src = self._write("plain.bin", b"DATA RAHASIA")
+        dst = self._path("out.bin")
+        for use_container in (True, False):
+            with self.assertRaises(ValueError):
+                FileHandler.transform_file(
+                    src, dst, "KEY", action="Encrypt", use_container=use_container
+                )
+        self.assertFalse(os.path.exists(dst))
+        with self.assertRaises(ValueError):
+            FileHandler.transform_upload(io.BytesIO(b"DATA"), "KEY", action="dekripsi")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+import unittest
+import sys
+import os
+
+# Setup path agar bisa import dari src
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import subprocess
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+# Dependensi berat yang tidak boleh ikut ter-import oleh inti cipher
+HEAVY_MODULES = ("streamlit", "pandas", "plotly", "numpy")
+
+
+def imported_modules(statement: str) -> set[str]:
+    """Daftar modul yang di-import oleh ``statement`` (dari ``-X importtime``)."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    modules = set()
+    for line in proc.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            modules.add(line.rsplit("|", 1)[1].strip())
+    return modules
+
+
+class TestImportTime(unittest.TestCase):
+    """Modul inti harus bisa di-import tanpa dependensi UI/numpy."""
+
+    def assert_no_heavy_imports(self, statement: str):
+        modules = imported_modules(statement)
+        self.assertIn(statement.split()[-1], modules)
+        for name in HEAVY_MODULES:
+            leaked = sorted(m for m in modules if m.split(".")[0] == name)
+            self.assertEqual(leaked, [], f"{statement} meng-import {name}")
+
+    def test_1_cipher_core_is_light(self):
+        self.assert_no_heavy_imports("import src.cipher")
+
+    def test_2_cli_and_server_are_light(self):
+        self.assert_no_heavy_imports("import src.cli")
+        self.assert_no_heavy_imports("import src.server")
+
+    def test_3_numpy_loaded_on_first_use(self):
+        try:
+            import numpy  # noqa: F401
+        except ImportError:
+            self.skipTest("numpy tidak terpasang")
+        modules = imported_modules(
+            "from src.cipher import ColumnarTransposition as C; "
+            "C.encrypt_bytes(b'abc', 'KEY', engine='auto')"
+        )
+        self.assertIn("numpy", modules)
+
+
+if __name__ == "__main__":
+    unittest.main()
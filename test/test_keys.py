@@ -0,0 +1,119 @@
+import unittest
+import sys
+import os
+
+# Setup path agar bisa import dari src
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import random
+from array import array
+from unittest import mock
+
+from src import keys
+from src.cipher import ColumnarTransposition
+from src.keys import CompiledKey, compile_key
+from src.utils import validate_key
+
+
+class TestCompiledKey(unittest.TestCase):
+    """Kunci divalidasi dan diparsing sekali, dipakai bersama UI dan cipher."""
+
+    def test_1_compiled_fields(self):
+        compiled = compile_key("4 1 3 2", "numeric")
+        self.assertEqual(compiled.order, (3, 0, 2, 1))
+        self.assertEqual(compiled.display_key, ("1", "2", "3", "4"))
+        self.assertEqual(compiled.num_cols, 4)
+        self.assertTrue(compiled.valid)
+        self.assertEqual(compile_key("4132", "numeric").order, compiled.order)
+        # Hashable dan bisa dipakai langsung sebagai kunci cipher
+        self.assertEqual(len({compiled, compile_key("4 1 3 2", "numeric")}), 1)
+        self.assertEqual(
+            ColumnarTransposition.encrypt_bytes(b"ABCDEFGH", compiled, "numeric"),
+            ColumnarTransposition.encrypt_bytes(b"ABCDEFGH", "4 1 3 2", "numeric"),
+        )
+
+    def test_2_validation_messages(self):
+        self.assertEqual(validate_key("", "text"), (False, "Kunci tidak boleh kosong."))
+        self.assertFalse(validate_key("TE KNIK", "text")[0])
+        self.assertFalse(validate_key("4a1", "numeric")[0])
+        valid, msg = validate_key("1 1 2", "numeric")
+        self.assertFalse(valid)
+        self.assertIn("permutasi angka 1 sampai 3", msg)
+        self.assertEqual(validate_key("TEKNIK", "text"), (True, ""))
+
+    def test_3_key_parsed_once_per_request(self):
+        keys._compile.cache_clear()
+        key = "KRIPTO"
+        validate_key(key, "text")
+        ColumnarTransposition.encrypt_text("HALO DUNIA", key)
+        ColumnarTransposition.decrypt_text("HALO DUNIA", key)
+        ColumnarTransposition.get_key_metadata(key, "text")
+        info = keys._compile.cache_info()
+        self.assertEqual(info.misses, 1)
+
+    def test_4_invalid_numeric_key_has_no_order(self):
+        compiled = compile_key("1 3", "numeric")
+        self.assertIsInstance(compiled, CompiledKey)
+        self.assertEqual(compiled.order, ())
+        self.assertIsNone(ColumnarTransposition.get_plan("1 3", "numeric", 10))
+
+    def test_5_wide_keys_from_arrays(self):
+        """Kunci lebar sebagai array setara dengan kunci string yang sama."""
+        rng = random.Random(4)
+        num_cols = keys.WIDE_KEY_COLUMNS * 2
+        perm = list(range(1, num_cols + 1))
+        rng.shuffle(perm)
+        data = bytes(rng.randrange(256) for _ in range(num_cols * 3 + 5))
+        expected = ColumnarTransposition.encrypt_bytes(
+            data, " ".join(map(str, perm)), "numeric"
+        )
+        for key in [perm, array("I", perm)]:
+            compiled = compile_key(key, "numeric")
+            self.assertIsInstance(compiled.order, array)
+            self.assertEqual(len(compiled.display_key), num_cols)
+            self.assertEqual(compiled.display_key[-1], str(num_cols))
+            self.assertEqual(
+                ColumnarTransposition.encrypt_bytes(data, key, "numeric"), expected
+            )
+        self.assertFalse(compile_key(perm[:-1] + [1], "numeric").valid)
+
+        # Mode teks: urutan = argsort stabil dari nilai (duplikat tetap urut)
+        values = bytes(rng.randrange(4) for _ in range(num_cols))
+        order = compile_key(values, "text").order
+        self.assertEqual(list(order), sorted(range(num_cols), key=values.__getitem__))
+        self.assertEqual(compile_key(values, "text"), compile_key(values, "text"))
+
+    def test_6_array_keys_cached_by_content(self):
+        """Kunci array yang sama tidak divalidasi/di-argsort ulang"""
+        num_cols = keys.WIDE_KEY_COLUMNS + 10
+        perm = list(range(1, num_cols + 1))
+        random.Random(6).shuffle(perm)
+        first = compile_key(array("I", perm), "numeric")
+        with mock.patch.object(keys, "_numeric_order") as numeric_order:
+            again = compile_key(array("I", perm), "numeric")
+        numeric_order.assert_not_called()
+        self.assertIs(again, first)
+
+        # Kunci string lebar diparsing ke urutan yang sama
+        parsed = compile_key(" ".join(map(str, perm)), "numeric")
+        self.assertEqual(list(parsed.order), list(first.order))
+        self.assertEqual(
+            list(compile_key(",".join(map(str, perm)), "numeric").order),
+            list(first.order),
+        )
+
+    def test_7_wide_numeric_key_with_huge_number_is_invalid(self):
+        """Angka di luar int64 pada kunci lebar ditolak, bukan OverflowError"""
+        huge = " 99999999999999999999999"
+        for num_cols in (1200, keys.WIDE_KEY_COLUMNS + 10):
+            key = " ".join(map(str, range(1, num_cols))) + huge
+            valid, _ = validate_key(key, "numeric")
+            self.assertFalse(valid)
+            self.assertEqual(compile_key(key, "numeric").order, ())
+            self.assertIsNone(
+                ColumnarTransposition.encrypt_text("abc", key, "X", "numeric")
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+import unittest
+import sys
+import os
+
+# Setup path agar bisa import dari src
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from array import array
+
+from src.cipher import ColumnarTransposition
+from src.results import ByteStepsResult, TextEncryptResult
+
+
+class TestCompactResults(unittest.TestCase):
+    """Objek hasil ringkas tetap bisa dipakai seperti dict oleh view."""
+
+    def test_1_dict_style_access(self):
+        res = ColumnarTransposition.encrypt_text("HELLO WORLD", "TEKNIK")
+        self.assertIsInstance(res, TextEncryptResult)
+        self.assertEqual(res["ciphertext"], "EOODLR XLLHW")
+        self.assertEqual(res["padded_text"], "HELLO WORLDX")
+        self.assertEqual(res.get("display_key"), list("TEKNIK"))
+        self.assertEqual(res["order"], [1, 4, 2, 5, 3, 0])
+        self.assertIsNone(res.get("tidak_ada"))
+        with self.assertRaises(KeyError):
+            res["tidak_ada"]
+
+        dec = ColumnarTransposition.decrypt_text(res["ciphertext"], "TEKNIK")
+        self.assertEqual(dec["plaintext"], "HELLO WORLDX")
+        self.assertEqual(len(dec["read_steps"]), 12)
+
+    def test_2_only_compact_inputs_stored(self):
+        res = ColumnarTransposition.encrypt_text("KRIPTOGRAFI" * 50, "ZEBRA")
+        self.assertFalse(hasattr(res, "__dict__"))
+        self.assertIsInstance(res._order, array)
+        # Grid dan langkah dibuat saat diakses, tetapi setara antar akses
+        self.assertEqual(res["fill_steps"], res["fill_steps"])
+        self.assertEqual(hash(res["grid"]), hash(res["grid"]))
+
+    def test_3_byte_steps_padding(self):
+        viz = ColumnarTransposition.get_byte_steps(b"\x01\x02\x03\x04", "KEY")
+        self.assertIsInstance(viz, ByteStepsResult)
+        self.assertEqual(len(viz["fill_steps"]), 6)
+        self.assertEqual(viz["read_steps"][-1], (1, 2, None))
+        self.assertIsNone(
+            ColumnarTransposition.get_byte_steps(b"ab", "1 1", "encrypt", "numeric")
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,142 @@
+import unittest
+import sys
+import os
+
+# Setup path agar bisa import dari src
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import asyncio
+import json
+import threading
+from unittest import mock
+
+from src import container, server
+from src.cipher import ColumnarTransposition
+from src.server import CipherServer
+
+
+async def request(port, path, body=b"", chunked=False, method="POST"):
+    """Klien HTTP minimal; mengembalikan (status, body)."""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    if chunked:
+        head = f"{method} {path} HTTP/1.1\r\nTransfer-Encoding: chunked\r\n\r\n"
+        payload = b"".join(
+            b"%x\r\n%s\r\n" % (len(body[i : i + 1000]), body[i : i + 1000])
+            for i in range(0, len(body), 1000)
+        )
+        payload += b"0\r\n\r\n"
+    else:
+        head = f"{method} {path} HTTP/1.1\r\nContent-Length: {len(body)}\r\n\r\n"
+        payload = body
+    writer.write(head.encode("latin-1") + payload)
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    head, _, content = response.partition(b"\r\n\r\n")
+    return int(head.split()[1]), content
+
+
+class TestCipherServer(unittest.IsolatedAsyncioTestCase):
+    """Endpoint HTTP harus identik dengan ColumnarTransposition."""
+
+    async def asyncSetUp(self):
+        self.server = CipherServer("127.0.0.1", 0, workers=2, max_pending=2)
+        await self.server.start()
+
+    async def asyncTearDown(self):
+        await self.server.close()
+
+    async def test_1_text_round_trip(self):
+        body = json.dumps({"text": "HELLO WORLD", "key": "TEKNIK"}).encode()
+        status, content = await request(self.server.port, "/encrypt/text", body)
+        self.assertEqual(status, 200)
+        ciphertext = json.loads(content)["result"]
+        expected = ColumnarTransposition.encrypt_text("HELLO WORLD", "TEKNIK")
+        self.assertEqual(ciphertext, expected["ciphertext"])
+
+        body = json.dumps({"text": ciphertext, "key": "TEKNIK"}).encode()
+        status, content = await request(self.server.port, "/decrypt/text", body)
+        self.assertEqual(json.loads(content)["raw_plaintext"], "HELLO WORLDX")
+
+    async def test_2_bytes_streaming(self):
+        data = bytes(range(256)) * 300
+        path = "/encrypt/bytes?key=4%201%203%202&key_mode=numeric"
+        for chunked in [False, True]:
+            status, content = await request(self.server.port, path, data, chunked)
+            self.assertEqual(status, 200)
+            self.assertEqual(
+                content,
+                ColumnarTransposition.encrypt_bytes(data, "4 1 3 2", "numeric"),
+            )
+        status, content = await request(
+            self.server.port, "/decrypt/bytes?key=TEKNIK", data, chunked=True
+        )
+        self.assertEqual(content, ColumnarTransposition.decrypt_bytes(data, "TEKNIK"))
+
+    async def test_3_invalid_requests(self):
+        port = self.server.port
+        status, _ = await request(port, "/encrypt/bytes?key=A%21", b"x")
+        self.assertEqual(status, 400)
+        status, _ = await request(port, "/encrypt/text", b"bukan json")
+        self.assertEqual(status, 400)
+        status, _ = await request(port, "/rotate/text", b"{}")
+        self.assertEqual(status, 404)
+        status, _ = await request(port, "/encrypt/text", method="GET")
+        self.assertEqual(status, 405)
+
+    async def test_4_backpressure_when_queue_full(self):
+        """Saat antrean penuh request baru ditolak 503, loop tetap responsif."""
+        release = threading.Event()
+        original = server.transform_text
+
+        def blocked(action, payload):
+            release.wait(5)
+            return original(action, payload)
+
+        body = json.dumps({"text": "HALO", "key": "AB"}).encode()
+        with mock.patch.object(server, "transform_text", blocked):
+            busy = [
+                asyncio.create_task(request(self.server.port, "/encrypt/text", body))
+                for _ in range(2)
+            ]
+            while self.server.pending < 2:
+                await asyncio.sleep(0.01)
+
+            status, content = await request(self.server.port, "/encrypt/text", body)
+            self.assertEqual(status, 503)
+            status, content = await request(self.server.port, "/health", method="GET")
+            self.assertEqual(json.loads(content)["pending"], 2)
+
+            release.set()
+            results = await asyncio.gather(*busy)
+        self.assertEqual([status for status, _ in results], [200, 200])
+        self.assertEqual(self.server.pending, 0)
+
+    async def test_5_decrypt_container(self):
+        """Body container didekripsi ke panjang asli; kunci salah ditolak 400"""
+        data = bytes(range(256)) * 50 + b"ekor"
+        packed = container.pack(data, "TEKNIK", block_size=1000)
+        status, content = await request(
+            self.server.port, "/decrypt/bytes?key=TEKNIK", packed
+        )
+        self.assertEqual(status, 200)
+        self.assertEqual(content, data)
+        status, _ = await request(self.server.port, "/decrypt/bytes?key=KRIPTO", packed)
+        self.assertEqual(status, 400)
+
+    async def test_6_spool_io_off_event_loop(self):
+        """Spool yang sudah di disk dibaca/ditulis lewat thread, bukan di loop"""
+        data = bytes(range(256)) * 40
+        with mock.patch.object(server, "SPOOL_SIZE", 1024), mock.patch.object(
+            server.asyncio, "to_thread", wraps=asyncio.to_thread
+        ) as to_thread:
+            status, content = await request(
+                self.server.port, "/encrypt/bytes?key=TEKNIK", data, chunked=True
+            )
+        self.assertEqual(status, 200)
+        self.assertEqual(content, ColumnarTransposition.encrypt_bytes(data, "TEKNIK"))
+        self.assertGreater(to_thread.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+import unittest
+import sys
+import os
+
+# Setup path agar bisa import dari src
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import gc
+import weakref
+from unittest import mock
+
+from src import visuals
+from src.cipher import ColumnarTransposition
+
+
+class TestStepArithmetic(unittest.TestCase):
+    """State grid parsial harus sama dengan hasil replay langkah."""
+
+    def _results(self):
+        for text in ["", "DEFEND", "KRIPTOGRAFI SERU"]:
+            for key in ["KEY", "ZEBRA", "LEVEL"]:
+                yield ColumnarTransposition.encrypt_text(text, key, "X")
+                yield ColumnarTransposition.encrypt_text(text, key, "")
+                yield ColumnarTransposition.decrypt_text(text, key)
+
+    def test_1_filled_in_row_matches_replay(self):
+        for res in self._results():
+            for steps in (res["fill_steps"], res["read_steps"]):
+                fill_order = list(steps.fill_order)
+                for count in range(len(steps) + 1):
+                    replay = {}
+                    for r, c, _ in steps[:count]:
+                        replay.setdefault(r, set()).add(c)
+                    for row in range(len(steps.grid)):
+                        level = steps.filled_in_row(row, count)
+                        self.assertEqual(
+                            set(fill_order[:level]), replay.get(row, set())
+                        )
+
+    def test_2_prefix_matches_replay(self):
+        for res in self._results():
+            for steps in (res["fill_steps"], res["read_steps"]):
+                for count in range(len(steps) + 1):
+                    expected = "".join(s[2] for s in steps[:count])
+                    self.assertEqual(steps.prefix(count), expected)
+
+    def test_3_rendered_steps_are_collectable(self):
+        """Cache baris hanya menyimpan digest, bukan objek langkah/pesannya."""
+        res = ColumnarTransposition.encrypt_text("PESAN RAHASIA", "KRIPTO", "X")
+        steps = res["fill_steps"]
+        ref = weakref.ref(steps)
+        with mock.patch.object(visuals.st, "markdown") as markdown:
+            visuals.render_grid_step(steps, res.display_key, res.order, 5, "write")
+            first = markdown.call_args[0][0]
+            # Objek baru dengan isi sama memakai fragmen dari cache
+            visuals.render_grid_step(
+                res["fill_steps"], res.display_key, res.order, 5, "write"
+            )
+            self.assertEqual(markdown.call_args[0][0], first)
+        del res, steps
+        gc.collect()
+        self.assertIsNone(ref())
+
+    def test_4_row_cache_bounded_by_bytes(self):
+        """Cache baris per sesi tidak melebihi batas byte-nya"""
+        text = "KRIPTOGRAFI TRANSPOSISI KOLOM " * 40
+        res = ColumnarTransposition.encrypt_text(text, "ABCDEFGHIJKLMNOPQRSTUVWXY", "X")
+        steps = res["fill_steps"]
+        visuals.st.session_state.pop("row_html_cache", None)
+        with mock.patch.object(visuals, "ROW_CACHE_BYTES", 8 * 1024), mock.patch.object(
+            visuals.st, "markdown"
+        ):
+            for count in range(0, len(steps), 7):
+                visuals.render_grid_step(
+                    steps, res.display_key, res.order, count, "write", window=10
+                )
+            cache = visuals._row_cache()
+        self.assertGreater(len(cache), 0)
+        self.assertLessEqual(cache.nbytes, 8 * 1024)
+        visuals.st.session_state.pop("row_html_cache", None)
+
+
+if __name__ == "__main__":
+    unittest.main()
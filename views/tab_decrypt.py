@@ -1,6 +1,7 @@
 import streamlit as st
-from src.cipher import ColumnarTransposition
-from src.visuals import render_grid
+from src.cache import cached_decrypt_text
+from src import cracker
+from src.visuals import render_grid_step
 from src import components
 
 
@@ -9,6 +10,114 @@ def reset_visuals():
     st.session_state.anim_phase = "write"
 
 
+def render_crack_panel(cipher_in: str):
+    """
+    Mode "crack it": mencari kunci yang tidak diketahui. Brute force untuk
+    kunci pendek, simulated annealing untuk kunci panjang (lebar diperkirakan
+    lebih dulu dengan ``rank_widths``).
+    """
+    with st.expander("🔓 Pecahkan Kunci"):
+        method = st.radio(
+            "Metode",
+            ["Brute Force (kunci pendek)", "Simulated Annealing (kunci panjang)"],
+            horizontal=True,
+            key="crack_method",
+        )
+        brute = method.startswith("Brute")
+        c1, c2 = st.columns(2)
+        if brute:
+            width = c1.number_input(
+                "Lebar kunci maksimal",
+                min_value=2,
+                max_value=cracker.MAX_BRUTE_FORCE_WIDTH,
+                value=8,
+            )
+        else:
+            padded = st.checkbox(
+                "Ciphertext memakai padding (panjang = kolom x baris)", True
+            )
+            # Perkiraan lebar kunci dari statistik baris grid
+            ranking = (
+                cracker.rank_widths(
+                    cipher_in,
+                    max_width=len(cipher_in) // 2,
+                    full_grid_only=padded,
+                )[:5]
+                if len(cipher_in) >= 8
+                else []
+            )
+            width = c1.number_input(
+                "Jumlah kolom",
+                min_value=2,
+                max_value=max(2, len(cipher_in)),
+                value=ranking[0].num_cols if ranking else 2,
+            )
+            if ranking:
+                c1.caption(
+                    "Perkiraan lebar kunci: "
+                    + ", ".join(str(w.num_cols) for w in ranking)
+                )
+        language = c2.selectbox(
+            "Bahasa plaintext",
+            cracker.LANGUAGES,
+            format_func={"id": "Indonesia", "en": "Inggris"}.get,
+        )
+        if brute:
+            early_stop = st.checkbox(
+                "Berhenti saat kandidat meyakinkan ditemukan", True
+            )
+        else:
+            restarts = st.slider("Jumlah restart", 1, 32, 8)
+
+        if st.button("Cari Kunci", use_container_width=True):
+            if len(cipher_in) < 4 or width > len(cipher_in):
+                st.error("Ciphertext terlalu pendek untuk dianalisis.")
+                return
+            bar = st.progress(0.0, text="Mencari kunci...")
+            best_box = st.empty()
+
+            def progress(tested, total, best):
+                unit = "kunci" if brute else "langkah"
+                bar.progress(tested / total, text=f"{tested:,} / {total:,} {unit}")
+                if best is None:
+                    return
+                best_box.code(
+                    f"Terbaik sejauh ini: {best.key} (skor {best.score:.2f})\n"
+                    f"{best.plaintext[:200]}",
+                    language=None,
+                )
+
+            if brute:
+                report = cracker.brute_force(
+                    cipher_in,
+                    max_width=int(width),
+                    language=language,
+                    stop_score=cracker.DEFAULT_STOP_SCORE if early_stop else None,
+                    progress=progress,
+                )
+            else:
+                report = cracker.anneal(
+                    cipher_in,
+                    int(width),
+                    restarts=restarts,
+                    language=language,
+                    progress=progress,
+                )
+            best_box.empty()
+            st.session_state.crack_report = report
+
+        report = st.session_state.crack_report
+        if report and report.best:
+            st.caption(
+                f"{report.keys_tested:,} kunci diuji dalam {report.elapsed:.2f} detik "
+                f"({report.keys_per_second:,.0f} kunci/detik)"
+                + (" — berhenti dini" if report.stopped_early else "")
+            )
+            for cand in report.candidates:
+                st.markdown(f"**Kunci `{cand.key}`** (skor {cand.score:.2f})")
+                st.code(cand.plaintext, language=None)
+
+
 def render(key_input: str, key_mode: str):
     col_input, col_output = st.columns([1, 1], gap="large")
 
@@ -22,10 +131,8 @@ def render(key_input: str, key_mode: str):
                 st.error("Key diperlukan!")
             else:
                 try:
-                    st.session_state.decrypt_result = (
-                        ColumnarTransposition.decrypt_text(
-                            cipher_in, key_input, key_mode
-                        )
+                    st.session_state.decrypt_result = cached_decrypt_text(
+                        cipher_in, key_input, key_mode
                     )
 
                     if st.session_state.decrypt_result is None:
@@ -39,6 +146,8 @@ def render(key_input: str, key_mode: str):
                 except Exception as e:
                     st.error(f"Gagal: {e}")
 
+        render_crack_panel(cipher_in)
+
     # --- KOLOM KANAN: OUTPUT ---
     with col_output:
         st.subheader("Hasil Plaintext")
@@ -95,36 +204,25 @@ def render(key_input: str, key_mode: str):
         current_idx = st.session_state.step_index
         st.progress(current_idx / len(steps) if len(steps) > 0 else 0)
 
-        active_cell = None
         desc_text = "Siap memulai..."
         if 0 < current_idx <= len(steps):
             s = steps[current_idx - 1]
-            active_cell = (s[0], s[1])
             desc_text = desc_fmt.format(char=s[2], row=s[0] + 1, col=s[1] + 1)
 
         components.render_step_info(current_idx, len(steps), action_label, desc_text)
 
         display_key = res.get("display_key", list(key_input))
 
-        partial_grid = (
-            [["" for _ in range(len(display_key))] for _ in range(len(res["grid"]))]
-            if st.session_state.anim_phase == "write"
-            else res["grid"]
-        )
-
-        if st.session_state.anim_phase == "write":
-            for i in range(current_idx):
-                r, c, ch = steps[i]
-                partial_grid[r][c] = ch
-
-        render_grid(
-            partial_grid,
-            display_key,  
+        # State grid diturunkan langsung dari indeks langkah (tanpa replay)
+        render_grid_step(
+            steps,
+            display_key,
             res["order"],
-            active_cell,
+            current_idx,
             st.session_state.anim_phase,
+            window=st.session_state.viz_window,
         )
 
         # Tampilkan buffer hasil sementara
-        accumulated = "".join([s[2] for s in steps[:current_idx]])
+        accumulated = steps.prefix(current_idx)
         st.text_area("Buffer Hasil:", value=accumulated, height=70, disabled=True)
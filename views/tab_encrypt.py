@@ -1,6 +1,6 @@
 import streamlit as st
-from src.cipher import ColumnarTransposition
-from src.visuals import render_grid
+from src.cache import cached_encrypt_text
+from src.visuals import render_grid_step
 from src import utils
 from src import components
 
@@ -27,7 +27,7 @@ def render(key_input: str, padding_char: str, key_mode: str):
             if not valid:
                 st.error(msg)
             else:
-                st.session_state.cipher_result = ColumnarTransposition.encrypt_text(
+                st.session_state.cipher_result = cached_encrypt_text(
                     plaintext, key_input, padding_char, key_mode
                 )
                 reset_visuals()
@@ -90,36 +90,25 @@ def render(key_input: str, padding_char: str, key_mode: str):
         current_idx = st.session_state.step_index
         st.progress(current_idx / len(steps) if len(steps) > 0 else 0)
 
-        active_cell = None
         desc_text = "Siap memulai..."
         if 0 < current_idx <= len(steps):
             s = steps[current_idx - 1]
-            active_cell = (s[0], s[1])
             desc_text = desc_fmt.format(char=s[2], row=s[0] + 1, col=s[1] + 1)
 
         components.render_step_info(current_idx, len(steps), action_label, desc_text)
 
         display_key = res.get("display_key", list(key_input))
 
-        partial_grid = (
-            [["" for _ in range(len(display_key))] for _ in range(len(res["grid"]))]
-            if st.session_state.anim_phase == "write"
-            else res["grid"]
-        )
-
-        if st.session_state.anim_phase == "write":
-            for i in range(current_idx):
-                r, c, ch = steps[i]
-                partial_grid[r][c] = ch
-
-        render_grid(
-            partial_grid,
-            display_key,  
+        # State grid diturunkan langsung dari indeks langkah (tanpa replay)
+        render_grid_step(
+            steps,
+            display_key,
             res["order"],
-            active_cell,
+            current_idx,
             st.session_state.anim_phase,
+            window=st.session_state.viz_window,
         )
 
         # Tampilkan buffer hasil sementara
-        accumulated = "".join([s[2] for s in steps[:current_idx]])
+        accumulated = steps.prefix(current_idx)
         st.text_area("Buffer Hasil:", value=accumulated, height=70, disabled=True)
@@ -1,9 +1,14 @@
 import streamlit as st
+from src.cache import cached_byte_steps
+from src import container
 from src.cipher import ColumnarTransposition
 from src.file_handler import FileHandler
-from src.visuals import render_bytes_dynamic, render_output_hex_grid
+from src.visuals import render_grid_step, render_output_hex_grid, render_hex_page
 from src import components
 
+# Pilihan ukuran halaman hex viewer (byte)
+PAGE_SIZES = [256, 512, 1024, 4096]
+
 
 def reset_file_visuals():
     """Helper internal untuk reset state file"""
@@ -11,6 +16,65 @@ def reset_file_visuals():
     st.session_state.file_anim_phase = "write"
 
 
+def viz_output_title(meta) -> str:
+    """Judul grid hasil; untuk container disertai offset blok data di file hasil."""
+    if meta and meta.get("container_header") is not None:
+        offset = len(meta["container_header"])
+        return f"Hasil Blok Data (50 Byte, offset 0x{offset:X} di container)"
+    return "Hasil Header (50 Byte)"
+
+
+def render_page_viewer(uploaded_file):
+    """Hex viewer berhalaman untuk file hasil proses, dihitung per halaman."""
+    meta = st.session_state.file_page_meta
+    if not meta or uploaded_file is None or uploaded_file.name != meta["name"]:
+        return
+
+    st.divider()
+    st.header("Hex Viewer File Hasil")
+
+    col_size, col_page = st.columns([1, 1])
+    with col_size:
+        page_size = st.selectbox("Byte per halaman", PAGE_SIZES, key="file_page_size")
+    num_pages = max(1, -(-meta["output_size"] // page_size))
+    with col_page:
+        page = st.number_input(
+            f"Halaman (1 - {num_pages})",
+            min_value=1,
+            max_value=num_pages,
+            value=1,
+            key="file_page_number",
+        )
+
+    offset = (page - 1) * page_size
+    plan = ColumnarTransposition.get_plan(meta["key"], meta["key_mode"], meta["size"])
+    if plan is None:
+        return
+    # Halaman dihitung dari file input lewat aritmetika permutasi; untuk
+    # container hanya blok yang tercakup halaman yang diproses
+    with FileHandler.buffer_view(uploaded_file) as source:
+        if meta["container_header"] is not None:
+            page_bytes = container.encrypted_range(
+                source,
+                meta["container_header"],
+                meta["key"],
+                meta["key_mode"],
+                offset,
+                page_size,
+            )
+        elif meta["container_input"]:
+            reader = container.ContainerReader(source, meta["key"], meta["key_mode"])
+            page_bytes = reader.read_range(offset, page_size)
+        else:
+            page_bytes = plan.read_range(source, offset, page_size, meta["direction"])
+
+    render_hex_page(
+        page_bytes,
+        offset,
+        title=f"{meta['prefix']}{meta['name']} - offset 0x{offset:08X}",
+    )
+
+
 def render(key_input: str, key_mode: str):
     st.subheader("Enkripsi/Dekripsi File")
     components.render_step_info(
@@ -33,44 +97,54 @@ def render(key_input: str, key_mode: str):
         if not key_input:
             st.error("Key wajib diisi!")
         else:
-            # Membaca file menggunakan handler
-            file_bytes = FileHandler.read_file(uploaded_file)
-            sample_bytes = file_bytes[:50]
+            # Membaca file secara streaming (memori dibatasi ukuran buffer);
+            # hasil untuk isi file + kunci yang sama diambil dari cache
+            file_size = FileHandler.get_size(uploaded_file)
+            direction = "encrypt" if action == "Enkripsi" else "decrypt"
+            prefix = "enc_" if action == "Enkripsi" else "dec_"
 
             try:
-                if action == "Enkripsi":
-                    result_bytes = ColumnarTransposition.encrypt_bytes(
-                        file_bytes, key_input, key_mode
+                output, result_size = FileHandler.transform_upload(
+                    uploaded_file, key_input, key_mode, direction
+                )
+                # Enkripsi menghasilkan container; header + index disimpan
+                # untuk hex viewer, dekripsi mengenali container dari input
+                container_header = None
+                if direction == "encrypt" and result_size:
+                    container_header = container.read_prefix(output)
+                container_input = direction == "decrypt" and container.is_container(
+                    uploaded_file
+                )
+                # Sampel visualisasi diambil dari data blok, bukan header container
+                sample_offset = (
+                    len(container.read_prefix(uploaded_file)) if container_input else 0
+                )
+                sample_bytes = FileHandler.read_sample(uploaded_file, 50, sample_offset)
+                st.session_state.file_viz_data = cached_byte_steps(
+                    sample_bytes, key_input, direction, key_mode
+                )
+                with col_viz:
+                    if action == "Enkripsi":
+                        st.success(f"Terenkripsi! ({result_size} bytes)")
+                    else:
+                        st.success(f"Terdekripsi! ({result_size} bytes)")
+                    st.download_button(
+                        f"Download {prefix}{uploaded_file.name}",
+                        output,
+                        file_name=f"{prefix}{uploaded_file.name}",
                     )
-                    st.session_state.file_viz_data = (
-                        ColumnarTransposition.get_byte_steps(
-                            sample_bytes, key_input, "encrypt", key_mode
-                        )
-                    )
-                    with col_viz:
-                        st.success(f"Terenkripsi! ({len(result_bytes)} bytes)")
-                        st.download_button(
-                            f"Download enc_{uploaded_file.name}",
-                            result_bytes,
-                            file_name=f"enc_{uploaded_file.name}",
-                        )
-                else:
-                    result_bytes = ColumnarTransposition.decrypt_bytes(
-                        file_bytes, key_input, key_mode
-                    )
-                    st.session_state.file_viz_data = (
-                        ColumnarTransposition.get_byte_steps(
-                            sample_bytes, key_input, "decrypt", key_mode
-                        )
-                    )
-                    with col_viz:
-                        st.success(f"Terdekripsi! ({len(result_bytes)} bytes)")
-                        st.download_button(
-                            f"Download dec_{uploaded_file.name}",
-                            result_bytes,
-                            file_name=f"dec_{uploaded_file.name}",
-                        )
 
+                st.session_state.file_page_meta = {
+                    "name": uploaded_file.name,
+                    "direction": direction,
+                    "prefix": prefix,
+                    "key": key_input,
+                    "key_mode": key_mode,
+                    "size": file_size,
+                    "output_size": result_size,
+                    "container_header": container_header,
+                    "container_input": container_input,
+                }
                 reset_file_visuals()
 
             except Exception as e:
@@ -112,11 +186,9 @@ def render(key_input: str, key_mode: str):
         st.progress(curr_idx / len(steps) if len(steps) > 0 else 0)
 
         # Step Description Info
-        active_cell = None
         desc_text = "Siap..."
         if 0 < curr_idx <= len(steps):
             s = steps[curr_idx - 1]
-            active_cell = (s[0], s[1])
             hex_val = f"{s[2]:02X}" if isinstance(s[2], int) else "PAD"
             desc_text = desc_fmt.format(val=hex_val, row=s[0] + 1, col=s[1] + 1)
 
@@ -124,28 +196,24 @@ def render(key_input: str, key_mode: str):
 
         display_key = viz.get("display_key", key_input)
 
-        partial_grid = (
-            [[None for _ in range(len(display_key))] for _ in range(len(viz["grid"]))]
-            if st.session_state.file_anim_phase == "write"
-            else viz["grid"]
-        )
-
-        if st.session_state.file_anim_phase == "write":
-            for i in range(curr_idx):
-                r, c, val = steps[i]
-                partial_grid[r][c] = val
-
-        render_bytes_dynamic(
-            partial_grid,
-            display_key, 
+        render_grid_step(
+            steps,
+            display_key,
             viz["order"],
-            active_cell,
+            curr_idx,
             st.session_state.file_anim_phase,
+            kind="bytes",
+            window=st.session_state.viz_window,
         )
 
         # Final Output Grid
         st.divider()
         final_output_bytes = [s[2] for s in viz["read_steps"] if isinstance(s[2], int)]
         render_output_hex_grid(
-            final_output_bytes, len(display_key), title="Hasil Header (50 Byte)"
+            final_output_bytes,
+            len(display_key),
+            title=viz_output_title(st.session_state.file_page_meta),
+            window=st.session_state.viz_window,
         )
+
+    render_page_viewer(uploaded_file)